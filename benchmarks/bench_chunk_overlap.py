@@ -0,0 +1,120 @@
+# benchmarks/bench_chunk_overlap.py
+"""
+TextChunker throughput with and without overlap on a large text.
+
+    uv run python benchmarks/bench_chunk_overlap.py --megabytes 50 --overlap 50
+
+For each strategy, MB/s is reported for offsets only (iter_spans) and for
+finished chunks (iter_chunks: texts and IDs), plus the chunk count and how
+many characters the chunks hold relative to the source. Sentence and
+paragraph overlap is a sliding window over the split offsets; the
+"naive" row is the string-based alternative for comparison, which copies
+every sentence out of the source and re-joins the overlapping ones for
+each chunk. No database is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, Iterable, List
+
+from ingestion_service.core.chunkers.text import TextChunker
+
+WORDS = (
+    "the of and to in is for that with on as by this be are from at or an "
+    "embedding vector retrieval document ingestion pipeline chunk token model "
+    "database index query latency throughput context window budget request"
+).split()
+
+
+def make_text(megabytes: float, seed: int = 42) -> str:
+    rng = random.Random(seed)
+    pool = [
+        " ".join(
+            " ".join(rng.choices(WORDS, k=rng.randint(5, 25))).capitalize()
+            + rng.choice(".!?")
+            for _ in range(rng.randint(1, 6))
+        )
+        for _ in range(2000)
+    ]
+    target, parts, size = int(megabytes * 1024 * 1024), [], 0
+    while size < target:
+        paragraph = rng.choice(pool)
+        parts.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(parts)
+
+
+def naive_sentence_chunks(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """Split into sentence strings, then re-join the overlapping tail per chunk."""
+    sentences = re.split(r"(?<=[.!?])\s+", text)
+    chunks: List[str] = []
+    current: List[str] = []
+    for sentence in sentences:
+        # Same fit rule as TextChunker: the new separator is not counted
+        if current and len(" ".join(current)) + len(sentence) > chunk_size:
+            chunks.append(" ".join(current))
+            while current and (
+                len(" ".join(current)) > overlap
+                or len(" ".join(current)) + len(sentence) > chunk_size
+            ):
+                current.pop(0)
+        current.append(sentence)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def timed(produce: Callable[[], Iterable]) -> tuple[float, list]:
+    started = time.perf_counter()
+    items = list(produce())
+    return time.perf_counter() - started, items
+
+
+def report(label: str, megabytes: float, seconds: float, count: int, chars: int):
+    print(
+        f"{label:<28} {megabytes / seconds:8.1f} MB/s  chunks={count:>8}  "
+        f"chars x{chars / (megabytes * 1024 * 1024):.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=50)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--overlap", type=int, default=50)
+    args = parser.parse_args()
+
+    text = make_text(args.megabytes)
+    megabytes = len(text) / (1024 * 1024)
+    print(f"text={megabytes:.1f}MB chunk_size={args.chunk_size} overlap={args.overlap}")
+
+    for strategy in ("simple", "sentence", "paragraph"):
+        for overlap in sorted({0, args.overlap}):
+            chunker = TextChunker(args.chunk_size, overlap, chunk_strategy=strategy)
+            label = f"{strategy} overlap={overlap}"
+
+            seconds, spans = timed(lambda: chunker.iter_spans(text))
+            chars = sum(span.end - span.start for span in spans)
+            report(f"{label} spans", megabytes, seconds, len(spans), chars)
+            del spans
+
+            seconds, chunks = timed(lambda: chunker.iter_chunks(text))
+            chars = sum(len(chunk.content) for chunk in chunks)
+            report(f"{label} chunks", megabytes, seconds, len(chunks), chars)
+            del chunks
+
+    seconds, naive = timed(
+        lambda: naive_sentence_chunks(text, args.chunk_size, args.overlap)
+    )
+    label = f"naive sentence overlap={args.overlap}"
+    report(label, megabytes, seconds, len(naive), sum(map(len, naive)))
+    chunker = TextChunker(args.chunk_size, args.overlap, chunk_strategy="sentence")
+    assert naive == [span.text for span in chunker.iter_spans(text)]
+
+
+if __name__ == "__main__":
+    main()
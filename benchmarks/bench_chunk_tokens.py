@@ -0,0 +1,150 @@
+# benchmarks/bench_chunk_tokens.py
+"""
+Chunks and embed calls per document: the character strategies picked by
+ChunkerFactory.choose_strategy (200 / 500 / 1000 characters by document
+length) against token-budget chunking (CHUNK_TOKEN_BUDGET).
+
+    uv run python benchmarks/bench_chunk_tokens.py --budgets 256,512,2048
+
+Documents are synthetic prose of mixed lengths; some contain a long run
+without sentence punctuation (a table or list dump), which the character
+strategies keep as one oversized chunk. For each strategy the script
+reports chunks and embed requests (--batch-size texts per request, as
+OLLAMA_BATCH_SIZE) per document, the average share of --max-tokens a
+chunk uses, and how many chunks exceed --max-tokens (truncated by the
+embedder). Tokens are counted with HeuristicTokenizer, or with a Hugging
+Face tokenizer via --hf-tokenizer (needs the `tokenizers` package).
+No database or embedder is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import time
+
+from ingestion_service.core.chunkers.selector import ChunkerFactory
+from ingestion_service.core.chunkers.text import TextChunker
+from ingestion_service.core.chunkers.tokens import (
+    BaseTokenizer,
+    EncodeTokenizer,
+    HeuristicTokenizer,
+)
+
+WORDS = (
+    "the of and to in is for that with on as by this be are from at or an "
+    "embedding vector retrieval document ingestion pipeline chunk token model "
+    "database index query latency throughput context window budget request "
+    "representation similarity extraction paragraph sentence character"
+).split()
+
+
+def make_document(rng: random.Random, target_chars: int, dump_ratio: float) -> str:
+    paragraphs, size = [], 0
+    while size < target_chars:
+        if rng.random() < dump_ratio:
+            # No sentence punctuation: one "sentence" for every strategy
+            paragraph = " | ".join(
+                " ".join(rng.choices(WORDS, k=4)) for _ in range(rng.randint(60, 400))
+            )
+        else:
+            paragraph = " ".join(
+                " ".join(rng.choices(WORDS, k=rng.randint(6, 30))).capitalize() + "."
+                for _ in range(rng.randint(1, 8))
+            )
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "\n\n".join(paragraphs)
+
+
+def load_tokenizer(name: str | None) -> BaseTokenizer:
+    if not name:
+        return HeuristicTokenizer()
+    try:
+        from tokenizers import Tokenizer  # type: ignore[reportMissingImports]
+    except ImportError:
+        raise SystemExit("--hf-tokenizer needs `pip install tokenizers`")
+    tokenizer = Tokenizer.from_pretrained(name)
+    return EncodeTokenizer(
+        lambda text: tokenizer.encode(text, add_special_tokens=False).ids
+    )
+
+
+def run(label, documents, chunk, tokenizer, args) -> None:
+    chunks_per_doc, calls_per_doc, fill, truncated = [], [], [], 0
+    started = time.perf_counter()
+    chunked = [chunk(document) for document in documents]
+    elapsed = time.perf_counter() - started
+
+    for chunks in chunked:
+        chunks_per_doc.append(len(chunks))
+        calls_per_doc.append(math.ceil(len(chunks) / args.batch_size))
+        for text in chunks:
+            tokens = tokenizer.count(text)
+            fill.append(min(tokens, args.max_tokens) / args.max_tokens)
+            truncated += tokens > args.max_tokens
+
+    print(
+        f"{label:<12} chunks/doc={statistics.mean(chunks_per_doc):7.1f} "
+        f"embed calls/doc={statistics.mean(calls_per_doc):5.2f} "
+        f"fill={statistics.mean(fill) * 100:5.1f}% "
+        f"truncated={truncated:>4} / {sum(chunks_per_doc):<6} "
+        f"chunking={elapsed * 1000:7.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--min-chars", type=int, default=500)
+    parser.add_argument("--max-chars", type=int, default=200_000)
+    parser.add_argument("--dump-ratio", type=float, default=0.03)
+    parser.add_argument("--budgets", default="256,512,2048")
+    parser.add_argument("--max-tokens", type=int, default=2048)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--hf-tokenizer", help="e.g. nomic-ai/nomic-embed-text-v1.5")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Log-uniform lengths: mostly short documents, a tail of long ones
+    documents = [
+        make_document(
+            rng,
+            int(
+                math.exp(
+                    rng.uniform(math.log(args.min_chars), math.log(args.max_chars))
+                )
+            ),
+            args.dump_ratio,
+        )
+        for _ in range(args.documents)
+    ]
+    tokenizer = load_tokenizer(args.hf_tokenizer)
+    print(
+        f"documents={args.documents} "
+        f"mean chars={statistics.mean(map(len, documents)):.0f} "
+        f"max_tokens={args.max_tokens} batch_size={args.batch_size} "
+        f"tokenizer={tokenizer.name}"
+    )
+
+    def by_characters(document: str) -> list[str]:
+        chunker, params = ChunkerFactory.choose_strategy(document)
+        assert isinstance(chunker, TextChunker)
+        return [span.text for span in chunker.iter_spans(document, **params)]
+
+    run("characters", documents, by_characters, tokenizer, args)
+
+    token_chunker = TextChunker(chunk_strategy="token", tokenizer=tokenizer)
+    for budget in (int(b) for b in args.budgets.split(",")):
+
+        def by_tokens(document: str, budget: int = budget) -> list[str]:
+            spans = token_chunker.iter_spans(document, chunk_size=budget)
+            return [span.text for span in spans]
+
+        run(f"tokens={budget}", documents, by_tokens, tokenizer, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_pdf_extract.py
+"""
+Measure PDFExtractor.extract pages/sec as the process-pool size grows.
+
+Builds a synthetic multi-hundred-page PDF (text blocks on every page, a
+small image every few pages) and extracts it serially and with 2, 4, ...
+workers up to the CPU count:
+
+    uv run python benchmarks/bench_pdf_extract.py --pages 600
+
+No database is needed. The first parallel run per worker count includes
+spawning the pool and is reported separately as "cold".
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import fitz
+
+from ingestion_service.core.extractors.pdf import PDFExtractor
+from ingestion_service.core.process_pools import shutdown_process_pools
+
+
+def make_pdf(pages: int, blocks_per_page: int, image_every: int) -> bytes:
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+    pixmap.clear_with(180)
+    png = pixmap.tobytes("png")
+
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page()
+        for block in range(blocks_per_page):
+            page.insert_textbox(
+                fitz.Rect(50, 50 + block * 90, 550, 130 + block * 90),
+                f"Page {number}, block {block}. " * 12,
+                fontsize=9,
+            )
+        if image_every and number % image_every == 0:
+            page.insert_image(fitz.Rect(400, 700, 464, 764), stream=png)
+    pdf_bytes = doc.write()
+    doc.close()
+    return pdf_bytes
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=600)
+    parser.add_argument("--blocks-per-page", type=int, default=8)
+    parser.add_argument("--image-every", type=int, default=5)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_bytes = make_pdf(args.pages, args.blocks_per_page, args.image_every)
+    print(
+        f"pages={args.pages} size={len(pdf_bytes) / 1e6:.1f}MB "
+        f"cpus={os.cpu_count()} repeat={args.repeat}"
+    )
+
+    baseline = None
+    expected = None
+    for workers in worker_counts(args.max_workers):
+        extractor = PDFExtractor(workers=workers, min_parallel_pages=1)
+
+        start = time.perf_counter()
+        artifacts = extractor.extract(pdf_bytes, "bench.pdf")
+        cold = time.perf_counter() - start
+
+        if expected is None:
+            expected = artifacts
+        elif artifacts != expected:
+            raise SystemExit(f"workers={workers}: output differs from serial")
+
+        best = cold
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            extractor.extract(pdf_bytes, "bench.pdf")
+            best = min(best, time.perf_counter() - start)
+
+        baseline = baseline or best
+        print(
+            f"workers={workers:<3} best={best:7.3f}s "
+            f"{args.pages / best:8.0f} pages/s  "
+            f"speedup={baseline / best:4.2f}x  cold={cold:.3f}s  "
+            f"artifacts={len(artifacts)}"
+        )
+
+    shutdown_process_pools()
+
+
+if __name__ == "__main__":
+    main()
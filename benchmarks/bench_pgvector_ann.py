@@ -0,0 +1,161 @@
+# benchmarks/bench_pgvector_ann.py
+"""
+Recall vs. latency of PgVectorStore.similarity_search with HNSW and IVFFlat
+indexes, against exact (sequential scan) search.
+
+Loads clustered synthetic vectors (--spread widens the clusters), takes
+exact top-k results as ground truth, then sweeps hnsw.ef_search and
+ivfflat.probes:
+
+    DATABASE_URL=postgresql://... uv run python benchmarks/bench_pgvector_ann.py
+
+The script drops and rebuilds the managed indexes on the vectors table, so
+run it against a scratch database. On exit the migration's default HNSW
+index is restored and the benchmark rows are deleted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+import uuid
+
+from ingestion_service.core.vectorstore.base import VectorMetadata, VectorRecord
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+
+def clustered_vectors(
+    rng: random.Random, count: int, centers: list[list[float]], spread: float
+) -> list[list[float]]:
+    return [
+        [value + rng.gauss(0.0, spread) for value in rng.choice(centers)]
+        for _ in range(count)
+    ]
+
+
+def make_records(ingestion_id: str, vectors: list[list[float]]) -> list[VectorRecord]:
+    return [
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}:chunk:{i}",
+                chunk_index=i,
+                chunk_strategy="benchmark",
+                chunk_text=f"benchmark chunk {i}",
+                provider="mock",
+            ),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def run_queries(
+    store: PgVectorStore, queries: list[list[float]], k: int, **params
+) -> tuple[list[set[tuple[str, str]]], list[float]]:
+    store.similarity_search(queries[0], k, **params)  # warm-up
+    results, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        records = store.similarity_search(query, k, **params)
+        latencies.append(time.perf_counter() - started)
+        results.append(
+            {(r.metadata.ingestion_id, r.metadata.chunk_id) for r in records}
+        )
+    return results, latencies
+
+
+def report(
+    label: str,
+    truth: list[set[tuple[str, str]]],
+    results: list[set[tuple[str, str]]],
+    latencies: list[float],
+    k: int,
+) -> None:
+    recall = statistics.mean(len(t & r) / k for t, r in zip(truth, results))
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(
+        f"{label:<22} recall@{k}={recall:6.3f}  "
+        f"mean={statistics.mean(latencies) * 1000:7.2f}ms  p95={p95 * 1000:7.2f}ms"
+    )
+
+
+def timed_build(store: PgVectorStore, method: str, **options) -> None:
+    started = time.perf_counter()
+    store.create_index(method, concurrently=False, **options)
+    index = next(i for i in store.list_indexes() if i["method"] == method)
+    print(
+        f"\n{method} build={time.perf_counter() - started:.2f}s "
+        f"size={index['size_bytes'] / 1e6:.1f}MB options={index['options']}"
+    )
+
+
+def int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--ef-search", type=int_list, default="10,20,40,80,160")
+    parser.add_argument("--lists", type=int, default=None)
+    parser.add_argument("--probes", type=int_list, default="1,2,4,8,16")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if not args.dsn:
+        raise SystemExit("Set DATABASE_URL or pass --dsn")
+
+    rng = random.Random(42)
+    centers = [
+        [rng.uniform(-1.0, 1.0) for _ in range(args.dimension)]
+        for _ in range(args.clusters)
+    ]
+    store = PgVectorStore(dsn=args.dsn, dimension=args.dimension)
+    ingestion_id = f"bench-{uuid.uuid4()}"
+    store.add(
+        make_records(
+            ingestion_id, clustered_vectors(rng, args.rows, centers, args.spread)
+        )
+    )
+    queries = clustered_vectors(rng, args.queries, centers, args.spread)
+    print(
+        f"rows={args.rows} dimension={args.dimension} clusters={args.clusters} "
+        f"queries={args.queries} k={args.k}"
+    )
+
+    try:
+        store.drop_index(concurrently=False)
+        truth, latencies = run_queries(store, queries, args.k)
+        report("exact (seq scan)", truth, truth, latencies, args.k)
+
+        timed_build(store, "hnsw", m=args.m, ef_construction=args.ef_construction)
+        for ef_search in args.ef_search:
+            results, latencies = run_queries(
+                store, queries, args.k, ef_search=ef_search
+            )
+            report(f"hnsw ef_search={ef_search}", truth, results, latencies, args.k)
+        store.drop_index("hnsw", concurrently=False)
+
+        timed_build(store, "ivfflat", lists=args.lists)
+        for probes in args.probes:
+            results, latencies = run_queries(store, queries, args.k, probes=probes)
+            report(f"ivfflat probes={probes}", truth, results, latencies, args.k)
+    finally:
+        store.drop_index(concurrently=False)
+        store.delete_by_ingestion_id(ingestion_id)
+        store.create_index("hnsw", concurrently=False)
+
+
+if __name__ == "__main__":
+    main()
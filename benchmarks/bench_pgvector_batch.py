@@ -0,0 +1,99 @@
+# benchmarks/bench_pgvector_batch.py
+"""
+Compare queries/sec of PgVectorStore.similarity_search called once per
+query against similarity_search_batch at several batch sizes.
+
+Requires a migrated database (``uv run alembic upgrade head``):
+
+    DATABASE_URL=postgresql://... uv run python benchmarks/bench_pgvector_batch.py
+
+Rows are written under a throwaway ingestion_id and deleted afterwards;
+searches run against the whole table (and its HNSW index).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import uuid
+
+from ingestion_service.core.vectorstore.base import VectorMetadata, VectorRecord
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+
+def random_vectors(rng: random.Random, count: int, dimension: int) -> list:
+    return [[rng.uniform(-1.0, 1.0) for _ in range(dimension)] for _ in range(count)]
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=256)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-sizes", default="8,32,128")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if not args.dsn:
+        raise SystemExit("Set DATABASE_URL or pass --dsn")
+
+    rng = random.Random(42)
+    store = PgVectorStore(dsn=args.dsn, dimension=args.dimension)
+    ingestion_id = f"bench-{uuid.uuid4()}"
+    store.add(
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}:chunk:{i}",
+                chunk_index=i,
+                chunk_strategy="benchmark",
+                chunk_text=f"benchmark chunk {i}",
+            ),
+        )
+        for i, vector in enumerate(random_vectors(rng, args.rows, args.dimension))
+    )
+    queries = random_vectors(rng, args.queries, args.dimension)
+    print(f"rows={args.rows} queries={args.queries} k={args.k} repeat={args.repeat}")
+
+    try:
+
+        def loop() -> None:
+            for query in queries:
+                store.similarity_search(query, args.k)
+
+        baseline = best_of(args.repeat, loop)
+        print(f"{'per-call loop':>16}: {args.queries / baseline:8.0f} queries/sec")
+
+        for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+
+            def batched() -> None:
+                for start in range(0, len(queries), batch_size):
+                    store.similarity_search_batch(
+                        queries[start : start + batch_size], args.k
+                    )
+
+            elapsed = best_of(args.repeat, batched)
+            print(
+                f"{f'batch={batch_size}':>16}: {args.queries / elapsed:8.0f} "
+                f"queries/sec ({baseline / elapsed:.2f}x)"
+            )
+    finally:
+        store.delete_by_ingestion_id(ingestion_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# benchmarks/bench_pgvector_storage.py
+"""
+Table / index size, load and HNSW build time, search latency and recall@k
+of PgVectorStore's storage modes:
+
+- vector:         4-byte floats (the default)
+- halfvec:        2-byte floats (VECTOR_STORAGE=halfvec)
+- vector+bit:     HNSW on binary-quantized vectors, candidates rescored
+- halfvec+bit:    both
+
+    DATABASE_URL=postgresql://... uv run python benchmarks/bench_pgvector_storage.py
+
+Each mode loads the same clustered synthetic vectors into its own scratch
+copy of the vectors table (dropped on exit); recall is measured against
+exact search over full-precision vectors. Modes the server's pgvector does
+not support (halfvec / binary_quantize need 0.7) are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+import psycopg
+from psycopg import sql
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    VectorMetadata,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+INGESTION_ID = "bench-storage"
+
+# label -> (storage, binary quantization with --rescore)
+MODES = {
+    "vector": ("vector", False),
+    "halfvec": ("halfvec", False),
+    "vector+bit": ("vector", True),
+    "halfvec+bit": ("halfvec", True),
+}
+
+
+def clustered_vectors(
+    rng: random.Random, count: int, centers: list[list[float]], spread: float
+) -> list[list[float]]:
+    return [
+        [value + rng.gauss(0.0, spread) for value in rng.choice(centers)]
+        for _ in range(count)
+    ]
+
+
+def make_records(vectors: list[list[float]]) -> list[VectorRecord]:
+    return [
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id=INGESTION_ID,
+                chunk_id=f"chunk-{i}",
+                chunk_index=i,
+                chunk_strategy="benchmark",
+                chunk_text=f"benchmark chunk {i}",
+            ),
+        )
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def scratch_store(
+    dsn: str, label: str, storage: str = "vector", **options
+) -> PgVectorStore:
+    """
+    A PgVectorStore on a fresh, empty copy of the vectors table, its vector
+    column of type `storage` (what migration 20261017_vectors_storage does
+    to the real table).
+    """
+    table = f"vectors_bench_{label.replace('+', '_')}"
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(
+            sql.SQL(
+                "DROP TABLE IF EXISTS {schema}.{table}; "
+                "CREATE TABLE {schema}.{table} (LIKE {schema}.vectors "
+                "INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS); "
+                # Own id sequence: do not advance the real table's
+                "ALTER TABLE {schema}.{table} ALTER COLUMN id DROP DEFAULT, "
+                "ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY, "
+                "ALTER COLUMN vector TYPE {storage}({dimension})"
+            ).format(
+                schema=sql.Identifier(PgVectorStore.SCHEMA),
+                table=sql.Identifier(table),
+                storage=sql.Identifier(storage),
+                dimension=sql.Literal(options["dimension"]),
+            )
+        )
+    store_class = type("BenchStore", (PgVectorStore,), {"TABLE_NAME": table})
+    return store_class(dsn=dsn, storage=storage, **options)
+
+
+def drop_scratch(dsn: str, store: PgVectorStore) -> None:
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(
+            sql.SQL("DROP TABLE IF EXISTS {schema}.{table}").format(
+                schema=sql.Identifier(store.SCHEMA),
+                table=sql.Identifier(store.TABLE_NAME),
+            )
+        )
+
+
+def supported_modes(dsn: str) -> set[str]:
+    with psycopg.connect(dsn) as conn:
+        row = conn.execute(
+            "SELECT to_regtype('halfvec') IS NOT NULL, "
+            "EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'binary_quantize')"
+        ).fetchone()
+    halfvec, binary_quantize = row or (False, False)
+    return {
+        label
+        for label, (storage, binary) in MODES.items()
+        if (storage == "vector" or halfvec) and (not binary or binary_quantize)
+    }
+
+
+def table_size(dsn: str, store: PgVectorStore) -> int:
+    """Heap + TOAST size, without indexes."""
+    with psycopg.connect(dsn) as conn:
+        row = conn.execute(
+            "SELECT pg_table_size(to_regclass(%s))",
+            (f"{store.SCHEMA}.{store.TABLE_NAME}",),
+        ).fetchone()
+    return row[0] if row else 0
+
+
+def run_queries(
+    store: PgVectorStore, queries: list[list[float]], k: int, **params
+) -> tuple[list[set[str]], list[float]]:
+    store.similarity_search(queries[0], k, projection="ids", **params)  # warm-up
+    results, latencies = [], []
+    for query in queries:
+        started = time.perf_counter()
+        hits = store.similarity_search(query, k, projection="ids", **params)
+        latencies.append(time.perf_counter() - started)
+        results.append({hit.chunk_id for hit in hits})
+    return results, latencies
+
+
+def bench_mode(args, label: str, records, queries, truth) -> None:
+    storage, binary = MODES[label]
+    store = scratch_store(
+        args.dsn,
+        label,
+        dimension=args.dimension,
+        storage=storage,
+        binary_rescore=args.rescore if binary else 0,
+    )
+    try:
+        started = time.perf_counter()
+        store.add(records)
+        load = time.perf_counter() - started
+
+        started = time.perf_counter()
+        store.create_index(
+            "hnsw", m=args.m, ef_construction=args.ef_construction, concurrently=False
+        )
+        build = time.perf_counter() - started
+        index = store.list_indexes()[0]
+
+        results, latencies = run_queries(store, queries, args.k)
+        recall = statistics.mean(len(t & r) / args.k for t, r in zip(truth, results))
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{label:<12} table={table_size(args.dsn, store) / 1e6:7.1f}MB "
+            f"index={index['size_bytes'] / 1e6:7.1f}MB load={load:6.2f}s "
+            f"build={build:6.2f}s recall@{args.k}={recall:5.3f} "
+            f"mean={statistics.mean(latencies) * 1000:6.2f}ms "
+            f"p95={p95 * 1000:6.2f}ms"
+        )
+    finally:
+        drop_scratch(args.dsn, store)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument(
+        "--rescore", type=int, default=4, help="binary_rescore of the +bit modes"
+    )
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if not args.dsn:
+        raise SystemExit("Set DATABASE_URL or pass --dsn")
+
+    rng = random.Random(42)
+    centers = [
+        [rng.uniform(-1.0, 1.0) for _ in range(args.dimension)]
+        for _ in range(args.clusters)
+    ]
+    records = make_records(clustered_vectors(rng, args.rows, centers, args.spread))
+    queries = clustered_vectors(rng, args.queries, centers, args.spread)
+    print(
+        f"rows={args.rows} dimension={args.dimension} queries={args.queries} "
+        f"k={args.k} rescore={args.rescore}"
+    )
+
+    # Ground truth: exact search over full-precision vectors
+    exact = scratch_store(args.dsn, "exact", dimension=args.dimension)
+    try:
+        exact.add(records)
+        truth = [
+            {
+                hit.chunk_id
+                for hit in exact.similarity_search(
+                    query,
+                    args.k,
+                    filters=SearchFilter(ingestion_id=INGESTION_ID),
+                    filter_mode="pre",
+                    projection="ids",
+                )
+            }
+            for query in queries
+        ]
+    finally:
+        drop_scratch(args.dsn, exact)
+
+    supported = supported_modes(args.dsn)
+    for label in args.modes.split(","):
+        if label not in supported:
+            print(f"{label:<12} skipped: needs pgvector >= 0.7")
+            continue
+        bench_mode(args, label, records, queries, truth)
+
+
+if __name__ == "__main__":
+    main()
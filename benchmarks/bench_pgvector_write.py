@@ -0,0 +1,70 @@
+# benchmarks/bench_pgvector_write.py
+"""
+Compare PgVectorStore.add throughput (rows/sec) across write modes.
+
+Requires a migrated database (``uv run alembic upgrade head``):
+
+    DATABASE_URL=postgresql://... uv run python benchmarks/bench_pgvector_write.py
+
+Rows are written under a throwaway ingestion_id and deleted afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import uuid
+
+from ingestion_service.core.vectorstore.base import VectorMetadata, VectorRecord
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+
+def make_records(ingestion_id: str, rows: int, dimension: int) -> list[VectorRecord]:
+    rng = random.Random(42)
+    return [
+        VectorRecord(
+            vector=[rng.random() for _ in range(dimension)],
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}:chunk:{i}",
+                chunk_index=i,
+                chunk_strategy="benchmark",
+                chunk_text=f"benchmark chunk {i} " * 20,
+                source_metadata={"page_numbers": [i // 10 + 1]},
+                provider="mock",
+            ),
+        )
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"))
+    args = parser.parse_args()
+
+    if not args.dsn:
+        raise SystemExit("Set DATABASE_URL or pass --dsn")
+
+    print(f"rows={args.rows} dimension={args.dimension} repeat={args.repeat}")
+    for mode in PgVectorStore.WRITE_MODES:
+        store = PgVectorStore(dsn=args.dsn, dimension=args.dimension, write_mode=mode)
+        best = float("inf")
+        for _ in range(args.repeat):
+            ingestion_id = f"bench-{uuid.uuid4()}"
+            records = make_records(ingestion_id, args.rows, args.dimension)
+            started = time.perf_counter()
+            store.add(records)
+            best = min(best, time.perf_counter() - started)
+            store.delete_by_ingestion_id(ingestion_id)
+
+        print(f"{mode:>12}: {args.rows / best:>10.0f} rows/sec ({best:.3f}s best)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Add persistent embedding cache table
+
+Revision ID: 20261017_add_embedding_cache
+Revises: 20261017_add_ingestion_job_queue
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20261017_add_embedding_cache"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_ingestion_job_queue"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # cache_key = sha256(provider, model, normalized text); the embedding
+    # column is dimensionless so one table serves every provider/model.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.embedding_cache (
+            cache_key BYTEA PRIMARY KEY,
+            provider TEXT NOT NULL,
+            model TEXT NOT NULL,
+            embedding vector NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_service.embedding_cache")
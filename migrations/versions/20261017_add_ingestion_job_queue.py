@@ -0,0 +1,65 @@
+"""Add durable ingestion job queue (attempts column + upload spool table)
+
+Revision ID: 20261017_add_ingestion_job_queue
+Revises: 20251229_add_vectors_table
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "20261017_add_ingestion_job_queue"
+down_revision: Union[str, Sequence[str], None] = "20251229_add_vectors_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "ingestion_requests",
+        sa.Column(
+            "attempts", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        schema="ingestion_service",
+    )
+
+    # Workers poll for the oldest claimable request; keep that scan index-only
+    # on the (small) set of queued / in-flight rows.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_ingestion_requests_queue
+        ON ingestion_service.ingestion_requests (created_at)
+        WHERE status IN ('accepted', 'running')
+        """
+    )
+
+    op.create_table(
+        "ingestion_uploads",
+        sa.Column(
+            "ingestion_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey(
+                "ingestion_service.ingestion_requests.ingestion_id",
+                ondelete="CASCADE",
+            ),
+            primary_key=True,
+        ),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("content", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+        schema="ingestion_service",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ingestion_uploads", schema="ingestion_service")
+    op.execute("DROP INDEX IF EXISTS ingestion_service.ix_ingestion_requests_queue")
+    op.drop_column("ingestion_requests", "attempts", schema="ingestion_service")
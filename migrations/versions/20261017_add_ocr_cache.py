@@ -0,0 +1,32 @@
+"""Add persistent OCR result cache table
+
+Revision ID: 20261017_add_ocr_cache
+Revises: 20261017_add_embedding_cache
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20261017_add_ocr_cache"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_embedding_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # cache_key = sha256(engine, engine version/config, sha256(image bytes))
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.ocr_cache (
+            cache_key BYTEA PRIMARY KEY,
+            engine TEXT NOT NULL,
+            text TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_service.ocr_cache")
@@ -0,0 +1,48 @@
+"""Add content hash and document key to ingestion requests
+
+Revision ID: 20261017_add_request_hash
+Revises: 20261017_add_vectors_tsv
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261017_add_request_hash"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_vectors_tsv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # SHA-256 of the upload (and embedding provider) and the document it is a
+    # version of; both are cleared once a newer version supersedes the request
+    op.add_column(
+        "ingestion_requests",
+        sa.Column("content_hash", sa.String(), nullable=True),
+        schema="ingestion_service",
+    )
+    op.add_column(
+        "ingestion_requests",
+        sa.Column("document_key", sa.String(), nullable=True),
+        schema="ingestion_service",
+    )
+
+    # Re-ingestion looks up the latest completed request by either column
+    for column in ("content_hash", "document_key"):
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS ix_ingestion_requests_{column}
+            ON ingestion_service.ingestion_requests ({column}, finished_at)
+            WHERE status = 'completed' AND {column} IS NOT NULL
+            """
+        )
+
+
+def downgrade() -> None:
+    for column in ("content_hash", "document_key"):
+        op.execute(
+            f"DROP INDEX IF EXISTS ingestion_service.ix_ingestion_requests_{column}"
+        )
+        op.drop_column("ingestion_requests", column, schema="ingestion_service")
@@ -0,0 +1,42 @@
+"""Add B-tree and GIN indexes for metadata-filtered vector search
+
+Revision ID: 20261017_add_vectors_filter_idx
+Revises: 20261017_add_vectors_hnsw_index
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20261017_add_vectors_filter_idx"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_vectors_hnsw_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Equality / IN filters of PgVectorStore.similarity_search (and
+    # delete_by_ingestion_id)
+    for column in ("ingestion_id", "provider", "chunk_strategy"):
+        op.execute(
+            f"""
+            CREATE INDEX IF NOT EXISTS vectors_{column}_idx
+            ON ingestion_service.vectors ({column})
+            """
+        )
+
+    # JSONB containment (source_metadata @> ...); jsonb_path_ops only
+    # supports @> and is smaller and faster than the default operator class
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS vectors_source_metadata_idx
+        ON ingestion_service.vectors
+        USING gin (source_metadata jsonb_path_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ingestion_service.vectors_source_metadata_idx")
+    for column in ("ingestion_id", "provider", "chunk_strategy"):
+        op.execute(f"DROP INDEX IF EXISTS ingestion_service.vectors_{column}_idx")
@@ -0,0 +1,33 @@
+"""Add HNSW index on vectors.vector for approximate nearest-neighbour search
+
+Revision ID: 20261017_add_vectors_hnsw_index
+Revises: 20261017_add_ocr_cache
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20261017_add_vectors_hnsw_index"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_ocr_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Without an ANN index `ORDER BY vector <-> q LIMIT k` scans every row.
+    # vector_l2_ops matches the <-> operator used by PgVectorStore; the name
+    # matches PgVectorStore.index_name("hnsw"), so create_index() /
+    # rebuild_index() / drop_index() manage this index afterwards.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS vectors_vector_hnsw_idx
+        ON ingestion_service.vectors
+        USING hnsw (vector vector_l2_ops)
+        WITH (m = 16, ef_construction = 64)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ingestion_service.vectors_vector_hnsw_idx")
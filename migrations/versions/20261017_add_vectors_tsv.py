@@ -0,0 +1,41 @@
+"""Add a generated tsvector column and GIN index for hybrid search
+
+Revision ID: 20261017_add_vectors_tsv
+Revises: 20261017_add_vectors_filter_idx
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20261017_add_vectors_tsv"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_vectors_filter_idx"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lexical side of PgVectorStore.hybrid_search. The 'simple' configuration
+    # lowercases but neither stems nor drops stop words, so part numbers,
+    # error codes and identifiers stay matchable verbatim; the vector side
+    # already covers paraphrases. Must match PgVectorStore.TEXT_SEARCH_CONFIG.
+    # Adding a STORED generated column rewrites the table once.
+    op.execute(
+        """
+        ALTER TABLE ingestion_service.vectors
+        ADD COLUMN IF NOT EXISTS chunk_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, chunk_text)) STORED
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS vectors_chunk_tsv_idx
+        ON ingestion_service.vectors
+        USING gin (chunk_tsv)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ingestion_service.vectors_chunk_tsv_idx")
+    op.execute("ALTER TABLE ingestion_service.vectors DROP COLUMN IF EXISTS chunk_tsv")
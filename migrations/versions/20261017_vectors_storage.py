@@ -0,0 +1,85 @@
+"""Store vectors.vector as VECTOR_STORAGE (vector or halfvec)
+
+Revision ID: 20261017_vectors_storage
+Revises: 20261017_add_request_hash
+Create Date: 2026-10-17
+"""
+
+import os
+import re
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "20261017_vectors_storage"
+down_revision: Union[str, Sequence[str], None] = "20261017_add_request_hash"
+branch_labels = None
+depends_on = None
+
+# Must match PgVectorStore.STORAGE_TYPES
+STORAGE_TYPES = ("vector", "halfvec")
+
+
+def upgrade() -> None:
+    # VECTOR_STORAGE=halfvec (pgvector >= 0.7) stores 2-byte floats: about
+    # half the table and index size for a small recall loss. PgVectorStore
+    # refuses to start when its storage setting and the column disagree, so
+    # switching later means `alembic downgrade` past this revision and
+    # upgrading again with the new setting.
+    storage = os.environ.get("VECTOR_STORAGE", "vector")
+    if storage not in STORAGE_TYPES:
+        raise ValueError(f"Unknown VECTOR_STORAGE '{storage}'. Valid: {STORAGE_TYPES}")
+    _convert(storage)
+
+
+def downgrade() -> None:
+    _convert("vector")
+
+
+def _rows(query: str) -> Sequence[sa.engine.Row]:
+    result = op.get_bind().execute(sa.text(query))
+    assert result is not None
+    return result.all()
+
+
+def _convert(storage: str) -> None:
+    [(column_type, dimension)] = _rows(
+        """
+        SELECT atttypid::regtype::text, atttypmod
+        FROM pg_attribute
+        WHERE attrelid = 'ingestion_service.vectors'::regclass
+          AND attname = 'vector'
+        """
+    )
+    if column_type == storage:
+        return
+
+    # ANN operator classes are per type (vector_l2_ops, halfvec_l2_ops, ...),
+    # so those indexes cannot survive the type change: drop them and rebuild
+    # each with the same method, options and metric on the new type. Bit
+    # indexes on binary_quantize(vector) work for both types.
+    indexes = _rows(
+        """
+        SELECT c.relname, pg_get_indexdef(c.oid)
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        JOIN pg_am am ON am.oid = c.relam
+        WHERE i.indrelid = 'ingestion_service.vectors'::regclass
+          AND am.amname IN ('hnsw', 'ivfflat')
+        """
+    )
+    for name, _ in indexes:
+        op.execute(f'DROP INDEX ingestion_service."{name}"')
+    # Rewrites the table under an exclusive lock; converting back to vector
+    # restores the width but not the precision lost
+    op.execute(
+        f"""
+        ALTER TABLE ingestion_service.vectors
+        ALTER COLUMN vector TYPE {storage}({dimension})
+        USING vector::{storage}({dimension})
+        """
+    )
+    for _, definition in indexes:
+        op.execute(
+            re.sub(r"\b(?:vector|halfvec)_(\w+_ops)\b", rf"{storage}_\1", definition)
+        )
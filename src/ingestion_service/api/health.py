@@ -1,8 +1,41 @@
 from fastapi import APIRouter
 
+from ingestion_service.core.component_registry import get_registry
+from ingestion_service.core.config import get_settings
+from ingestion_service.core.connection_pool import get_pool_metrics
+from ingestion_service.core.database_session import get_engine_pool_metrics
+from ingestion_service.core.embedders.cached import CachedEmbedder
+from ingestion_service.core.ocr.ocr_factory import get_ocr_cache_metrics
+
 router = APIRouter()
 
 
 @router.get("/health")
 def health_check():
     return {"status": "ok", "service": "ingestion"}
+
+
+@router.get("/health/pools")
+def pool_metrics():
+    """Connection pool checkout / wait metrics."""
+    return {
+        "psycopg": get_pool_metrics(),
+        "sqlalchemy": get_engine_pool_metrics(),
+    }
+
+
+@router.get("/health/embedding-cache")
+def embedding_cache_metrics():
+    """Hit-rate metrics of the default provider's embedding cache."""
+    settings = get_settings()
+    # Only reads an embedder that ingestion already built; never builds one
+    embedder = get_registry().peek_embedder(settings.EMBEDDING_PROVIDER)
+    if isinstance(embedder, CachedEmbedder):
+        return {"enabled": True, **embedder.stats()}
+    return {"enabled": settings.EMBEDDING_CACHE != "off"}
+
+
+@router.get("/health/ocr-cache")
+def ocr_cache_metrics():
+    """Hit-rate metrics of the OCR result caches, by engine."""
+    return get_ocr_cache_metrics()
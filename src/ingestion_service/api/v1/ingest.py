@@ -1,77 +1,165 @@
 # src/ingestion_service/api/v1/ingest.py
-from uuid import uuid4
+from uuid import UUID, uuid4
 import json
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, status
+from psycopg import sql
 
 from ingestion_service.api.v1.models import IngestRequest, IngestResponse
+from ingestion_service.core.connection_pool import get_pool
 from ingestion_service.core.database_session import get_sessionmaker
-from ingestion_service.core.models import IngestionRequest
+from ingestion_service.core.component_registry import get_registry
 from ingestion_service.core.pipeline import IngestionPipeline
 from ingestion_service.core.status_manager import StatusManager
-from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
 from ingestion_service.core.config import get_settings
-from ingestion_service.core.embedders.factory import get_embedder
-from ingestion_service.core.ocr.ocr_factory import get_ocr_engine
-from ingestion_service.core.extractors.pdf import PDFExtractor
-
-# 🔽 NEW IMPORTS (MS4)
-from ingestion_service.core.document_graph.builder import DocumentGraphBuilder
-from ingestion_service.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from ingestion_service.core.file_ingestion import (
+    NoExtractableContentError,
+    UnreadableFileError,
+    build_pdf_chunks,
+    content_hash,
+    document_key,
+    extract_text,
+    find_previous_ingestion,
+    is_pdf,
+    iter_pdf_chunk_windows,
+    persist_chunk_windows,
+    persist_pdf_version,
+    source_type_for,
+    token_budget_of,
+)
+from ingestion_service.core.job_queue import IngestionJobQueue
 
 router = APIRouter(tags=["ingestion"])
 SessionLocal = get_sessionmaker()
 
 
-class NoOpValidator:
-    """Synchronous no-op validator."""
-
-    def validate(self, text: str) -> None:
-        return None
-
-
 def _build_pipeline(provider: str) -> IngestionPipeline:
-    settings = get_settings()
-    embedder = get_embedder(provider)
-
-    vector_store = PgVectorStore(
-        dsn=settings.DATABASE_URL,
-        dimension=getattr(embedder, "dimension", 3),
-        provider=provider,
-    )
+    """Return the shared pipeline for a provider (built once, then cached)."""
+    return get_registry().get_pipeline(provider)
+
+
+def _ingest_pdf(
+    pipeline: IngestionPipeline,
+    *,
+    ingestion_id: UUID,
+    file_bytes: bytes,
+    filename: str,
+    source_type: str,
+    metadata: dict,
+    window_pages: int,
+    upload_hash: Optional[str] = None,
+    upload_key: Optional[str] = None,
+) -> None:
+    """Inline PDF ingestion, whole document or window_pages pages at a time."""
+    with SessionLocal() as session:
+        previous = find_previous_ingestion(
+            StatusManager(session), pipeline, document_key=upload_key
+        )
+    if previous is not None:
+        _ingest_pdf_version(
+            pipeline,
+            ingestion_id=ingestion_id,
+            previous_ingestion_id=previous,
+            file_bytes=file_bytes,
+            filename=filename,
+            source_type=source_type,
+            metadata=metadata,
+            window_pages=window_pages,
+            upload_hash=upload_hash,
+            upload_key=upload_key,
+        )
+        return
 
-    return IngestionPipeline(
-        validator=NoOpValidator(),
-        embedder=embedder,
-        vector_store=vector_store,
-    )
+    if window_pages > 0:
+        # Pages are extracted lazily as the windows are consumed below
+        windows = iter_pdf_chunk_windows(
+            file_bytes, filename, window_pages, token_budget=token_budget_of(pipeline)
+        )
+    else:
+        chunks = build_pdf_chunks(file_bytes, filename, token_budget_of(pipeline))
+        if not chunks:
+            raise HTTPException(
+                status_code=400,
+                detail="No extractable text found in uploaded PDF",
+            )
+        windows = iter([chunks])
 
+    with SessionLocal() as session:
+        manager = StatusManager(session)
+        manager.create_request(
+            ingestion_id=ingestion_id,
+            source_type=source_type,
+            metadata=metadata,
+            content_hash=upload_hash,
+            document_key=upload_key,
+        )
+        manager.mark_running(ingestion_id)
 
-def _extract_text_from_file(
-    file: UploadFile, ocr_provider: Optional[str] = None
-) -> str:
-    """
-    Returns extracted text from a file. Uses OCR if file is an image.
-    PDFs are handled separately (MS4 always-on).
-    """
-    content_type = file.content_type or ""
-    filename: str = str(file.filename or "")
-    file_bytes = file.file.read()
+        try:
+            if not persist_chunk_windows(pipeline, windows, str(ingestion_id)):
+                raise NoExtractableContentError(
+                    "No extractable text found in uploaded PDF"
+                )
+            manager.mark_completed(ingestion_id)
+        except NoExtractableContentError as exc:
+            pipeline._vector_store.delete_by_ingestion_id(str(ingestion_id))
+            manager.mark_failed(ingestion_id, error=str(exc))
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except Exception as exc:
+            # Windows persisted before the failure would stay searchable
+            # under a failed ingestion_id
+            pipeline._vector_store.delete_by_ingestion_id(str(ingestion_id))
+            manager.mark_failed(ingestion_id, error=str(exc))
+            raise HTTPException(
+                status_code=500, detail="PDF ingestion pipeline failed"
+            ) from exc
 
-    if content_type.startswith("image/") or filename.endswith(
-        (".png", ".jpg", ".jpeg")
-    ):
-        ocr_engine = get_ocr_engine(ocr_provider or "tesseract")
-        return ocr_engine.extract_text(file_bytes) or ""
 
-    try:
-        return file_bytes.decode("utf-8")
-    except Exception:
-        raise HTTPException(
-            status_code=400,
-            detail="Unable to read uploaded text file as UTF-8",
+def _ingest_pdf_version(
+    pipeline: IngestionPipeline,
+    *,
+    ingestion_id: UUID,
+    previous_ingestion_id: UUID,
+    file_bytes: bytes,
+    filename: str,
+    source_type: str,
+    metadata: dict,
+    window_pages: int,
+    upload_hash: Optional[str],
+    upload_key: Optional[str],
+) -> None:
+    """Inline PDF re-ingestion: embed only chunks changed since the previous version."""
+    with SessionLocal() as session:
+        manager = StatusManager(session)
+        manager.create_request(
+            ingestion_id=ingestion_id,
+            source_type=source_type,
+            metadata={**metadata, "previous_ingestion_id": str(previous_ingestion_id)},
+            content_hash=upload_hash,
+            document_key=upload_key,
         )
+        manager.mark_running(ingestion_id)
+
+        try:
+            persist_pdf_version(
+                pipeline,
+                file_bytes,
+                filename,
+                window_pages,
+                str(ingestion_id),
+                str(previous_ingestion_id),
+            )
+            manager.mark_completed(ingestion_id)
+        except NoExtractableContentError as exc:
+            manager.mark_failed(ingestion_id, error=str(exc))
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except Exception as exc:
+            manager.mark_failed(ingestion_id, error=str(exc))
+            raise HTTPException(
+                status_code=500, detail="PDF ingestion pipeline failed"
+            ) from exc
+        manager.supersede(previous_ingestion_id, by=ingestion_id)
 
 
 # ---------------------------------------------------------------------------
@@ -144,80 +232,86 @@ def ingest_file(
 
     content_type = file.content_type or ""
     filename: str = str(file.filename or "")
-
-    is_pdf = filename.endswith(".pdf") or content_type == "application/pdf"
-
-    pipeline = _build_pipeline(provider)
+    file_bytes = file.file.read()
+    source_type = source_type_for(filename, content_type)
 
     # ------------------------------------------------------------------
-    # PDF ingestion (MS4 always-on)
+    # Idempotency: an identical upload that is already ingested (and
+    # still stored) is answered with its existing ingestion_id
     # ------------------------------------------------------------------
-    if is_pdf:
-        pdf_extractor = PDFExtractor()
-        artifacts = pdf_extractor.extract(
-            file_bytes=file.file.read(),
-            source_name=filename,
-        )
-
-        graph = DocumentGraphBuilder().build(artifacts)
-        chunks = PDFChunkAssembler().assemble(graph)
-
-        if not chunks:
-            raise HTTPException(
-                status_code=400,
-                detail="No extractable text found in uploaded PDF",
-            )
+    upload_hash = content_hash(file_bytes, provider)
+    upload_key = document_key(parsed_metadata, provider)
+    pipeline = _build_pipeline(provider)
 
-        source_type = "file"
+    with SessionLocal() as session:
+        duplicate = find_previous_ingestion(
+            StatusManager(session), pipeline, content_hash=upload_hash
+        )
+    if duplicate is not None:
+        return IngestResponse(ingestion_id=duplicate, status="completed")
 
+    # ------------------------------------------------------------------
+    # Queue mode: spool the upload, let a worker process it
+    # ------------------------------------------------------------------
+    if settings.INGEST_EXECUTION_MODE == "queue":
         with SessionLocal() as session:
-            manager = StatusManager(session)
-            manager.create_request(
+            IngestionJobQueue(session).enqueue(
                 ingestion_id=ingestion_id,
                 source_type=source_type,
                 metadata={**parsed_metadata, "filename": filename},
+                filename=filename,
+                content_type=content_type,
+                content=file_bytes,
+                content_hash=upload_hash,
+                document_key=upload_key,
             )
-            manager.mark_running(ingestion_id)
-
-            try:
-                embeddings = pipeline._embed(chunks)
-                pipeline._persist(
-                    chunks=chunks,
-                    embeddings=embeddings,
-                    ingestion_id=str(ingestion_id),
-                )
-                manager.mark_completed(ingestion_id)
-            except Exception as exc:
-                manager.mark_failed(ingestion_id, error=str(exc))
-                raise HTTPException(
-                    status_code=500, detail="PDF ingestion pipeline failed"
-                ) from exc
 
         return IngestResponse(ingestion_id=ingestion_id, status="accepted")
 
+    # ------------------------------------------------------------------
+    # PDF ingestion (MS4 always-on)
+    # ------------------------------------------------------------------
+    if is_pdf(filename, content_type):
+        _ingest_pdf(
+            pipeline,
+            ingestion_id=ingestion_id,
+            file_bytes=file_bytes,
+            filename=filename,
+            source_type=source_type,
+            metadata={**parsed_metadata, "filename": filename},
+            window_pages=settings.PDF_STREAM_WINDOW_PAGES,
+            upload_hash=upload_hash,
+            upload_key=upload_key,
+        )
+        return IngestResponse(ingestion_id=ingestion_id, status="accepted")
+
     # ------------------------------------------------------------------
     # Non-PDF ingestion (existing behavior)
     # ------------------------------------------------------------------
-    text = _extract_text_from_file(file, ocr_provider)
+    try:
+        text = extract_text(file_bytes, filename, content_type, ocr_provider)
+    except UnreadableFileError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
     if not text.strip():
         raise HTTPException(
             status_code=400,
             detail="No extractable text found in uploaded file",
         )
 
-    source_type = (
-        "image"
-        if content_type.startswith("image/")
-        or filename.endswith((".png", ".jpg", ".jpeg"))
-        else "file"
-    )
-
     with SessionLocal() as session:
         manager = StatusManager(session)
+        # A new version of an ingested document: embed only changed chunks
+        previous = find_previous_ingestion(manager, pipeline, document_key=upload_key)
+        request_metadata = {**parsed_metadata, "filename": filename}
+        if previous is not None:
+            request_metadata["previous_ingestion_id"] = str(previous)
         manager.create_request(
             ingestion_id=ingestion_id,
             source_type=source_type,
-            metadata={**parsed_metadata, "filename": filename},
+            metadata=request_metadata,
+            content_hash=upload_hash,
+            document_key=upload_key,
         )
         manager.mark_running(ingestion_id)
 
@@ -227,6 +321,7 @@ def ingest_file(
                 ingestion_id=str(ingestion_id),
                 source_type=source_type,
                 provider=provider,
+                previous_ingestion_id=str(previous) if previous else None,
             )
             manager.mark_completed(ingestion_id)
         except Exception as exc:
@@ -234,6 +329,8 @@ def ingest_file(
             raise HTTPException(
                 status_code=500, detail="Ingestion pipeline failed"
             ) from exc
+        if previous is not None:
+            manager.supersede(previous, by=ingestion_id)
 
     return IngestResponse(ingestion_id=ingestion_id, status="accepted")
 
@@ -252,16 +349,19 @@ def ingest_status(ingestion_id: str) -> IngestResponse:
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid ingestion ID format")
 
-    with SessionLocal() as session:
-        request = (
-            session.query(IngestionRequest)
-            .filter_by(ingestion_id=ingestion_uuid)
-            .first()
-        )
-        if request is None:
-            raise HTTPException(status_code=404, detail="Ingestion ID not found")
+    # Status polling is the hottest read path: borrow a pooled connection
+    # rather than opening an ORM session per poll.
+    status_sql = sql.SQL(
+        "SELECT ingestion_id, status FROM {schema}.{table} WHERE ingestion_id = %s"
+    ).format(
+        schema=sql.Identifier("ingestion_service"),
+        table=sql.Identifier("ingestion_requests"),
+    )
 
-        return IngestResponse(
-            ingestion_id=request.ingestion_id,
-            status=request.status,
-        )
+    with get_pool().connection() as conn:
+        row = conn.execute(status_sql, (ingestion_uuid,)).fetchone()
+
+    if row is None:
+        raise HTTPException(status_code=404, detail="Ingestion ID not found")
+
+    return IngestResponse(ingestion_id=row[0], status=row[1])
@@ -1,7 +1,7 @@
 # src/ingestion_service/core/chunk_assembly/pdf_chunk_assembler.py
 from __future__ import annotations
 
-from typing import Dict, List, Set
+from typing import List, Optional
 
 from ingestion_service.core.chunks import Chunk
 from ingestion_service.core.document_graph.models import DocumentGraph
@@ -17,23 +17,20 @@ class PDFChunkAssembler:
     - Chunking is delegated to ChunkerFactory
     - Chunk IDs are deterministic
     - Image → text associations are preserved in metadata
+    - With a token_budget, text is packed into chunks of up to that many
+      tokens
     """
 
+    def __init__(self, token_budget: Optional[int] = None) -> None:
+        self.token_budget = token_budget
+
     def assemble(self, graph: DocumentGraph) -> List[Chunk]:
         chunks: List[Chunk] = []
 
-        # ---------------------------------------------------------
-        # Map image → text edges for associated_image_ids
-        # ---------------------------------------------------------
-        images_by_text: Dict[str, Set[str]] = {}
-        for edge in graph.edges:
-            if edge.relation == "image_to_text":
-                images_by_text.setdefault(edge.to_id, set()).add(edge.from_id)
-
         # ---------------------------------------------------------
         # Create chunks from text or OCR text
         # ---------------------------------------------------------
-        for node in graph.nodes.values():
+        for node in graph:
             artifact = node.artifact
 
             # Decide which text to use:
@@ -49,22 +46,30 @@ class PDFChunkAssembler:
                 continue
 
             # Choose chunker dynamically
-            chunker, chunker_params = ChunkerFactory.choose_strategy(content_to_chunk)
+            chunker, chunker_params = ChunkerFactory.choose_strategy(
+                content_to_chunk, token_budget=self.token_budget
+            )
             chunk_strategy = getattr(chunker, "chunk_strategy", "unknown")
             chunker_name = getattr(chunker, "name", chunker.__class__.__name__)
 
             produced_chunks = chunker.chunk(content_to_chunk, **chunker_params)
 
+            # image → text edges, straight from the graph's adjacency
+            artifact_id = node.artifact_id
+            image_ids = [
+                graph.artifact_id(image)
+                for image in graph.images_for_text(node.node_id)
+            ]
+
             for idx, produced_chunk in enumerate(produced_chunks):
-                produced_chunk.chunk_id = f"{node.artifact_id}:chunk:{idx}"
+                produced_chunk.chunk_id = f"{artifact_id}:chunk:{idx}"
 
-                associated_image_ids = list(images_by_text.get(node.artifact_id, []))
                 produced_chunk.metadata.update(
                     {
                         "source_file": artifact.source_file,
                         "page_numbers": [artifact.page_number],
-                        "artifact_ids": [node.artifact_id],
-                        "associated_image_ids": associated_image_ids,
+                        "artifact_ids": [artifact_id],
+                        "associated_image_ids": list(image_ids),
                         "chunk_strategy": chunk_strategy,
                         "chunker_name": chunker_name,
                         "chunker_params": dict(chunker_params),
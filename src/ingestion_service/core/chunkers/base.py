@@ -1,7 +1,7 @@
 # src/ingestion_service/core/chunkers/base.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from ingestion_service.core.chunks import Chunk
 
@@ -22,3 +22,10 @@ class BaseChunker(ABC):
         :return: list of Chunk objects
         """
         pass
+
+    def iter_chunks(self, content: Any, **params) -> Iterator[Chunk]:
+        """
+        Yield chunks lazily. Chunkers that can stream override this; the
+        default yields from chunk().
+        """
+        yield from self.chunk(content, **params)
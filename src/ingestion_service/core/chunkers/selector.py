@@ -1,6 +1,6 @@
 # src/ingestion_service/core/chunkers/selector.py
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from ingestion_service.core.chunkers.base import BaseChunker
 from ingestion_service.core.chunkers.text import TextChunker
 
@@ -13,6 +13,7 @@ class ChunkerFactory:
         "fixed_char": TextChunker(chunk_strategy="simple"),
         "sentence": TextChunker(chunk_strategy="sentence"),
         "paragraph": TextChunker(chunk_strategy="paragraph"),
+        "token": TextChunker(chunk_strategy="token"),
     }
 
     @classmethod
@@ -22,12 +23,19 @@ class ChunkerFactory:
         return cls._registry[strategy_name]
 
     @classmethod
-    def choose_strategy(cls, content: Any, **context) -> tuple[BaseChunker, Dict]:
+    def choose_strategy(
+        cls, content: Any, token_budget: Optional[int] = None, **context
+    ) -> tuple[BaseChunker, Dict]:
         """
         Heuristic to choose a chunk strategy based on content type and length.
         Returns (chunker instance, chunk_strategy parameters)
+
+        With a token_budget, text is packed into chunks of up to that many
+        tokens instead (see IngestionPipeline's token_budget).
         """
         if isinstance(content, str):
+            if token_budget:
+                return cls.get_chunker("token"), {"chunk_size": token_budget}
             if len(content) < 2000:
                 return cls.get_chunker("sentence"), {"chunk_size": 200, "overlap": 20}
             elif len(content) < 10000:
@@ -1,104 +1,281 @@
 # src/ingestion_service/core/chunkers/text.py
 
 from __future__ import annotations
-import uuid
-from typing import List
 
-from ingestion_service.core.chunks import Chunk
+import re
+from collections import deque
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from ingestion_service.core.chunks import Chunk, chunk_digest
 from ingestion_service.core.chunkers.base import BaseChunker
+from ingestion_service.core.chunkers.tokens import BaseTokenizer, HeuristicTokenizer
+
+# Group 1 is the whitespace after a sentence-ending ".", "!" or "?"; the
+# same boundaries as r"(?<=[.!?])\s+", but anchored on the punctuation,
+# which the regex engine scans for much faster than a lookbehind
+SENTENCE_BOUNDARY = re.compile(r"[.!?](\s+)")
+# Split points inside a sentence longer than the token budget
+WORD = re.compile(r"\S+")
+SENTENCE_SEPARATOR = " "
+PARAGRAPH_SEPARATOR = "\n\n"
+
+
+class TextSpan(NamedTuple):
+    """
+    One chunk as [start, end) character offsets into the source text.
+
+    The text is only built when `text` is read. Sentence and paragraph
+    chunks are their pieces joined with a separator; `pieces` keeps the
+    piece offsets when the source between them is not exactly that
+    separator, and is None when the chunk is source[start:end].
+    """
+
+    source: str
+    start: int
+    end: int
+    pieces: Optional[Tuple[Tuple[int, int], ...]] = None
+    separator: str = ""
+
+    @property
+    def text(self) -> str:
+        if self.pieces is None:
+            return self.source[self.start : self.end]
+        return self.separator.join([self.source[s:e] for s, e in self.pieces])
+
+    def __repr__(self) -> str:
+        return f"TextSpan(start={self.start}, end={self.end}, pieces={self.pieces})"
 
 
 class TextChunker(BaseChunker):
-    """Text chunker supporting multiple strategies."""
+    """
+    Text chunker supporting multiple strategies.
+
+    chunk_size is in characters, except for the "token" strategy, where it
+    is a token budget counted with `tokenizer` (HeuristicTokenizer unless
+    given).
+    """
 
     name: str = "text_chunker"
 
     def __init__(
-        self, chunk_size: int = 500, overlap: int = 50, chunk_strategy: str = "simple"
+        self,
+        chunk_size: int = 500,
+        overlap: int = 50,
+        chunk_strategy: str = "simple",
+        tokenizer: Optional[BaseTokenizer] = None,
     ):
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.chunk_strategy = chunk_strategy
+        self.tokenizer = tokenizer or HeuristicTokenizer()
 
     def chunk(self, content: str, **params) -> List[Chunk]:
+        return list(self.iter_chunks(content, **params))
+
+    def iter_chunks(self, content: str, **params) -> Iterator[Chunk]:
+        """
+        Yield chunks one at a time, each with its "char_start" / "char_end"
+        offsets into `content` in its metadata.
+
+        IDs are a prefix of the text's SHA-256; a text repeated within the
+        document gets "-1", "-2", ... on later occurrences. Re-chunking the
+        same text therefore yields the same IDs, which lets re-ingestion
+        keep unchanged chunks instead of re-embedding them.
+        """
+        seen: Dict[str, int] = {}
+        for span in self.iter_spans(content, **params):
+            text = span.text
+            digest = chunk_digest(text)[:32]
+            occurrence = seen.get(digest, 0)
+            seen[digest] = occurrence + 1
+            yield Chunk(
+                content=text,
+                chunk_id=f"{digest}-{occurrence}" if occurrence else digest,
+                metadata={"char_start": span.start, "char_end": span.end},
+            )
+
+    def iter_spans(self, content: str, **params) -> Iterator[TextSpan]:
+        """Yield the chunk offsets lazily, without building chunk texts."""
         chunk_size = params.get("chunk_size", self.chunk_size)
         overlap = params.get("overlap", self.overlap)
         chunk_strategy = params.get("chunk_strategy", self.chunk_strategy)
 
         if chunk_strategy == "simple":
             return self._chunk_simple(content, chunk_size, overlap)
-        elif chunk_strategy == "sentence":
+        if chunk_strategy == "sentence":
             return self._chunk_by_sentence(content, chunk_size, overlap)
-        elif chunk_strategy == "paragraph":
+        if chunk_strategy == "paragraph":
             return self._chunk_by_paragraph(content, chunk_size, overlap)
-        else:
-            raise ValueError(f"Unknown text chunk strategy: {chunk_strategy}")
+        if chunk_strategy == "token":
+            return self._chunk_by_tokens(content, chunk_size, overlap)
+        raise ValueError(f"Unknown text chunk strategy: {chunk_strategy}")
 
-    def _chunk_simple(self, text: str, chunk_size: int, overlap: int) -> List[Chunk]:
-        chunks: List[Chunk] = []
+    def _chunk_simple(
+        self, text: str, chunk_size: int, overlap: int
+    ) -> Iterator[TextSpan]:
         start = 0
         text_length = len(text)
 
         while start < text_length:
             end = min(start + chunk_size, text_length)
-            chunk_text = text[start:end]
-            chunks.append(
-                Chunk(content=chunk_text, chunk_id=str(uuid.uuid4()), metadata={})
-            )
+            yield TextSpan(text, start, end)
             start += chunk_size - overlap
 
-        return chunks
-
     def _chunk_by_sentence(
         self, text: str, chunk_size: int, overlap: int
-    ) -> List[Chunk]:
-        import re
-
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        chunks: List[Chunk] = []
-        buffer = ""
-
-        for sentence in sentences:
-            if len(buffer) + len(sentence) > chunk_size:
-                if buffer:
-                    chunks.append(
-                        Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-                    )
-                buffer = sentence
-            else:
-                buffer += (" " if buffer else "") + sentence
-
-        if buffer:
-            chunks.append(
-                Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-            )
-
-        return chunks
+    ) -> Iterator[TextSpan]:
+        return self._pack(
+            text, _sentences(text), chunk_size, SENTENCE_SEPARATOR, overlap
+        )
 
     def _chunk_by_paragraph(
         self, text: str, chunk_size: int, overlap: int
-    ) -> List[Chunk]:
-        paragraphs = text.split("\n\n")
-        chunks: List[Chunk] = []
-        buffer = ""
-
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
+    ) -> Iterator[TextSpan]:
+        return self._pack(
+            text, _paragraphs(text), chunk_size, PARAGRAPH_SEPARATOR, overlap
+        )
+
+    def _chunk_by_tokens(
+        self, text: str, max_tokens: int, overlap: int
+    ) -> Iterator[TextSpan]:
+        """
+        Pack whole sentences into chunks of at most max_tokens tokens; a
+        longer sentence is split between words (a longer word between
+        characters). Chunks are contiguous slices of the source.
+        """
+        if max_tokens < 1:
+            raise ValueError("Token budget must be >= 1")
+        start = end = 0
+        used = 0
+
+        for piece_start, piece_end, tokens in self._token_pieces(text, max_tokens):
+            if used and used + tokens > max_tokens:
+                yield TextSpan(text, start, end)
+                used = 0
+            if not used:
+                start = piece_start
+            end = piece_end
+            used += tokens
+
+        if used:
+            yield TextSpan(text, start, end)
+
+    def _token_pieces(
+        self, text: str, max_tokens: int
+    ) -> Iterator[Tuple[int, int, int]]:
+        """(start, end, tokens) of pieces that each fit in max_tokens."""
+        count = self.tokenizer.count
+        for start, end in _sentences(text):
+            tokens = count(text[start:end])
+            if tokens <= max_tokens:
+                yield start, end, tokens
                 continue
+            for word in WORD.finditer(text, start, end):
+                tokens = count(word.group())
+                if tokens <= max_tokens:
+                    yield word.start(), word.end(), tokens
+                else:
+                    yield from self._split_word(text, *word.span(), max_tokens)
+
+    def _split_word(
+        self, text: str, start: int, end: int, max_tokens: int
+    ) -> Iterator[Tuple[int, int, int]]:
+        count = self.tokenizer.count
+        while start < end:
+            # Guess from the word's token density, then shrink to fit
+            tokens = max(1, count(text[start:end]))
+            step = max(1, (end - start) * max_tokens // tokens)
+            stop = min(end, start + step)
+            while stop - start > 1 and count(text[start:stop]) > max_tokens:
+                stop = start + (stop - start) // 2
+            yield start, stop, count(text[start:stop])
+            start = stop
+
+    @staticmethod
+    def _pack(
+        text: str,
+        pieces: Iterable[Tuple[int, int]],
+        chunk_size: int,
+        separator: str,
+        overlap: int = 0,
+    ) -> Iterator[TextSpan]:
+        """
+        Greedily join consecutive pieces with `separator` while their
+        lengths plus the separators already between them stay within
+        chunk_size characters; a piece longer than chunk_size is a chunk of
+        its own.
 
-            if len(buffer) + len(para) > chunk_size:
-                if buffer:
-                    chunks.append(
-                        Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-                    )
-                buffer = para
+        With overlap, each chunk starts with the trailing pieces of the
+        previous one that fit in `overlap` characters: the pieces are a
+        sliding window over the split offsets, so every piece is found
+        once however many chunks it ends up in.
+        """
+        # (start, end, whether the source before it is exactly `separator`)
+        window: Deque[Tuple[int, int, bool]] = deque()
+        length = 0
+        # Pieces in the window not joined to their predecessor by `separator`
+        breaks = 0
+        gap = len(separator)
+        startswith = text.startswith
+        append = window.append
+        last = 0
+
+        for start, end in pieces:
+            size = end - start
+            if length + size > chunk_size and length:
+                yield _joined(text, window, separator, breaks)
+                # Slide: keep the tail that fits in `overlap` and leaves
+                # room for this piece
+                while window and (length > overlap or length + size > chunk_size):
+                    s, e, _ = window.popleft()
+                    length = length - (e - s + gap) if window else 0
+                    if window and not window[0][2]:
+                        breaks -= 1
+
+            if length:
+                clean = start - last == gap and startswith(separator, last)
+                if not clean:
+                    breaks += 1
+                length += gap + size
             else:
-                buffer += ("\n\n" if buffer else "") + para
+                window.clear()
+                clean, length, breaks = True, size, 0
+            append((start, end, clean))
+            last = end
+
+        if length:
+            yield _joined(text, window, separator, breaks)
+
+
+def _sentences(text: str) -> Iterator[Tuple[int, int]]:
+    """Offsets of the text between sentence boundaries, computed lazily."""
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(text):
+        yield start, boundary.start(1)
+        start = boundary.end(1)
+    yield start, len(text)
+
+
+def _paragraphs(text: str) -> Iterator[Tuple[int, int]]:
+    """Offsets of the stripped, non-empty parts of text.split("\\n\\n")."""
+    start = 0
+    while start <= len(text):
+        end = text.find(PARAGRAPH_SEPARATOR, start)
+        if end == -1:
+            end = len(text)
+        part = text[start:end]
+        stripped = part.strip()
+        if stripped:
+            lead = len(part) - len(part.lstrip())
+            yield start + lead, start + lead + len(stripped)
+        start = end + len(PARAGRAPH_SEPARATOR)
 
-        if buffer:
-            chunks.append(
-                Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-            )
 
-        return chunks
+def _joined(
+    text: str, window: Deque[Tuple[int, int, bool]], separator: str, breaks: int
+) -> TextSpan:
+    start, end = window[0][0], window[-1][1]
+    if not breaks:
+        return TextSpan(text, start, end)
+    pieces = tuple((s, e) for s, e, _ in window)
+    return TextSpan(text, start, end, pieces, separator)
@@ -0,0 +1,83 @@
+# src/ingestion_service/core/chunkers/tokens.py
+"""
+Token counting for token-budget chunking.
+
+Chunkers only need "how many tokens is this text"; BaseTokenizer is that
+one method, so a model's real tokenizer can be plugged in (e.g. wrapping a
+Hugging Face `tokenizers.Tokenizer` with EncodeTokenizer). The default,
+HeuristicTokenizer, is a fast estimate that errs on the high side for
+WordPiece / BPE vocabularies.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import Callable, Optional, Sized
+
+logger = logging.getLogger(__name__)
+
+# A greedy {1,n} splits an ASCII word of length L into ceil(L / n) matches;
+# any other non-space character is a match of its own
+_TOKEN_PATTERN = r"[A-Za-z0-9_]{1,%d}|[^\sA-Za-z0-9_]"
+
+
+class BaseTokenizer(ABC):
+    """Counts the tokens of a text."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        raise NotImplementedError
+
+
+class HeuristicTokenizer(BaseTokenizer):
+    """
+    Estimate without a vocabulary: an ASCII word costs one token per
+    `chars_per_token` characters (rounded up), and every other non-space
+    character (punctuation, accented letters, CJK) one token. Counts are
+    additive over whitespace-separated pieces.
+    """
+
+    name = "heuristic"
+
+    def __init__(self, chars_per_token: int = 4) -> None:
+        if chars_per_token < 1:
+            raise ValueError("chars_per_token must be >= 1")
+        self.chars_per_token = chars_per_token
+        self._tokens = re.compile(_TOKEN_PATTERN % chars_per_token)
+
+    def count(self, text: str) -> int:
+        return len(self._tokens.findall(text))
+
+
+class EncodeTokenizer(BaseTokenizer):
+    """Counts with any `encode(text) -> sequence of tokens` function."""
+
+    name = "encode"
+
+    def __init__(self, encode: Callable[[str], Sized]) -> None:
+        self._encode = encode
+
+    def count(self, text: str) -> int:
+        return len(self._encode(text))
+
+
+def resolve_token_budget(requested: int, max_tokens: Optional[int]) -> Optional[int]:
+    """
+    Token budget per chunk: None (character strategies) when `requested`
+    is 0, otherwise `requested` capped at the embedder's max_tokens.
+    """
+    if requested <= 0:
+        return None
+    if max_tokens is not None and requested > max_tokens:
+        logger.warning(
+            "CHUNK_TOKEN_BUDGET %d exceeds the embedder's %d max tokens; using %d",
+            requested,
+            max_tokens,
+            max_tokens,
+        )
+        return max_tokens
+    return requested
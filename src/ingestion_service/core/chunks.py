@@ -1,6 +1,7 @@
 # src/ingestion_service/core/chunks.py
 from __future__ import annotations
 from dataclasses import dataclass, field
+import hashlib
 from typing import Any, Dict, Optional
 
 
@@ -10,3 +11,13 @@ class Chunk:
     content: Any
     metadata: Dict[str, Any] = field(default_factory=dict)
     ocr_text: Optional[str] = None
+
+
+def chunk_digest(content: Any) -> str:
+    """
+    SHA-256 hex digest of a chunk's text.
+
+    Matches encode(sha256(convert_to(chunk_text, 'UTF8')), 'hex') in
+    Postgres, so stored chunks can be compared without fetching their text.
+    """
+    return hashlib.sha256(str(content).encode("utf-8")).hexdigest()
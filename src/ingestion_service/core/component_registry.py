@@ -0,0 +1,119 @@
+# src/ingestion_service/core/component_registry.py
+"""
+Process-wide cache of ingestion components.
+
+Building a pipeline used to happen on every request: a new embedder, a new
+PgVectorStore and, with it, two information_schema probes. The registry
+builds each component once and hands the same instance to every caller.
+
+- Embedders: one per provider
+- Vector stores: one per (provider, dimension), schema validated on creation
+- Pipelines: one per provider, wired from the cached components
+
+Cached components hold no per-request state and are safe to share across
+threads. invalidate() drops everything; it runs automatically on
+reset_settings_cache() so reloaded configuration takes effect.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from ingestion_service.core.chunkers.tokens import resolve_token_budget
+from ingestion_service.core.config import get_settings, on_settings_reload
+from ingestion_service.core.embedders.base import BaseEmbedder
+from ingestion_service.core.embedders.factory import get_embedder
+from ingestion_service.core.pipeline import IngestionPipeline
+from ingestion_service.core.validation import NoOpValidator
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+T = TypeVar("T")
+
+
+class ComponentRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._embedders: Dict[str, BaseEmbedder] = {}
+        self._vector_stores: Dict[Tuple[str, int], PgVectorStore] = {}
+        self._pipelines: Dict[str, IngestionPipeline] = {}
+
+    def get_embedder(self, provider: str) -> BaseEmbedder:
+        return self._get_or_create(
+            self._embedders, provider, lambda: get_embedder(provider)
+        )
+
+    def peek_embedder(self, provider: str) -> Optional[BaseEmbedder]:
+        """The provider's embedder if one was already built, without building it."""
+        return self._embedders.get(provider)
+
+    def get_vector_store(self, provider: str, dimension: int) -> PgVectorStore:
+        """Return the shared store; the schema is validated only when first built."""
+
+        def build() -> PgVectorStore:
+            settings = get_settings()
+            return PgVectorStore(
+                dsn=settings.DATABASE_URL,
+                dimension=dimension,
+                provider=provider,
+                ef_search=settings.VECTOR_SEARCH_EF_SEARCH or None,
+                probes=settings.VECTOR_SEARCH_PROBES or None,
+                metric=settings.VECTOR_SEARCH_METRIC,
+                normalize=settings.VECTOR_NORMALIZE,
+                filter_exact_max_rows=settings.VECTOR_FILTER_EXACT_MAX_ROWS,
+                filter_overfetch=settings.VECTOR_FILTER_OVERFETCH,
+                hybrid_vector_weight=settings.VECTOR_HYBRID_VECTOR_WEIGHT,
+                hybrid_text_weight=settings.VECTOR_HYBRID_TEXT_WEIGHT,
+                hybrid_rrf_k=settings.VECTOR_HYBRID_RRF_K,
+                storage=settings.VECTOR_STORAGE,
+                binary_rescore=settings.VECTOR_BINARY_RESCORE,
+            )
+
+        return self._get_or_create(self._vector_stores, (provider, dimension), build)
+
+    def get_pipeline(self, provider: str) -> IngestionPipeline:
+        def build() -> IngestionPipeline:
+            embedder = self.get_embedder(provider)
+            return IngestionPipeline(
+                validator=NoOpValidator(),
+                embedder=embedder,
+                vector_store=self.get_vector_store(
+                    provider, getattr(embedder, "dimension", 3)
+                ),
+                token_budget=resolve_token_budget(
+                    get_settings().CHUNK_TOKEN_BUDGET,
+                    getattr(embedder, "max_tokens", None),
+                ),
+            )
+
+        return self._get_or_create(self._pipelines, provider, build)
+
+    def invalidate(self) -> None:
+        """Drop every cached component; the next lookup rebuilds it."""
+        with self._lock:
+            self._embedders.clear()
+            self._vector_stores.clear()
+            self._pipelines.clear()
+
+    def _get_or_create(self, cache: Dict, key: Hashable, factory: Callable[[], T]) -> T:
+        instance = cache.get(key)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            instance = cache.get(key)
+            if instance is None:
+                # A failing factory (e.g. schema validation) caches nothing,
+                # so the next call retries.
+                instance = factory()
+                cache[key] = instance
+            return instance
+
+
+_registry = ComponentRegistry()
+on_settings_reload(_registry.invalidate)
+
+
+def get_registry() -> ComponentRegistry:
+    """Return the process-wide component registry."""
+    return _registry
@@ -1,6 +1,7 @@
 # src/ingestion_service/core/config.py
 
 from functools import lru_cache
+from typing import Callable, List, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +11,85 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://host.docker.internal:11434"
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50  # default batch size for Ollama embedding
+    OLLAMA_MAX_CONCURRENCY: int = 4  # batches in flight at once
+    OLLAMA_MAX_RETRIES: int = 3  # per-batch retries on transient errors
+    OLLAMA_RETRY_BACKOFF: float = 0.5  # seconds, doubled on each retry
+    OLLAMA_TIMEOUT: float = 120.0  # seconds per /api/embed request
+    OLLAMA_MAX_TOKENS: int = 2048  # model context; longer inputs are truncated
+
+    # >0: pack text into chunks of up to this many tokens (capped at the
+    # embedder's max tokens) instead of the character-size strategies
+    CHUNK_TOKEN_BUDGET: int = 0
+
+    # Content-addressed embedding cache (see core/embedders/cached.py):
+    # "off", "memory" (in-process LRU) or "postgres" (LRU + embedding_cache table)
+    EMBEDDING_CACHE: Literal["off", "memory", "postgres"] = "off"
+    EMBEDDING_CACHE_MAX_MB: float = 256.0  # in-process LRU budget
+
+    # PDF ingestion: extract → chunk → embed → persist this many pages at a
+    # time, bounding memory by window size (0 = whole document at once)
+    PDF_STREAM_WINDOW_PAGES: int = 0
+    # Whole-document PDF extraction across a process pool (1 = serial);
+    # shorter documents are extracted serially
+    PDF_EXTRACT_WORKERS: int = 1
+    PDF_EXTRACT_MIN_PAGES: int = 32
+
+    # OCR of PDF images (see core/ocr/executor.py): parallel workers
+    # (1 = serial) and seconds allowed per image (0 = no limit)
+    OCR_WORKERS: int = 1
+    OCR_TIMEOUT: float = 60.0
+
+    # OCR result cache keyed by image content (see core/ocr/cache.py):
+    # "off", "memory" (in-process LRU) or "postgres" (LRU + ocr_cache table)
+    OCR_CACHE: Literal["off", "memory", "postgres"] = "off"
+    OCR_CACHE_MAX_ENTRIES: int = 10_000
+
+    # ANN search knobs applied per query (0 = server default): HNSW candidate
+    # list size and IVFFlat lists probed; higher = better recall, slower
+    VECTOR_SEARCH_EF_SEARCH: int = 0
+    VECTOR_SEARCH_PROBES: int = 0
+    # Distance metric of PgVectorStore ("l2", "cosine" or "ip" = inner
+    # product); ANN indexes are built with the matching operator class.
+    # VECTOR_NORMALIZE unit-normalizes vectors on write and query, so "ip"
+    # ranks like cosine at a lower cost per comparison.
+    VECTOR_SEARCH_METRIC: Literal["l2", "cosine", "ip"] = "l2"
+    VECTOR_NORMALIZE: bool = False
+    # Filtered searches: exact search over the matching rows when at most
+    # this many match, otherwise ANN with k * VECTOR_FILTER_OVERFETCH
+    # candidates filtered afterwards
+    VECTOR_FILTER_EXACT_MAX_ROWS: int = 10_000
+    VECTOR_FILTER_OVERFETCH: int = 4
+    # Hybrid (vector + full-text) search: reciprocal rank fusion weights of
+    # each side and the rank offset k in weight / (k + rank)
+    VECTOR_HYBRID_VECTOR_WEIGHT: float = 1.0
+    VECTOR_HYBRID_TEXT_WEIGHT: float = 1.0
+    VECTOR_HYBRID_RRF_K: int = 60
+    # Compact storage: column type of vectors ("halfvec" = 2-byte floats,
+    # applied by migration 20261017_vectors_storage) and, when > 0, ANN
+    # candidates picked by Hamming distance on binary-quantized vectors,
+    # VECTOR_BINARY_RESCORE times k of them, re-ranked by exact distance
+    VECTOR_STORAGE: Literal["vector", "halfvec"] = "vector"
+    VECTOR_BINARY_RESCORE: int = 0
+
+    # Process-wide Postgres connection pool (see core/connection_pool.py)
+    DB_POOL_MIN_SIZE: int = 1
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DB_POOL_MAX_IDLE: float = 300.0  # seconds before an idle connection is closed
+    DB_POOL_MAX_LIFETIME: float = 3600.0  # seconds before a connection is recycled
+    DB_POOL_HEALTH_CHECK: bool = True  # ping connections on checkout
+
+    # Build the default pipeline and validate the vectors schema at app
+    # startup instead of on the first request (fails startup if unmigrated)
+    VALIDATE_SCHEMA_ON_STARTUP: bool = False
+
+    # /v1/ingest/file execution: "inline" processes inside the request,
+    # "queue" spools the upload and lets queue workers process it
+    INGEST_EXECUTION_MODE: Literal["inline", "queue"] = "inline"
+    INGEST_WORKERS: int = 2  # in-process workers in queue mode (0 = external only)
+    INGEST_POLL_INTERVAL: float = 1.0  # seconds between polls of an empty queue
+    INGEST_JOB_LEASE_SECONDS: float = 3600.0  # reclaim "running" jobs after this
+    INGEST_JOB_MAX_ATTEMPTS: int = 3
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -23,6 +103,17 @@ def get_settings() -> Settings:
     return Settings()  # type: ignore[reportCallIssue]
 
 
+_reload_hooks: List[Callable[[], None]] = []
+
+
+def on_settings_reload(hook: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback run by reset_settings_cache (e.g. cache invalidation)."""
+    _reload_hooks.append(hook)
+    return hook
+
+
 def reset_settings_cache():
     """Clear cached settings for testing or reload."""
     get_settings.cache_clear()
+    for hook in _reload_hooks:
+        hook()
@@ -0,0 +1,97 @@
+# src/ingestion_service/core/connection_pool.py
+"""
+Process-wide psycopg connection pools.
+
+PgVectorStore and the ingestion status endpoint borrow connections from
+here instead of opening a new connection (TCP + auth) for every call.
+
+- One pool per DSN, created lazily on first use and shared across threads
+- Sizing, idle timeout, lifetime and health check come from Settings
+- get_pool_metrics() exposes checkout / wait counters for every pool
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional
+
+from psycopg import Connection
+from psycopg.conninfo import conninfo_to_dict
+from psycopg_pool import ConnectionPool
+
+from ingestion_service.core.config import get_settings
+
+_pools: Dict[str, ConnectionPool[Connection[Any]]] = {}
+_lock = threading.Lock()
+
+
+def get_pool(dsn: Optional[str] = None) -> ConnectionPool[Connection[Any]]:
+    """
+    Return the shared pool for a DSN, creating it on first use.
+
+    Defaults to settings.DATABASE_URL.
+    """
+    settings = get_settings()
+    conninfo = dsn or settings.DATABASE_URL
+
+    pool = _pools.get(conninfo)
+    if pool is not None:
+        return pool
+
+    with _lock:
+        pool = _pools.get(conninfo)
+        if pool is None:
+            pool = ConnectionPool(
+                conninfo,
+                connection_class=Connection,
+                min_size=settings.DB_POOL_MIN_SIZE,
+                max_size=settings.DB_POOL_MAX_SIZE,
+                timeout=settings.DB_POOL_TIMEOUT,
+                max_idle=settings.DB_POOL_MAX_IDLE,
+                max_lifetime=settings.DB_POOL_MAX_LIFETIME,
+                check=(
+                    ConnectionPool.check_connection
+                    if settings.DB_POOL_HEALTH_CHECK
+                    else None
+                ),
+                name=_pool_name(conninfo),
+                open=True,
+            )
+            _pools[conninfo] = pool
+        return pool
+
+
+def close_pools() -> None:
+    """Close every pool. The next get_pool() call opens a fresh one."""
+    with _lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Return checkout / wait statistics per pool, keyed by pool name.
+
+    Wraps psycopg_pool's counters, e.g.:
+    - requests_num: connections checked out
+    - requests_waiting: callers currently waiting for a connection
+    - requests_wait_ms: cumulative time spent waiting for a connection
+    - requests_errors: checkouts that timed out or failed
+    - pool_size / pool_available: open and idle connections
+    """
+    with _lock:
+        pools = list(_pools.values())
+
+    return {pool.name: dict(pool.get_stats()) for pool in pools}
+
+
+def _pool_name(conninfo: str) -> str:
+    """Build a credential-free label like 'user@host:5432/dbname'."""
+    params = conninfo_to_dict(conninfo)
+    return (
+        f"{params.get('user', '')}@{params.get('host', '')}:"
+        f"{params.get('port', 5432)}/{params.get('dbname', '')}"
+    )
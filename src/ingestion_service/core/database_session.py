@@ -1,16 +1,31 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from ingestion_service.core.config import get_settings
 
 _engine = None
 _SessionLocal = None
+_checkouts = 0
 
 
 def get_engine():
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_engine(settings.DATABASE_URL, echo=False)
+        # StatusManager's ORM sessions run on SQLAlchemy 1.4 + psycopg2, which
+        # cannot borrow psycopg 3 connections from core/connection_pool.py.
+        # Size and health-check its QueuePool from the same DB_POOL_* settings.
+        _engine = create_engine(
+            settings.DATABASE_URL,
+            echo=False,
+            pool_size=settings.DB_POOL_MAX_SIZE,
+            max_overflow=0,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=int(settings.DB_POOL_MAX_LIFETIME),
+            pool_pre_ping=settings.DB_POOL_HEALTH_CHECK,
+        )
+        event.listen(_engine, "checkout", _count_checkout)
     return _engine
 
 
@@ -23,3 +38,22 @@ def get_sessionmaker():
             autoflush=False,
         )
     return _SessionLocal
+
+
+def get_engine_pool_metrics() -> Dict[str, Any]:
+    """Return checkout statistics for the SQLAlchemy engine pool."""
+    if _engine is None:
+        return {}
+
+    pool = _engine.pool
+    return {
+        "pool_size": pool.size(),  # type: ignore[attr-defined]
+        "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
+        "checked_in": pool.checkedin(),  # type: ignore[attr-defined]
+        "requests_num": _checkouts,
+    }
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    global _checkouts
+    _checkouts += 1
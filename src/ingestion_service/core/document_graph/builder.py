@@ -1,16 +1,14 @@
 # src/ingestion_service/core/document_graph/builder.py
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
-from ingestion_service.core.document_graph.models import (
-    DocumentGraph,
-    GraphEdge,
-    GraphNode,
-)
+from ingestion_service.core.document_graph.models import DocumentGraph
 from ingestion_service.core.extractors.base import ExtractedArtifact
 
+# (source_file, page_number, order_index, type): what an artifact ID encodes
+ArtifactKey = Tuple[str, int, int, str]
+
 
 class DocumentGraphBuilder:
     """
@@ -23,79 +21,65 @@ class DocumentGraphBuilder:
     """
 
     def build(self, artifacts: List[ExtractedArtifact]) -> DocumentGraph:
-        nodes: Dict[str, GraphNode] = {}
-        edges: List[GraphEdge] = []
+        graph = DocumentGraph()
 
         # ---- create nodes ----
+        # Artifacts with the same ID share one node holding the last of
+        # them (e.g. an OCR text artifact placed at the next order_index)
+        node_ids: Dict[ArtifactKey, int] = {}
+        unique: List[ExtractedArtifact] = []
         for artifact in artifacts:
-            artifact_id = self._artifact_id(artifact)
-            nodes[artifact_id] = GraphNode(
-                artifact_id=artifact_id,
-                artifact=artifact,
+            key = (
+                artifact.source_file,
+                artifact.page_number,
+                artifact.order_index,
+                artifact.type,
             )
+            node_id = node_ids.setdefault(key, len(unique))
+            if node_id == len(unique):
+                unique.append(artifact)
+            else:
+                unique[node_id] = artifact
 
         # ---- group by page ----
-        by_page: Dict[int, List[ExtractedArtifact]] = defaultdict(list)
-        for artifact in artifacts:
-            by_page[artifact.page_number].append(artifact)
+        members: List[List[int]] = []
+        for artifact in unique:
+            node_id = graph.add_node(artifact)
+            page = graph.add_page(artifact.source_file, artifact.page_number)
+            if page == len(members):
+                members.append([])
+            members[page].append(node_id)
 
         # ---- associate per page ----
-        for page_number, page_artifacts in by_page.items():
-            page_artifacts.sort(key=lambda a: a.order_index)
-
-            texts = [a for a in page_artifacts if a.type == "text"]
-            images = [a for a in page_artifacts if a.type == "image"]
-
-            # text → page edges
-            for text in texts:
-                edges.append(
-                    GraphEdge(
-                        from_id=self._artifact_id(text),
-                        to_id=self._page_id(text),
-                        relation="text_to_page",
-                    )
-                )
-
-            for image in images:
-                image_id = self._artifact_id(image)
+        for page, page_nodes in enumerate(members):
+            page_nodes.sort(key=lambda n: graph.node(n).artifact.order_index)
+            for node_id in page_nodes:
+                graph.attach(node_id, page)
+            self._associate(graph, page, page_nodes)
 
-                # find nearest following text
-                target_text = next(
-                    (t for t in texts if t.order_index > image.order_index),
-                    None,
-                )
-
-                if target_text:
-                    edges.append(
-                        GraphEdge(
-                            from_id=image_id,
-                            to_id=self._artifact_id(target_text),
-                            relation="image_to_text",
-                        )
-                    )
-                else:
-                    # fallback: image → page
-                    edges.append(
-                        GraphEdge(
-                            from_id=image_id,
-                            to_id=self._page_id(image),
-                            relation="image_to_page",
-                        )
-                    )
-
-        return DocumentGraph(nodes=nodes, edges=edges)
-
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _artifact_id(artifact: ExtractedArtifact) -> str:
-        return (
-            f"{artifact.source_file}:"
-            f"{artifact.page_number}:"
-            f"{artifact.order_index}:"
-            f"{artifact.type}"
-        )
+        return graph
 
     @staticmethod
-    def _page_id(artifact: ExtractedArtifact) -> str:
-        return f"{artifact.source_file}:page:{artifact.page_number}"
+    def _associate(graph: DocumentGraph, page: int, page_nodes: List[int]) -> None:
+        texts = [n for n in page_nodes if graph.node(n).artifact.type == "text"]
+        images = [n for n in page_nodes if graph.node(n).artifact.type == "image"]
+        order = [graph.node(n).artifact.order_index for n in texts]
+
+        # text → page edges
+        for text in texts:
+            graph.add_edge(text, page, "text_to_page")
+
+        # Texts and images are both sorted by order_index, so one merge
+        # pass finds each image's nearest following text: the cursor only
+        # moves forward (O(texts + images) per page).
+        following = 0
+        for image in images:
+            image_order = graph.node(image).artifact.order_index
+            while following < len(texts) and order[following] <= image_order:
+                following += 1
+
+            if following < len(texts):
+                graph.add_edge(image, texts[following], "image_to_text")
+            else:
+                # fallback: image → page
+                graph.add_edge(image, page, "image_to_page")
@@ -1,8 +1,23 @@
 # src/ingestion_service/core/document_graph/models.py
+"""
+DocumentGraph: a document's artifacts and how they relate.
+
+Nodes and pages are interned to dense integer IDs (node i is the i-th
+distinct artifact added, page p the p-th distinct (source_file,
+page_number)). Every artifact has at most one outgoing edge, kept in two
+per-node arrays; incoming edges are adjacency lists per relation type, so
+"images attached to this text" and "artifacts on this page" are O(1).
+
+String IDs ("file.pdf:12:345:text", "file.pdf:page:12") are never stored:
+artifact_id() / page_id() derive them, and the `nodes` / `edges` views
+rebuild the string-keyed form for persistence and debugging.
+"""
+
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import Dict, List, Literal
+from typing import Dict, Iterator, List, Literal, Optional, Sequence, Tuple
 
 from ingestion_service.core.extractors.base import ExtractedArtifact
 
@@ -12,21 +27,199 @@ RelationType = Literal[
     "text_to_page",
 ]
 
+RELATIONS: Tuple[RelationType, ...] = ("image_to_text", "image_to_page", "text_to_page")
+
+# Relations whose target is a page ID rather than a node ID
+PAGE_RELATIONS = frozenset({"image_to_page", "text_to_page"})
+
+NO_EDGE = -1
+
+
+def artifact_id(artifact: ExtractedArtifact) -> str:
+    return (
+        f"{artifact.source_file}:"
+        f"{artifact.page_number}:"
+        f"{artifact.order_index}:"
+        f"{artifact.type}"
+    )
+
+
+def page_id(source_file: str, page_number: int) -> str:
+    return f"{source_file}:page:{page_number}"
+
 
-@dataclass(frozen=True)
 class GraphNode:
-    artifact_id: str
-    artifact: ExtractedArtifact
+    __slots__ = ("node_id", "artifact")
+
+    def __init__(self, node_id: int, artifact: ExtractedArtifact) -> None:
+        self.node_id = node_id
+        self.artifact = artifact
+
+    @property
+    def artifact_id(self) -> str:
+        return artifact_id(self.artifact)
+
+    def __repr__(self) -> str:
+        return f"GraphNode({self.node_id}, {self.artifact_id!r})"
 
 
 @dataclass(frozen=True)
 class GraphEdge:
+    """String form of an edge, as produced by DocumentGraph.edges."""
+
     from_id: str
     to_id: str
     relation: RelationType
 
 
-@dataclass
 class DocumentGraph:
-    nodes: Dict[str, GraphNode]
-    edges: List[GraphEdge]
+    __slots__ = (
+        "_nodes",
+        "_pages",
+        "_page_index",
+        "_page_nodes",
+        "_relation",
+        "_target",
+        "_incoming",
+        "_id_index",
+    )
+
+    def __init__(self) -> None:
+        self._nodes: List[GraphNode] = []
+        self._pages: List[Tuple[str, int]] = []
+        self._page_index: Dict[Tuple[str, int], int] = {}
+        # node IDs per page, in the order they were attached
+        self._page_nodes: List[array] = []
+        # per node: index into RELATIONS of its outgoing edge (or NO_EDGE)
+        # and the target node / page ID
+        self._relation = array("b")
+        self._target = array("i")
+        # relation -> target ID -> source node IDs
+        self._incoming: Dict[RelationType, Dict[int, array]] = {
+            relation: {} for relation in RELATIONS
+        }
+        # artifact ID string -> node ID, built on first lookup
+        self._id_index: Optional[Dict[str, int]] = None
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add_node(self, artifact: ExtractedArtifact) -> int:
+        node_id = len(self._nodes)
+        self._nodes.append(GraphNode(node_id, artifact))
+        self._relation.append(NO_EDGE)
+        self._target.append(NO_EDGE)
+        self._id_index = None
+        return node_id
+
+    def add_page(self, source_file: str, page_number: int) -> int:
+        """Intern a page; returns its ID (the existing one if already added)."""
+        key = (source_file, page_number)
+        page = self._page_index.get(key)
+        if page is None:
+            page = self._page_index[key] = len(self._pages)
+            self._pages.append(key)
+            self._page_nodes.append(array("i"))
+        return page
+
+    def attach(self, node_id: int, page: int) -> None:
+        """Record that `node_id` lies on `page`."""
+        self._page_nodes[page].append(node_id)
+
+    def add_edge(self, from_node: int, to: int, relation: RelationType) -> None:
+        """
+        Add `from_node` -> `to`, where `to` is a page ID for image_to_page /
+        text_to_page and a node ID otherwise. A node has one outgoing edge.
+        """
+        if self._relation[from_node] != NO_EDGE:
+            raise ValueError(f"Node {from_node} already has an outgoing edge")
+        self._relation[from_node] = RELATIONS.index(relation)
+        self._target[from_node] = to
+        self._incoming[relation].setdefault(to, array("i")).append(from_node)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[GraphNode]:
+        return iter(self._nodes)
+
+    def node(self, node_id: int) -> GraphNode:
+        return self._nodes[node_id]
+
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+
+    def page(self, source_file: str, page_number: int) -> Optional[int]:
+        return self._page_index.get((source_file, page_number))
+
+    def artifacts_on_page(self, page: int) -> Sequence[int]:
+        return self._page_nodes[page]
+
+    def images_for_text(self, text_node: int) -> Sequence[int]:
+        return self.sources(text_node, "image_to_text")
+
+    def sources(self, to: int, relation: RelationType) -> Sequence[int]:
+        """Nodes with a `relation` edge to `to` (a node or page ID)."""
+        return self._incoming[relation].get(to, ())
+
+    def outgoing(self, node_id: int) -> Optional[Tuple[RelationType, int]]:
+        """(relation, target ID) of the node's edge, or None."""
+        relation = self._relation[node_id]
+        if relation == NO_EDGE:
+            return None
+        return RELATIONS[relation], self._target[node_id]
+
+    # ------------------------------------------------------------------
+    # String IDs, derived on demand
+    # ------------------------------------------------------------------
+
+    def artifact_id(self, node_id: int) -> str:
+        return artifact_id(self._nodes[node_id].artifact)
+
+    def page_id(self, page: int) -> str:
+        return page_id(*self._pages[page])
+
+    def node_id(self, artifact_id: str) -> int:
+        """Node ID of an artifact ID string; raises KeyError if unknown."""
+        if self._id_index is None:
+            self._id_index = {node.artifact_id: node.node_id for node in self._nodes}
+        return self._id_index[artifact_id]
+
+    @property
+    def nodes(self) -> Dict[str, GraphNode]:
+        """Nodes keyed by artifact ID, in node ID order (built per call)."""
+        return {node.artifact_id: node for node in self._nodes}
+
+    @property
+    def edges(self) -> List[GraphEdge]:
+        """
+        All edges with string IDs (built per call): page by page, the text
+        edges followed by the image edges, each in attach order.
+        """
+        edges: List[GraphEdge] = []
+        for page_nodes in self._page_nodes:
+            texts = [n for n in page_nodes if self._nodes[n].artifact.type == "text"]
+            others = [n for n in page_nodes if self._nodes[n].artifact.type != "text"]
+            for node_id in texts + others:
+                edge = self.outgoing(node_id)
+                if edge is None:
+                    continue
+                relation, to = edge
+                edges.append(
+                    GraphEdge(
+                        from_id=self.artifact_id(node_id),
+                        to_id=(
+                            self.page_id(to)
+                            if relation in PAGE_RELATIONS
+                            else self.artifact_id(to)
+                        ),
+                        relation=relation,
+                    )
+                )
+        return edges
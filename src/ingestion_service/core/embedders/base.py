@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from ingestion_service.core.chunks import Chunk
 
@@ -9,6 +9,9 @@ class BaseEmbedder(ABC):
     """Abstract interface for embedding chunk content."""
 
     name: str = "base"
+    # Longest input, in tokens, the model reads without truncating; None
+    # when unknown or unlimited
+    max_tokens: Optional[int] = None
 
     @abstractmethod
     def embed(self, chunks: List[Chunk]) -> List[List[float]]:
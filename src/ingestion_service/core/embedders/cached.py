@@ -0,0 +1,274 @@
+# src/ingestion_service/core/embedders/cached.py
+"""
+Content-addressed embedding cache in front of any BaseEmbedder.
+
+Identical chunk texts (re-uploads, repeated headers/footers, OCR'd logos)
+are embedded once. Entries are keyed by
+sha256(provider, model, normalized text) and looked up in two tiers:
+
+1. EmbeddingLRU: in-process, bounded by a byte budget (float32 vectors)
+2. PgEmbeddingCacheStore: optional, shared across processes and restarts
+   (table ingestion_service.embedding_cache)
+
+Only the misses are sent to the wrapped embedder, in a single embed() call,
+with duplicate texts within a call embedded once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import psycopg
+from pgvector import Vector
+from pgvector.psycopg import register_vector
+from psycopg import sql
+from psycopg_pool import ConnectionPool
+
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.connection_pool import get_pool
+from ingestion_service.core.embedders.base import BaseEmbedder
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Per-entry OrderedDict bookkeeping (hash table slot and ordering link);
+# the key and vector objects are measured with sys.getsizeof
+_ENTRY_OVERHEAD_BYTES = 100
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace so trivial variants share a key."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(provider: str, model: str, text: str) -> bytes:
+    digest = hashlib.sha256()
+    for part in (provider, model, normalize_text(text)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+class EmbeddingLRU:
+    """
+    Thread-safe LRU of key -> vector, evicting once max_bytes is exceeded.
+
+    Vectors are kept as array("f"): 4 bytes per dimension, the precision
+    pgvector stores them at, instead of a list of boxed Python floats
+    (~32 bytes per dimension). get_many() returns fresh lists.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, array] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, List[float]]:
+        found: Dict[bytes, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector.tolist()
+        return found
+
+    def put_many(self, items: Dict[bytes, List[float]]) -> None:
+        with self._lock:
+            for key, vector in items.items():
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    continue
+                stored = array("f", vector)
+                self._entries[key] = stored
+                self._bytes += self._entry_size(key, stored)
+
+            while self._bytes > self._max_bytes and self._entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._entry_size(evicted_key, evicted)
+
+    @staticmethod
+    def _entry_size(key: bytes, vector: array) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(vector) + _ENTRY_OVERHEAD_BYTES
+
+
+class PgEmbeddingCacheStore:
+    """Persistent cache tier in ingestion_service.embedding_cache."""
+
+    SCHEMA = "ingestion_service"
+    TABLE_NAME = "embedding_cache"
+
+    def __init__(self, dsn: str, pool: Optional[ConnectionPool] = None) -> None:
+        self._dsn = dsn
+        self._pool = pool
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, List[float]]:
+        if not keys:
+            return {}
+        select_sql = sql.SQL(
+            "SELECT cache_key, embedding FROM {schema}.{table} "
+            "WHERE cache_key = ANY(%s)"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+        )
+        with self._connection() as conn:
+            self._register_vector_types(conn)
+            with conn.cursor() as cur:
+                cur.execute(select_sql, (list(keys),))
+                return {bytes(key): vector.to_list() for key, vector in cur}
+
+    def put_many(
+        self, items: Dict[bytes, List[float]], *, provider: str, model: str
+    ) -> None:
+        if not items:
+            return
+        insert_sql = sql.SQL(
+            "INSERT INTO {schema}.{table} (cache_key, provider, model, embedding) "
+            "VALUES (%s, %s, %s, %s) ON CONFLICT (cache_key) DO NOTHING"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+        )
+        with self._connection() as conn:
+            self._register_vector_types(conn)
+            with conn.cursor() as cur:
+                cur.executemany(
+                    insert_sql,
+                    [
+                        (key, provider, model, Vector(vector))
+                        for key, vector in items.items()
+                    ],
+                )
+
+    def _connection(self) -> AbstractContextManager[psycopg.Connection]:
+        return (self._pool or get_pool(self._dsn)).connection()
+
+    @staticmethod
+    def _register_vector_types(conn: psycopg.Connection) -> None:
+        if conn.adapters.types.get("vector") is None:
+            register_vector(conn)
+
+
+class CachedEmbedder(BaseEmbedder):
+    """Wraps an embedder with the memory (and optional persistent) cache tiers."""
+
+    def __init__(
+        self,
+        inner: BaseEmbedder,
+        *,
+        memory: Optional[EmbeddingLRU] = None,
+        persistent: Optional[PgEmbeddingCacheStore] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        self._inner = inner
+        self._memory = memory
+        self._persistent = persistent
+        self.name = inner.name
+        self.max_tokens = inner.max_tokens
+        self.model = model or getattr(inner, "model", None) or inner.name
+
+        self._stats_lock = threading.Lock()
+        self._lookups = 0
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+    @property
+    def inner(self) -> BaseEmbedder:
+        return self._inner
+
+    @property
+    def dimension(self) -> int:
+        return getattr(self._inner, "dimension", 3)
+
+    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
+        keys = [cache_key(self.name, self.model, chunk.content) for chunk in chunks]
+        unique_keys = list(dict.fromkeys(keys))
+
+        found: Dict[bytes, List[float]] = (
+            self._memory.get_many(unique_keys) if self._memory is not None else {}
+        )
+        memory_hits = len(found)
+
+        pending = [key for key in unique_keys if key not in found]
+        persistent_found = self._persistent_get(pending)
+        if persistent_found and self._memory is not None:
+            self._memory.put_many(persistent_found)
+        found.update(persistent_found)
+
+        # First chunk per missing key; duplicates reuse its embedding
+        first_chunk: Dict[bytes, Chunk] = {}
+        for key, chunk in zip(keys, chunks):
+            if key not in found:
+                first_chunk.setdefault(key, chunk)
+
+        if first_chunk:
+            vectors = self._inner.embed(list(first_chunk.values()))
+            computed = dict(zip(first_chunk.keys(), vectors))
+            if self._memory is not None:
+                self._memory.put_many(computed)
+            self._persistent_put(computed)
+            found.update(computed)
+
+        with self._stats_lock:
+            self._lookups += len(unique_keys)
+            self._memory_hits += memory_hits
+            self._persistent_hits += len(persistent_found)
+            self._misses += len(first_chunk)
+
+        return [found[key] for key in keys]
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters since creation (per unique text per embed call)."""
+        with self._stats_lock:
+            hits = self._memory_hits + self._persistent_hits
+            return {
+                "lookups": self._lookups,
+                "memory_hits": self._memory_hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_rate": hits / self._lookups if self._lookups else 0.0,
+                "memory_entries": len(self._memory) if self._memory is not None else 0,
+                "memory_bytes": self._memory.size_bytes
+                if self._memory is not None
+                else 0,
+            }
+
+    # ---------------------------------------------------------
+    # Persistent tier: errors degrade to cache misses
+    # ---------------------------------------------------------
+    def _persistent_get(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        if self._persistent is None or not keys:
+            return {}
+        try:
+            return self._persistent.get_many(keys)
+        except psycopg.Error as exc:
+            logger.warning("Embedding cache lookup failed: %s", exc)
+            return {}
+
+    def _persistent_put(self, items: Dict[bytes, List[float]]) -> None:
+        if self._persistent is None:
+            return
+        try:
+            self._persistent.put_many(items, provider=self.name, model=self.model)
+        except psycopg.Error as exc:
+            logger.warning("Embedding cache write failed: %s", exc)
@@ -1,4 +1,10 @@
 # src/ingestion_service/core/embedders/factory.py
+from ingestion_service.core.embedders.base import BaseEmbedder
+from ingestion_service.core.embedders.cached import (
+    CachedEmbedder,
+    EmbeddingLRU,
+    PgEmbeddingCacheStore,
+)
 from ingestion_service.core.embedders.mock import MockEmbedder
 from ingestion_service.core.embedders.ollama import OllamaEmbedder
 from ingestion_service.core.config import get_settings
@@ -13,6 +19,8 @@ def get_embedder(provider: str | None = None):
 
     - If provider is "ollama", returns OllamaEmbedder
     - Otherwise, returns MockEmbedder
+
+    Wrapped in a CachedEmbedder unless EMBEDDING_CACHE is "off".
     """
     logging.debug("get_embedder provider %s", provider)
     settings = get_settings()
@@ -25,15 +33,33 @@ def get_embedder(provider: str | None = None):
     if provider_str == "ollama":
         logging.debug("settings.OLLAMA_BASE_URL : %s", settings.OLLAMA_BASE_URL)
         logging.debug("settings.OLLAMA_EMBED_MODEL : %s", settings.OLLAMA_EMBED_MODEL)
-        return OllamaEmbedder(
+        embedder: BaseEmbedder = OllamaEmbedder(
             base_url=settings.OLLAMA_BASE_URL,
             model=settings.OLLAMA_EMBED_MODEL,
             batch_size=settings.OLLAMA_BATCH_SIZE,
+            max_concurrency=settings.OLLAMA_MAX_CONCURRENCY,
+            max_retries=settings.OLLAMA_MAX_RETRIES,
+            retry_backoff=settings.OLLAMA_RETRY_BACKOFF,
+            timeout=settings.OLLAMA_TIMEOUT,
+            max_tokens=settings.OLLAMA_MAX_TOKENS,
         )
     elif provider_str == "mock":  # ← EXPLICIT
-        return MockEmbedder()
+        embedder = MockEmbedder()
     else:
         raise ValueError(
             f"Unknown embedder provider: '{provider_str}'.\
                           Valid: {VALID_PROVIDERS}"
         )
+
+    if settings.EMBEDDING_CACHE == "off":
+        return embedder
+
+    return CachedEmbedder(
+        embedder,
+        memory=EmbeddingLRU(int(settings.EMBEDDING_CACHE_MAX_MB * 1024 * 1024)),
+        persistent=(
+            PgEmbeddingCacheStore(dsn=settings.DATABASE_URL)
+            if settings.EMBEDDING_CACHE == "postgres"
+            else None
+        ),
+    )
@@ -1,22 +1,66 @@
 # src/ingestion_service/core/embedders/ollama.py
 import requests
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+from requests.adapters import HTTPAdapter
+
 from ingestion_service.core.embedders.base import BaseEmbedder
 from ingestion_service.core.chunks import Chunk
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Transient server-side conditions worth retrying (overloaded / restarting)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class OllamaEmbedder(BaseEmbedder):
+    """
+    Embeds chunks through Ollama's /api/embed endpoint.
+
+    Inputs are split into batches of `batch_size` texts. Up to
+    `max_concurrency` batches are in flight at once over a shared keep-alive
+    session; results are returned in input order. Each batch is retried
+    independently (exponential backoff) on connection errors, timeouts and
+    RETRYABLE_STATUS_CODES.
+    """
+
     name = "ollama"
     dimension = 768
 
-    def __init__(self, base_url: str, model: str, batch_size: int = 50):
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        timeout: float = 120.0,
+        max_tokens: int = 2048,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.max_tokens = max_tokens
+
+        # One connection per in-flight batch, kept alive across embed() calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         logging.debug("OllamaEmbedder self.base_url %s", self.base_url)
         logging.debug("OllamaEmbedder self.model %s", self.model)
 
@@ -27,24 +71,79 @@ class OllamaEmbedder(BaseEmbedder):
             [type(c).__name__ for c in chunks[:3]],
         )
         texts = [chunk.content for chunk in chunks]
+        if not texts:
+            return []
+
+        batches = [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        logging.debug(
+            "OllamaEmbedder starting embedding: %d batch(es), concurrency %d",
+            len(batches),
+            self.max_concurrency,
+        )
+
         try:
-            payload = {"model": self.model, "input": texts}
-            logging.debug("OllamaEmbedder.embed payload %s", payload)
-            logging.debug("OllamaEmbedder starting embedding")
-            response = requests.post(f"{self.base_url}/api/embed", json=payload)
-            logging.debug("OllamaEmbedder finished embedding")
-            logging.debug("OllamaEmbedder response: %s", response)
-            if response.status_code != 200:
-                raise RuntimeError(
+            if len(batches) == 1 or self.max_concurrency == 1:
+                results = [self._embed_batch(batch) for batch in batches]
+            else:
+                workers = min(self.max_concurrency, len(batches))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="ollama-embed"
+                ) as executor:
+                    # map() yields in submission order, so batches reassemble
+                    # in input order whatever order they complete in
+                    results = list(executor.map(self._embed_batch, batches))
+        except Exception as e:
+            raise RuntimeError(f"Ollama embedder error: {e}") from e
+
+        logging.debug("OllamaEmbedder finished embedding")
+        return [vector for batch in results for vector in batch]
+
+    def close(self) -> None:
+        self._session.close()
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        payload = {"model": self.model, "input": texts}
+        attempt = 0
+        while True:
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/api/embed", json=payload, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error: Exception = exc
+            else:
+                if response.status_code == 200:
+                    embeddings = response.json().get("embeddings", [])
+                    if len(embeddings) != len(texts):
+                        raise RuntimeError(
+                            f"Ollama returned {len(embeddings)} embeddings "
+                            f"for {len(texts)} inputs"
+                        )
+                    return embeddings
+
+                error = RuntimeError(
                     f"Ollama embedding failed "
                     f"(status={response.status_code}): {response.text}"
                 )
-            result = response.json()
-            logging.debug("OllamaEmbedder response.json: %s", result)
-            return (
-                result.get("embeddings", [result["embeddings"]])
-                if isinstance(texts, list)
-                else [result["embeddings"]]
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise error
+
+            if attempt >= self.max_retries:
+                raise error
+
+            delay = self.retry_backoff * (2**attempt)
+            attempt += 1
+            logging.warning(
+                "OllamaEmbedder batch failed (%s); retry %d/%d in %.2fs",
+                error,
+                attempt,
+                self.max_retries,
+                delay,
             )
-        except Exception as e:
-            raise RuntimeError(f"Ollama embedder error: {e}") from e
+            time.sleep(delay)
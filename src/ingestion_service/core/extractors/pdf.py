@@ -1,12 +1,33 @@
 # src/ingestion_service/core/extractors/pdf.py
 from __future__ import annotations
-from typing import List, Tuple
+import dataclasses
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
 import fitz  # PyMuPDF
 
 from ingestion_service.core.extractors.base import DocumentExtractor, ExtractedArtifact
+from ingestion_service.core.process_pools import submit_to_process_pool
 
 
 class PDFExtractor(DocumentExtractor):
+    """
+    Extracts text blocks and images from PDFs with PyMuPDF.
+
+    With workers > 1, documents of at least min_parallel_pages pages are
+    split into contiguous page ranges extracted in a shared process pool.
+    Each worker opens the document from a temp file rather than receiving
+    the bytes, and results are renumbered into the same order_index
+    sequence the serial path produces.
+    """
+
+    def __init__(self, workers: int = 1, min_parallel_pages: int = 32) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.min_parallel_pages = min_parallel_pages
+
     def extract(self, file_bytes: bytes, source_name: str) -> List[ExtractedArtifact]:
         """
         Extracts text blocks and images from a PDF.
@@ -18,61 +39,198 @@ class PDFExtractor(DocumentExtractor):
         Returns:
             List of ExtractedArtifact objects.
         """
-        artifacts: List[ExtractedArtifact] = []
+        if self.workers > 1:
+            page_count = _page_count(file_bytes)
+            if page_count >= max(self.min_parallel_pages, 2):
+                return self._extract_parallel(file_bytes, source_name, page_count)
+
+        return [
+            artifact
+            for page_artifacts in self.iter_pages(file_bytes, source_name)
+            for artifact in page_artifacts
+        ]
+
+    def iter_pages(
+        self, file_bytes: bytes, source_name: str
+    ) -> Iterator[List[ExtractedArtifact]]:
+        """
+        Yields the artifacts of one page at a time, in page order.
+
+        order_index runs across the whole document, so concatenating the
+        yielded lists gives exactly what extract() returns. Only the current
+        page's text and image bytes are held by the extractor.
+        """
+        doc = _open(file_bytes)
         order_index = 0
+        images = _XrefImages()
+        try:
+            for page_idx in range(len(doc)):
+                artifacts = _page_artifacts(
+                    doc, page_idx, source_name, order_index, images
+                )
+                order_index += len(artifacts)
+                yield artifacts
+        finally:
+            doc.close()
+
+    # ------------------------------------------------------------------
+    # Parallel extraction
+    # ------------------------------------------------------------------
+    def _extract_parallel(
+        self, file_bytes: bytes, source_name: str, page_count: int
+    ) -> List[ExtractedArtifact]:
+        workers = min(self.workers, page_count)
+        # Contiguous ranges, one per worker, so results concatenate in order
+        step, extra = divmod(page_count, workers)
+        ranges: List[Tuple[int, int]] = []
+        start = 0
+        for index in range(workers):
+            stop = start + step + (1 if index < extra else 0)
+            ranges.append((start, stop))
+            start = stop
 
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+            handle.write(file_bytes)
+            path = handle.name
         try:
-            doc = fitz.open(stream=file_bytes, filetype="pdf")
-        except Exception as exc:
-            raise ValueError("Invalid or unreadable PDF") from exc
-
-        for page_idx in range(len(doc)):
-            page = doc[page_idx]
-            page_number = page_idx + 1
-
-            # ---- TEXT BLOCKS ----
-            for block in page.get_text("blocks"):
-                x0, y0, x1, y1, text, *_ = block
-                if not text or not text.strip():
-                    continue
-
-                # Ensure bbox values are floats
-                bbox: Tuple[float, float, float, float] = (
-                    float(x0),
-                    float(y0),
-                    float(x1),
-                    float(y1),
+            futures = [
+                submit_to_process_pool(
+                    "pdf_extract",
+                    self.workers,
+                    _extract_page_range,
+                    path,
+                    start,
+                    stop,
+                    source_name,
                 )
+                for start, stop in ranges
+            ]
+            pages = [page for future in futures for page in future.result()]
+        finally:
+            os.unlink(path)
 
+        # Workers number each page from 0; restore the document-wide sequence
+        artifacts: List[ExtractedArtifact] = []
+        for page_artifacts in pages:
+            for artifact in page_artifacts:
                 artifacts.append(
-                    ExtractedArtifact(
-                        type="text",
-                        source_file=source_name,
-                        page_number=page_number,
-                        order_index=order_index,
-                        text=str(text).strip(),
-                        bbox=bbox,
-                    )
+                    dataclasses.replace(artifact, order_index=len(artifacts))
                 )
-                order_index += 1
+        return artifacts
 
-            # ---- IMAGES ----
-            for img in page.get_images(full=True):
-                xref = img[0]
-                image_dict = doc.extract_image(xref)
-                image_bytes = image_dict.get("image")
-                if not image_bytes:
-                    continue
 
-                artifacts.append(
-                    ExtractedArtifact(
-                        type="image",
-                        source_file=source_name,
-                        page_number=page_number,
-                        order_index=order_index,
-                        image_bytes=image_bytes,
-                    )
-                )
-                order_index += 1
+# ---------------------------------------------------------------------------
+# Page extraction (module level so process-pool workers can import it)
+# ---------------------------------------------------------------------------
 
-        return artifacts
+
+def _open(file_bytes: bytes) -> fitz.Document:
+    try:
+        return fitz.open(stream=file_bytes, filetype="pdf")
+    except Exception as exc:
+        raise ValueError("Invalid or unreadable PDF") from exc
+
+
+def _page_count(file_bytes: bytes) -> int:
+    doc = _open(file_bytes)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+
+class _XrefImages:
+    """
+    Recently extracted images by xref.
+
+    A logo or letterhead is one xref referenced from every page; remembering
+    the last few avoids re-extracting it, and its artifacts share a single
+    bytes object (pickled once when returned from a process-pool worker).
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self._max_entries = max_entries
+        self._images: OrderedDict[int, Optional[bytes]] = OrderedDict()
+
+    def get(self, doc: fitz.Document, xref: int) -> Optional[bytes]:
+        if xref in self._images:
+            self._images.move_to_end(xref)
+            return self._images[xref]
+
+        image_bytes = doc.extract_image(xref).get("image")
+        self._images[xref] = image_bytes
+        if len(self._images) > self._max_entries:
+            self._images.popitem(last=False)
+        return image_bytes
+
+
+def _page_artifacts(
+    doc: fitz.Document,
+    page_idx: int,
+    source_name: str,
+    order_index: int,
+    images: _XrefImages,
+) -> List[ExtractedArtifact]:
+    page = doc[page_idx]
+    page_number = page_idx + 1
+    artifacts: List[ExtractedArtifact] = []
+
+    # ---- TEXT BLOCKS ----
+    for block in page.get_text("blocks"):
+        x0, y0, x1, y1, text, *_ = block
+        if not text or not text.strip():
+            continue
+
+        # Ensure bbox values are floats
+        bbox: Tuple[float, float, float, float] = (
+            float(x0),
+            float(y0),
+            float(x1),
+            float(y1),
+        )
+
+        artifacts.append(
+            ExtractedArtifact(
+                type="text",
+                source_file=source_name,
+                page_number=page_number,
+                order_index=order_index,
+                text=str(text).strip(),
+                bbox=bbox,
+            )
+        )
+        order_index += 1
+
+    # ---- IMAGES ----
+    for img in page.get_images(full=True):
+        image_bytes = images.get(doc, img[0])
+        if not image_bytes:
+            continue
+
+        artifacts.append(
+            ExtractedArtifact(
+                type="image",
+                source_file=source_name,
+                page_number=page_number,
+                order_index=order_index,
+                image_bytes=image_bytes,
+            )
+        )
+        order_index += 1
+
+    return artifacts
+
+
+def _extract_page_range(
+    path: str, start: int, stop: int, source_name: str
+) -> List[List[ExtractedArtifact]]:
+    """Worker entry point: artifacts of pages [start, stop), per page."""
+    doc = fitz.open(path)
+    images = _XrefImages()
+    try:
+        return [
+            _page_artifacts(doc, idx, source_name, 0, images)
+            for idx in range(start, stop)
+        ]
+    finally:
+        doc.close()
@@ -0,0 +1,296 @@
+# src/ingestion_service/core/file_ingestion.py
+"""
+File ingestion shared by the inline /v1/ingest/file path and queue workers.
+
+- PDFs: extract → document graph → chunk assembly → embed → persist (MS4),
+  either for the whole document or PDF_STREAM_WINDOW_PAGES pages at a time
+- Images: OCR → text pipeline
+- Everything else: UTF-8 text pipeline
+
+Errors for uploads without usable content are raised as ValueError
+subclasses so callers can map them to HTTP 400 or a failed job status.
+
+Re-ingestion: uploads are identified by content_hash() and document_key().
+Callers skip an upload whose content hash matches a completed ingestion
+(find_previous_ingestion) and, for uploads naming a document_id, pass that
+document's previous ingestion as previous_ingestion_id, so only new or
+changed chunks are embedded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from ingestion_service.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.config import get_settings
+from ingestion_service.core.document_graph.builder import DocumentGraphBuilder
+from ingestion_service.core.extractors.base import ExtractedArtifact
+from ingestion_service.core.extractors.pdf import PDFExtractor
+from ingestion_service.core.ocr.ocr_factory import get_ocr_engine
+from ingestion_service.core.pipeline import IngestionPipeline
+from ingestion_service.core.status_manager import StatusManager
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+ArtifactTransform = Callable[[List[ExtractedArtifact]], List[ExtractedArtifact]]
+
+
+class UnreadableFileError(ValueError):
+    """The upload could not be decoded."""
+
+
+class NoExtractableContentError(ValueError):
+    """The upload decoded fine but produced no text to ingest."""
+
+
+def is_pdf(filename: str, content_type: str) -> bool:
+    return filename.endswith(".pdf") or content_type == "application/pdf"
+
+
+def is_image(filename: str, content_type: str) -> bool:
+    return content_type.startswith("image/") or filename.endswith(IMAGE_EXTENSIONS)
+
+
+def source_type_for(filename: str, content_type: str) -> str:
+    if is_pdf(filename, content_type):
+        return "file"
+    return "image" if is_image(filename, content_type) else "file"
+
+
+def content_hash(file_bytes: bytes, provider: str) -> str:
+    """
+    SHA-256 identifying an upload as embedded by `provider`.
+
+    The provider is part of the hash: the same bytes embedded by another
+    provider produce different vectors and must be ingested again.
+    """
+    digest = hashlib.sha256(provider.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(file_bytes)
+    return digest.hexdigest()
+
+
+def document_key(metadata: Dict[str, Any], provider: str) -> Optional[str]:
+    """
+    Which document an upload is a version of, as embedded by `provider`:
+    built from metadata["document_id"], or None. Versioning is opt-in; a
+    filename is not an identity, since unrelated uploads often share one,
+    and a new version replaces the previous one's vectors.
+
+    As in content_hash(), the provider is part of the key: chunks embedded
+    by another provider cannot be kept, so a version uploaded after the
+    provider changed has no previous version and is embedded in full.
+    """
+    document_id = metadata.get("document_id")
+    return f"{provider}:{document_id}" if document_id else None
+
+
+def find_previous_ingestion(
+    manager: StatusManager,
+    pipeline: IngestionPipeline,
+    *,
+    content_hash: Optional[str] = None,
+    document_key: Optional[str] = None,
+) -> Optional[UUID]:
+    """
+    Latest completed ingestion with this content hash or document key whose
+    chunks are still in the vector store (vectors deleted since do not count).
+    """
+    request = manager.find_completed(
+        content_hash=content_hash, document_key=document_key
+    )
+    if request is None or not pipeline.stored_digests(str(request.ingestion_id)):
+        return None
+    return request.ingestion_id
+
+
+def token_budget_of(pipeline: IngestionPipeline) -> Optional[int]:
+    """The pipeline's chunk token budget; None for pipelines without one."""
+    return getattr(pipeline, "token_budget", None)
+
+
+def build_pdf_chunks(
+    file_bytes: bytes, filename: str, token_budget: Optional[int] = None
+) -> List[Chunk]:
+    """Extract, graph and chunk a PDF (MS4 always-on)."""
+    settings = get_settings()
+    extractor = PDFExtractor(
+        workers=settings.PDF_EXTRACT_WORKERS,
+        min_parallel_pages=settings.PDF_EXTRACT_MIN_PAGES,
+    )
+    artifacts = extractor.extract(file_bytes=file_bytes, source_name=filename)
+    graph = DocumentGraphBuilder().build(artifacts)
+    return PDFChunkAssembler(token_budget).assemble(graph)
+
+
+def iter_pdf_chunk_windows(
+    file_bytes: bytes,
+    filename: str,
+    window_pages: int,
+    transform: Optional[ArtifactTransform] = None,
+    token_budget: Optional[int] = None,
+) -> Iterator[List[Chunk]]:
+    """
+    Yield the chunks of `window_pages` pages at a time.
+
+    Graph edges never cross pages, so each window is built and assembled on
+    its own; the concatenated windows equal build_pdf_chunks() (same chunk
+    IDs, same order). Only one window's artifacts, including image bytes,
+    are alive at once. `transform` runs on each window's artifacts before
+    graph building (e.g. OCR expansion).
+    """
+    if window_pages < 1:
+        raise ValueError("window_pages must be >= 1")
+
+    pages = PDFExtractor().iter_pages(file_bytes=file_bytes, source_name=filename)
+    builder = DocumentGraphBuilder()
+    assembler = PDFChunkAssembler(token_budget)
+
+    while window := list(islice(pages, window_pages)):
+        artifacts = [artifact for page in window for artifact in page]
+        if transform is not None:
+            artifacts = transform(artifacts)
+        yield assembler.assemble(builder.build(artifacts))
+
+
+def persist_chunk_windows(
+    pipeline: IngestionPipeline,
+    windows: Iterator[List[Chunk]],
+    ingestion_id: str,
+) -> int:
+    """Embed and persist each window as it arrives; returns the chunk count."""
+    persisted = 0
+    for chunks in windows:
+        if not chunks:
+            continue
+        embeddings = pipeline._embed(chunks)
+        pipeline._persist(
+            chunks=chunks,
+            embeddings=embeddings,
+            ingestion_id=ingestion_id,
+            start_index=persisted,
+        )
+        persisted += len(chunks)
+    return persisted
+
+
+def persist_pdf_version(
+    pipeline: IngestionPipeline,
+    file_bytes: bytes,
+    filename: str,
+    window_pages: int,
+    ingestion_id: str,
+    previous_ingestion_id: str,
+) -> int:
+    """
+    Store a PDF as a new version of previous_ingestion_id.
+
+    The diff needs every chunk at once, so streamed windows are collected
+    first; only their (text) chunks are kept, each window's images are
+    still released as it is consumed. Returns the number of chunks embedded.
+    """
+    if window_pages > 0:
+        windows = iter_pdf_chunk_windows(
+            file_bytes, filename, window_pages, token_budget=token_budget_of(pipeline)
+        )
+        chunks = list(chain.from_iterable(windows))
+    else:
+        chunks = build_pdf_chunks(file_bytes, filename, token_budget_of(pipeline))
+    if not chunks:
+        raise NoExtractableContentError("No extractable text found in uploaded PDF")
+
+    return pipeline._persist_changes(chunks, ingestion_id, previous_ingestion_id)
+
+
+def extract_text(
+    file_bytes: bytes,
+    filename: str,
+    content_type: str,
+    ocr_provider: Optional[str] = None,
+) -> str:
+    """
+    Returns extracted text from a non-PDF file. Uses OCR if file is an image.
+    """
+    if is_image(filename, content_type):
+        ocr_engine = get_ocr_engine(ocr_provider or "tesseract")
+        return ocr_engine.extract_text(file_bytes) or ""
+
+    try:
+        return file_bytes.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise UnreadableFileError("Unable to read uploaded text file as UTF-8") from exc
+
+
+def ingest_file_bytes(
+    pipeline: IngestionPipeline,
+    *,
+    file_bytes: bytes,
+    filename: str,
+    content_type: str,
+    ingestion_id: str,
+    provider: str,
+    ocr_provider: Optional[str] = None,
+    previous_ingestion_id: Optional[str] = None,
+) -> None:
+    """
+    Run the full ingestion for one uploaded file.
+
+    With previous_ingestion_id the file is stored as a new version of that
+    ingestion, embedding only new or changed chunks.
+    """
+    if is_pdf(filename, content_type):
+        window_pages = get_settings().PDF_STREAM_WINDOW_PAGES
+        if previous_ingestion_id is not None:
+            persist_pdf_version(
+                pipeline,
+                file_bytes,
+                filename,
+                window_pages,
+                ingestion_id,
+                previous_ingestion_id,
+            )
+            return
+        if window_pages > 0:
+            persisted = persist_chunk_windows(
+                pipeline,
+                iter_pdf_chunk_windows(
+                    file_bytes,
+                    filename,
+                    window_pages,
+                    token_budget=token_budget_of(pipeline),
+                ),
+                ingestion_id,
+            )
+            if not persisted:
+                raise NoExtractableContentError(
+                    "No extractable text found in uploaded PDF"
+                )
+            return
+
+        chunks = build_pdf_chunks(file_bytes, filename, token_budget_of(pipeline))
+        if not chunks:
+            raise NoExtractableContentError("No extractable text found in uploaded PDF")
+
+        embeddings = pipeline._embed(chunks)
+        pipeline._persist(
+            chunks=chunks,
+            embeddings=embeddings,
+            ingestion_id=ingestion_id,
+        )
+        return
+
+    text = extract_text(file_bytes, filename, content_type, ocr_provider)
+    if not text.strip():
+        raise NoExtractableContentError("No extractable text found in uploaded file")
+
+    pipeline.run(
+        text=text,
+        ingestion_id=ingestion_id,
+        source_type=source_type_for(filename, content_type),
+        provider=provider,
+        previous_ingestion_id=previous_ingestion_id,
+    )
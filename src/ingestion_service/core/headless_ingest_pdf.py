@@ -1,12 +1,19 @@
 # src/ingestion_service/core/headless_ingest_pdf.py
 from __future__ import annotations
-from typing import List
+from typing import Iterator, List, Optional
 from ingestion_service.core.extractors.pdf import PDFExtractor
 from ingestion_service.core.document_graph.builder import DocumentGraphBuilder
 from ingestion_service.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
 from ingestion_service.core.pipeline import IngestionPipeline
 from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.config import get_settings
 from ingestion_service.core.extractors.base import ExtractedArtifact
+from ingestion_service.core.ocr.executor import OCRExecutor
+from ingestion_service.core.file_ingestion import (
+    iter_pdf_chunk_windows,
+    persist_chunk_windows,
+    token_budget_of,
+)
 
 
 class HeadlessPDFIngestor:
@@ -19,9 +26,22 @@ class HeadlessPDFIngestor:
     - Persists embeddings to vector store
     """
 
-    def __init__(self, pipeline: IngestionPipeline, ocr_provider: str = "default"):
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        ocr_provider: str = "default",
+        ocr_executor: Optional[OCRExecutor] = None,
+    ):
         self.pipeline = pipeline
         self.ocr_provider = ocr_provider
+        if ocr_executor is None:
+            settings = get_settings()
+            ocr_executor = OCRExecutor(
+                ocr_provider,
+                workers=settings.OCR_WORKERS,
+                timeout=settings.OCR_TIMEOUT,
+            )
+        self.ocr_executor = ocr_executor
 
     def _run_ocr_and_expand_artifacts(
         self, artifacts: List[ExtractedArtifact]
@@ -33,34 +53,39 @@ class HeadlessPDFIngestor:
         """
         enriched: List[ExtractedArtifact] = []
 
-        for artifact in artifacts:
+        # OCR all images up front (possibly in parallel), order preserved
+        with_ocr = self.ocr_executor.enrich(artifacts)
+
+        for artifact, image_with_ocr in zip(artifacts, with_ocr):
             enriched.append(artifact)
 
-            if artifact.type == "image" and artifact.image_bytes:
-                # Run OCR on image
-                from ingestion_service.core.ocr.utils import enrich_image_with_ocr
-
-                image_with_ocr = enrich_image_with_ocr(artifact, self.ocr_provider)
-
-                if image_with_ocr.ocr_text:
-                    # Create a synthetic text artifact representing the OCR text
-                    # Keep the same page but a slightly greater order_index
-                    ocr_artifact = ExtractedArtifact(
-                        type="text",
-                        source_file=image_with_ocr.source_file,
-                        page_number=image_with_ocr.page_number,
-                        order_index=artifact.order_index
-                        + 1,  # deterministic after image
-                        text=image_with_ocr.ocr_text,
-                        image_bytes=None,
-                    )
-                    enriched.append(ocr_artifact)
+            if artifact.type == "image" and image_with_ocr.ocr_text:
+                # Create a synthetic text artifact representing the OCR text
+                # Keep the same page but a slightly greater order_index
+                ocr_artifact = ExtractedArtifact(
+                    type="text",
+                    source_file=image_with_ocr.source_file,
+                    page_number=image_with_ocr.page_number,
+                    order_index=artifact.order_index + 1,  # deterministic after image
+                    text=image_with_ocr.ocr_text,
+                    image_bytes=None,
+                )
+                enriched.append(ocr_artifact)
 
         return enriched
 
     def ingest_pdf(
-        self, file_bytes: bytes, source_name: str, ingestion_id: str
+        self,
+        file_bytes: bytes,
+        source_name: str,
+        ingestion_id: str,
+        window_pages: int = 0,
     ) -> List[Chunk]:
+        if window_pages > 0:
+            return self._ingest_pdf_windows(
+                file_bytes, source_name, ingestion_id, window_pages
+            )
+
         # 1️⃣ Extract artifacts from PDF bytes
         extractor = PDFExtractor()
         artifacts = extractor.extract(file_bytes, source_name)
@@ -73,7 +98,7 @@ class HeadlessPDFIngestor:
         doc_graph = graph_builder.build(artifacts)
 
         # 3️⃣ Assemble text chunks
-        assembler = PDFChunkAssembler()
+        assembler = PDFChunkAssembler(token_budget_of(self.pipeline))
         chunks = assembler.assemble(doc_graph)
 
         # 4️⃣ Embed & persist chunks
@@ -83,3 +108,33 @@ class HeadlessPDFIngestor:
         )
 
         return chunks
+
+    def _ingest_pdf_windows(
+        self,
+        file_bytes: bytes,
+        source_name: str,
+        ingestion_id: str,
+        window_pages: int,
+    ) -> List[Chunk]:
+        """Same result as ingest_pdf, window_pages pages in memory at a time."""
+        chunks: List[Chunk] = []
+
+        def collect(windows: Iterator[List[Chunk]]) -> Iterator[List[Chunk]]:
+            for window in windows:
+                chunks.extend(window)
+                yield window
+
+        persist_chunk_windows(
+            self.pipeline,
+            collect(
+                iter_pdf_chunk_windows(
+                    file_bytes,
+                    source_name,
+                    window_pages,
+                    transform=self._run_ocr_and_expand_artifacts,
+                    token_budget=token_budget_of(self.pipeline),
+                )
+            ),
+            ingestion_id,
+        )
+        return chunks
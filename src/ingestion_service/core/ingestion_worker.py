@@ -0,0 +1,178 @@
+# src/ingestion_service/core/ingestion_worker.py
+"""
+Queue workers for background file ingestion.
+
+Workers poll IngestionJobQueue, run the file ingestion for each claimed job
+and record the outcome. They run either:
+
+- in-process: IngestionWorkerPool started by the API (INGEST_WORKERS > 0)
+- as a separate process:
+
+      uv run python -m ingestion_service.core.ingestion_worker --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import signal
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ingestion_service.core.component_registry import get_registry
+from ingestion_service.core.config import get_settings
+from ingestion_service.core.database_session import get_sessionmaker
+from ingestion_service.core.file_ingestion import (
+    find_previous_ingestion,
+    ingest_file_bytes,
+)
+from ingestion_service.core.job_queue import IngestionJobQueue
+from ingestion_service.core.pipeline import IngestionPipeline
+from ingestion_service.core.status_manager import StatusManager
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorker:
+    def __init__(
+        self,
+        *,
+        session_factory: Optional[Callable[[], Session]] = None,
+        pipeline_factory: Optional[Callable[[str], IngestionPipeline]] = None,
+        poll_interval: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> None:
+        settings = get_settings()
+        self._session_factory = session_factory or get_sessionmaker()
+        self._pipeline_factory = pipeline_factory or get_registry().get_pipeline
+        self._poll_interval = (
+            settings.INGEST_POLL_INTERVAL if poll_interval is None else poll_interval
+        )
+        self._lease_seconds = (
+            settings.INGEST_JOB_LEASE_SECONDS
+            if lease_seconds is None
+            else lease_seconds
+        )
+        self._max_attempts = (
+            settings.INGEST_JOB_MAX_ATTEMPTS if max_attempts is None else max_attempts
+        )
+
+    def run_once(self) -> bool:
+        """Claim and process at most one job. Returns False if none was queued."""
+        with self._session_factory() as session:
+            queue = IngestionJobQueue(session)
+            job = queue.claim_next(
+                lease_seconds=self._lease_seconds,
+                max_attempts=self._max_attempts,
+            )
+            if job is None:
+                return False
+
+            provider = get_settings().EMBEDDING_PROVIDER
+            previous = None
+            try:
+                pipeline = self._pipeline_factory(provider)
+                if job.attempts > 1:
+                    # A previous attempt died mid-way; drop its partial vectors
+                    pipeline._vector_store.delete_by_ingestion_id(str(job.ingestion_id))
+
+                # A new version of an ingested document: embed changed chunks
+                previous = find_previous_ingestion(
+                    StatusManager(session), pipeline, document_key=job.document_key
+                )
+                ingest_file_bytes(
+                    pipeline,
+                    file_bytes=job.content,
+                    filename=job.filename,
+                    content_type=job.content_type,
+                    ingestion_id=str(job.ingestion_id),
+                    provider=provider,
+                    ocr_provider=job.metadata.get("ocr_provider"),
+                    previous_ingestion_id=str(previous) if previous else None,
+                )
+            except Exception as exc:
+                logger.exception("Ingestion job %s failed", job.ingestion_id)
+                queue.fail(job.ingestion_id, error=str(exc))
+            else:
+                queue.complete(job.ingestion_id)
+                if previous is not None:
+                    StatusManager(session).supersede(previous, by=job.ingestion_id)
+
+            return True
+
+    def run_forever(self, stop_event: threading.Event) -> None:
+        """Drain the queue, then poll every poll_interval until stopped."""
+        while not stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                # e.g. database unavailable: back off and retry
+                logger.exception("Ingestion worker poll failed")
+                processed = False
+
+            if not processed:
+                stop_event.wait(self._poll_interval)
+
+
+class IngestionWorkerPool:
+    """A fixed number of IngestionWorker threads sharing one stop signal."""
+
+    def __init__(self, workers: int, **worker_kwargs) -> None:
+        self._workers = workers
+        self._worker_kwargs = worker_kwargs
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        for index in range(self._workers):
+            worker = IngestionWorker(**self._worker_kwargs)
+            thread = threading.Thread(
+                target=worker.run_forever,
+                args=(self._stop_event,),
+                name=f"ingestion-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal every worker and wait for in-flight jobs to finish."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run ingestion queue workers")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=get_settings().INGEST_WORKERS or 1,
+        help="worker threads in this process",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    pool = IngestionWorkerPool(args.workers)
+    stopped = threading.Event()
+
+    def handle_signal(signum, frame) -> None:
+        stopped.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    pool.start()
+    logger.info("Started %d ingestion worker(s)", args.workers)
+    while not stopped.wait(timeout=1.0):
+        pass
+    pool.stop()
+
+
+if __name__ == "__main__":
+    main()
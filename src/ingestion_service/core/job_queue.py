@@ -0,0 +1,168 @@
+# src/ingestion_service/core/job_queue.py
+"""
+Durable ingestion job queue backed by the ingestion_requests table.
+
+A queued job is an ingestion_requests row plus its ingestion_uploads row
+(the spooled file bytes). Workers claim jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, so any number of worker threads or
+processes can poll the same table without handing out a job twice.
+
+Lifecycle (all transitions go through StatusManager):
+    accepted → running → completed | failed
+
+A job left "running" longer than the lease (worker crashed) is claimed
+again until it reaches max_attempts, after which it is marked failed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from ingestion_service.core.models import IngestionRequest, IngestionUpload
+from ingestion_service.core.status_manager import StatusManager
+
+
+@dataclass
+class IngestionJob:
+    ingestion_id: UUID
+    source_type: str
+    filename: str
+    content_type: str
+    content: bytes
+    attempts: int
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    document_key: Optional[str] = None
+
+
+class IngestionJobQueue:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._status = StatusManager(session)
+
+    # ---------------------------------------------------------
+    # Producer
+    # ---------------------------------------------------------
+    def enqueue(
+        self,
+        *,
+        ingestion_id: UUID,
+        source_type: str,
+        metadata: Dict[str, Any],
+        filename: str,
+        content_type: str,
+        content: bytes,
+        content_hash: Optional[str] = None,
+        document_key: Optional[str] = None,
+    ) -> None:
+        """Persist the upload and its "accepted" request in one commit."""
+        upload = IngestionUpload()
+        upload.ingestion_id = ingestion_id
+        upload.filename = filename
+        upload.content_type = content_type
+        upload.content = content
+        self._session.add(upload)
+
+        # create_request commits the pending upload along with the request
+        self._status.create_request(
+            ingestion_id=ingestion_id,
+            source_type=source_type,
+            metadata=metadata,
+            content_hash=content_hash,
+            document_key=document_key,
+        )
+
+    # ---------------------------------------------------------
+    # Consumer
+    # ---------------------------------------------------------
+    def claim_next(
+        self, *, lease_seconds: float, max_attempts: int
+    ) -> Optional[IngestionJob]:
+        """
+        Lock the oldest claimable job, mark it running and return it.
+
+        Returns None when the queue is empty (or every job is locked by
+        another worker).
+        """
+        while True:
+            lease_expired = datetime.now(UTC) - timedelta(seconds=lease_seconds)
+            claimable = (
+                select(IngestionRequest)
+                # Only requests with a spooled upload are queue jobs; inline
+                # requests also pass through "accepted" but have none.
+                .join(
+                    IngestionUpload,
+                    IngestionUpload.ingestion_id == IngestionRequest.ingestion_id,
+                )
+                .where(
+                    or_(
+                        IngestionRequest.status == "accepted",
+                        and_(
+                            IngestionRequest.status == "running",
+                            IngestionRequest.started_at < lease_expired,
+                        ),
+                    )
+                )
+                .order_by(IngestionRequest.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True, of=IngestionRequest)
+            )
+            request = self._session.execute(claimable).scalars().first()
+
+            if request is None:
+                self._session.rollback()
+                return None
+
+            ingestion_id = request.ingestion_id
+            attempts = request.attempts or 0
+
+            if attempts >= max_attempts:
+                self._discard_upload(ingestion_id)
+                self._status.mark_failed(
+                    ingestion_id,
+                    error=f"Abandoned after {attempts} attempts (lease expired)",
+                )
+                continue
+
+            request.attempts = attempts + 1
+            # Commits, which also releases the row lock: the row is now
+            # "running" and invisible to other workers until its lease expires.
+            self._status.mark_running(ingestion_id)
+
+            upload = self._session.get(IngestionUpload, ingestion_id)
+            # None when deleted concurrently (job finished elsewhere)
+            if not isinstance(upload, IngestionUpload):
+                continue
+
+            return IngestionJob(
+                ingestion_id=ingestion_id,
+                source_type=request.source_type,
+                filename=upload.filename,
+                content_type=upload.content_type,
+                content=upload.content,
+                attempts=request.attempts,
+                metadata=dict(request.ingestion_metadata or {}),
+                document_key=request.document_key,
+            )
+
+    def complete(self, ingestion_id: UUID) -> None:
+        self._discard_upload(ingestion_id)
+        self._status.mark_completed(ingestion_id)
+
+    def fail(self, ingestion_id: UUID, *, error: str) -> None:
+        self._discard_upload(ingestion_id)
+        self._status.mark_failed(ingestion_id, error=error)
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _discard_upload(self, ingestion_id: UUID) -> None:
+        """Delete the spooled bytes; committed by the following status change."""
+        self._session.query(IngestionUpload).filter_by(
+            ingestion_id=ingestion_id
+        ).delete(synchronize_session=False)
@@ -1,6 +1,15 @@
 # src/ingestion_service/core/models.py (classic style - Pyright perfect)
 import uuid
-from sqlalchemy import Column, String, JSON, TIMESTAMP, MetaData  # ← Add MetaData here
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    JSON,
+    TIMESTAMP,
+    MetaData,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import text
@@ -19,3 +28,27 @@ class IngestionRequest(Base):
     created_at = Column(TIMESTAMP, server_default=text("NOW()"), nullable=False)
     started_at = Column(TIMESTAMP, nullable=True)
     finished_at = Column(TIMESTAMP, nullable=True)
+    # Number of times a queue worker has claimed this request
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    # Re-ingestion (see file_ingestion.content_hash / document_key); cleared
+    # when a newer version of the document supersedes this request
+    content_hash = Column(String, nullable=True)
+    document_key = Column(String, nullable=True)
+
+
+class IngestionUpload(Base):
+    """Uploaded file bytes waiting for a queue worker (deleted once processed)."""
+
+    __tablename__ = "ingestion_uploads"
+    __table_args__ = {"schema": "ingestion_service"}
+    ingestion_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "ingestion_service.ingestion_requests.ingestion_id", ondelete="CASCADE"
+        ),
+        primary_key=True,
+    )
+    filename = Column(String, nullable=False)
+    content_type = Column(String, nullable=False)
+    content = Column(LargeBinary, nullable=False)
+    created_at = Column(TIMESTAMP, server_default=text("NOW()"), nullable=False)
@@ -0,0 +1,204 @@
+# src/ingestion_service/core/ocr/cache.py
+"""
+OCR result cache keyed by image content.
+
+Logos, letterheads and stamps repeat on every page; CachedOCR wraps an
+OCRExtractor so each distinct image is recognized once. Keys are
+sha256(engine name, engine cache_identity(), sha256(image bytes)), so a
+different tesseract version or configuration never reuses old results.
+
+Tiers:
+1. OCRResultLRU: in-process, bounded by entry count
+2. PgOCRCacheStore: optional, table ingestion_service.ocr_cache
+
+Empty results are never cached: engines such as TesseractOCR report
+failures (including timeouts) as "", so one transient failure must not
+stick to the image. An image with no text is recognized again each time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Dict, Optional
+
+import psycopg
+from psycopg import sql
+from psycopg_pool import ConnectionPool
+
+from ingestion_service.core.connection_pool import get_pool
+from ingestion_service.core.ocr.ocr import OCRExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class OCRResultLRU:
+    """Thread-safe LRU of key -> recognized text."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: bytes, text: str) -> None:
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class PgOCRCacheStore:
+    """Persistent cache tier in ingestion_service.ocr_cache."""
+
+    SCHEMA = "ingestion_service"
+    TABLE_NAME = "ocr_cache"
+
+    def __init__(self, dsn: str, pool: Optional[ConnectionPool] = None) -> None:
+        self._dsn = dsn
+        self._pool = pool
+
+    def get(self, key: bytes) -> Optional[str]:
+        select_sql = sql.SQL(
+            "SELECT text FROM {schema}.{table} WHERE cache_key = %s"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+        )
+        with self._connection() as conn:
+            row = conn.execute(select_sql, (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: bytes, text: str, *, engine: str) -> None:
+        insert_sql = sql.SQL(
+            "INSERT INTO {schema}.{table} (cache_key, engine, text) "
+            "VALUES (%s, %s, %s) ON CONFLICT (cache_key) DO NOTHING"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+        )
+        with self._connection() as conn:
+            conn.execute(insert_sql, (key, engine, text))
+
+    def _connection(self) -> AbstractContextManager[psycopg.Connection]:
+        return (self._pool or get_pool(self._dsn)).connection()
+
+
+class CachedOCR(OCRExtractor):
+    """Wraps an OCR engine with the memory (and optional persistent) tiers."""
+
+    def __init__(
+        self,
+        inner: OCRExtractor,
+        *,
+        memory: OCRResultLRU,
+        persistent: Optional[PgOCRCacheStore] = None,
+    ) -> None:
+        self._inner = inner
+        self._memory = memory
+        self._persistent = persistent
+        self.name = inner.name
+        self.execution_mode = inner.execution_mode
+
+        self._stats_lock = threading.Lock()
+        self._memory_hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+
+    @property
+    def inner(self) -> OCRExtractor:
+        return self._inner
+
+    def cache_identity(self) -> str:
+        return self._inner.cache_identity()
+
+    def extract_text(self, image_bytes: bytes) -> str:
+        key = self.key_for(image_bytes)
+        text = self.lookup(key)
+        if text is None:
+            text = self._inner.extract_text(image_bytes)
+            self.store(key, text)
+        return text
+
+    # ---------------------------------------------------------
+    # Used directly by OCRExecutor to dispatch only the misses
+    # ---------------------------------------------------------
+    def key_for(self, image_bytes: bytes) -> bytes:
+        digest = hashlib.sha256()
+        for part in (self.name, self.cache_identity()):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        digest.update(hashlib.sha256(image_bytes).digest())
+        return digest.digest()
+
+    def lookup(self, key: bytes) -> Optional[str]:
+        """Cached text for `key`, or None (counted as a miss)."""
+        text = self._memory.get(key)
+        if text is not None:
+            self._count(memory_hits=1)
+            return text
+
+        text = self._persistent_get(key)
+        if text is not None:
+            self._memory.put(key, text)
+            self._count(persistent_hits=1)
+            return text
+
+        self._count(misses=1)
+        return None
+
+    def store(self, key: bytes, text: str) -> None:
+        if not text:  # no text or a failure: not cached
+            return
+        self._memory.put(key, text)
+        if self._persistent is not None:
+            try:
+                self._persistent.put(key, text, engine=self.name)
+            except psycopg.Error as exc:
+                logger.warning("OCR cache write failed: %s", exc)
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            lookups = self._memory_hits + self._persistent_hits + self._misses
+            hits = self._memory_hits + self._persistent_hits
+            return {
+                "lookups": lookups,
+                "memory_hits": self._memory_hits,
+                "persistent_hits": self._persistent_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+            }
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _count(
+        self, *, memory_hits: int = 0, persistent_hits: int = 0, misses: int = 0
+    ) -> None:
+        with self._stats_lock:
+            self._memory_hits += memory_hits
+            self._persistent_hits += persistent_hits
+            self._misses += misses
+
+    def _persistent_get(self, key: bytes) -> Optional[str]:
+        if self._persistent is None:
+            return None
+        try:
+            return self._persistent.get(key)
+        except psycopg.Error as exc:
+            logger.warning("OCR cache lookup failed: %s", exc)
+            return None
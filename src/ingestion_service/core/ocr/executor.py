@@ -0,0 +1,211 @@
+# src/ingestion_service/core/ocr/executor.py
+"""
+Fan image artifacts out to OCR workers.
+
+- workers <= 1: serial, in-process (enrich_image_with_ocr one by one)
+- workers > 1: the engine's execution_mode decides the pool
+  - "thread": ThreadPoolExecutor in this process
+  - "process": shared spawn process pool; the engine instance is pickled
+    to the worker
+
+With a CachedOCR engine (OCR_CACHE), hits are resolved in this process and
+each distinct missing image is dispatched once. Results come back in input
+order. Failure isolation matches
+enrich_image_with_ocr: an engine error or a timeout is logged and the
+image keeps ocr_text=None; ingestion continues.
+
+Timeouts: a process worker is interrupted with SIGALRM. A thread cannot
+be interrupted, so in thread mode the timeout only stops waiting for the
+image; the engine must bound its own run time (TesseractOCR passes
+OCR_TIMEOUT to tesseract, which kills the subprocess).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import logging
+import signal
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+from ingestion_service.core.extractors.base import ExtractedArtifact
+from ingestion_service.core.ocr.cache import CachedOCR
+from ingestion_service.core.ocr.ocr import OCRExtractor
+from ingestion_service.core.ocr.ocr_factory import get_ocr_engine
+from ingestion_service.core.ocr.utils import enrich_image_with_ocr
+from ingestion_service.core.process_pools import submit_to_process_pool
+
+logger = logging.getLogger(__name__)
+
+# In process mode the per-image limit is enforced inside the worker
+# (SIGALRM). The parent only keeps a backstop for workers stuck in native
+# code that ignores signals, with room for spawning a cold pool.
+_PROCESS_TIMEOUT_GRACE = 30.0
+
+
+class OCRExecutor:
+    def __init__(
+        self,
+        ocr_provider: str = "tesseract",
+        workers: int = 1,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.ocr_provider = ocr_provider
+        self.workers = workers
+        # Seconds per image; None or 0 disables the limit
+        self.timeout = timeout or None
+
+    def enrich(self, artifacts: List[ExtractedArtifact]) -> List[ExtractedArtifact]:
+        """
+        Return `artifacts` with OCR text set on every image artifact.
+
+        Non-image artifacts pass through unchanged; order is preserved.
+        """
+        images = [i for i, a in enumerate(artifacts) if _needs_ocr(a)]
+        if not images:
+            return list(artifacts)
+
+        if self.workers <= 1 or len(images) == 1:
+            return [
+                enrich_image_with_ocr(a, self.ocr_provider) if _needs_ocr(a) else a
+                for a in artifacts
+            ]
+
+        engine = get_ocr_engine(self.ocr_provider)
+        cache = engine if isinstance(engine, CachedOCR) else None
+
+        # Resolve cache hits here; dispatch each distinct missing image once
+        text_by_key: Dict[bytes, Optional[str]] = {}
+        pending: Dict[bytes, int] = {}  # key -> first artifact index
+        keys: List[bytes] = []
+        for index in images:
+            image_bytes = artifacts[index].image_bytes or b""
+            key = (
+                cache.key_for(image_bytes)
+                if cache
+                else hashlib.sha256(image_bytes).digest()
+            )
+            keys.append(key)
+            if key in text_by_key or key in pending:
+                continue
+            cached = cache.lookup(key) if cache else None
+            if cached is not None:
+                text_by_key[key] = cached
+            else:
+                pending[key] = index
+
+        if pending:
+            texts = self._dispatch(
+                cache.inner if cache else engine, artifacts, list(pending.values())
+            )
+            for key, text in zip(pending, texts):
+                text_by_key[key] = text
+                if cache is not None and text is not None:
+                    cache.store(key, text)
+
+        enriched = list(artifacts)
+        for index, key in zip(images, keys):
+            enriched[index] = dataclasses.replace(
+                artifacts[index], ocr_text=text_by_key[key] or None
+            )
+        return enriched
+
+    def _dispatch(
+        self,
+        engine: OCRExtractor,
+        artifacts: List[ExtractedArtifact],
+        images: List[int],
+    ) -> List[Optional[str]]:
+        """OCR artifacts[i] for i in images; None marks a failure or timeout."""
+        # _needs_ocr() only admits artifacts with image bytes
+        payloads = [artifacts[i].image_bytes or b"" for i in images]
+        if engine.execution_mode == "thread":
+            threads = ThreadPoolExecutor(
+                max_workers=min(self.workers, len(images)),
+                thread_name_prefix="ocr",
+            )
+            try:
+                futures = [
+                    threads.submit(engine.extract_text, payload) for payload in payloads
+                ]
+                return self._collect(artifacts, images, futures, self.timeout)
+            finally:
+                # Do not block on timed-out images; cancel() cannot stop a
+                # running thread, which ends when the engine's own limit hits
+                threads.shutdown(wait=False, cancel_futures=True)
+
+        futures = [
+            submit_to_process_pool(
+                "ocr",
+                self.workers,
+                _extract_with_alarm,
+                engine,
+                payload,
+                self.timeout,
+            )
+            for payload in payloads
+        ]
+        wait = self.timeout + _PROCESS_TIMEOUT_GRACE if self.timeout else None
+        return self._collect(artifacts, images, futures, wait)
+
+    @staticmethod
+    def _collect(
+        artifacts: List[ExtractedArtifact],
+        images: List[int],
+        futures: List[Future],
+        timeout: Optional[float],
+    ) -> List[Optional[str]]:
+        # Waited on in submission order: each image gets `timeout` seconds
+        # after the images before it have finished.
+        texts: List[Optional[str]] = []
+        for index, future in zip(images, futures):
+            artifact = artifacts[index]
+            try:
+                texts.append(future.result(timeout=timeout))
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(
+                    "OCR timed out after %ss for image artifact %s (page %s, order %s)",
+                    timeout,
+                    artifact.source_file,
+                    artifact.page_number,
+                    artifact.order_index,
+                )
+                texts.append(None)
+            except Exception as exc:
+                logger.warning(
+                    "OCR failed for image artifact %s (page %s, order %s): %s",
+                    artifact.source_file,
+                    artifact.page_number,
+                    artifact.order_index,
+                    exc,
+                )
+                texts.append(None)
+        return texts
+
+
+def _needs_ocr(artifact: ExtractedArtifact) -> bool:
+    return artifact.type == "image" and bool(artifact.image_bytes)
+
+
+def _raise_timeout(signum, frame) -> None:
+    raise TimeoutError("OCR exceeded its time limit")
+
+
+def _extract_with_alarm(
+    engine: OCRExtractor, image_bytes: bytes, timeout: Optional[float]
+) -> str:
+    """Process-pool entry point; SIGALRM interrupts an image past `timeout`."""
+    if not timeout:
+        return engine.extract_text(image_bytes)
+
+    # Pool tasks run on the worker process's main thread, so signals work
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return engine.extract_text(image_bytes)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
@@ -1,6 +1,9 @@
 # src/ingestion_service/core/ocr/ocr.py
 
 from abc import ABC, abstractmethod
+from typing import Literal
+
+OCRExecutionMode = Literal["thread", "process"]
 
 
 class OCRExtractor(ABC):
@@ -8,6 +11,21 @@ class OCRExtractor(ABC):
 
     name: str = "base"
 
+    # How OCRExecutor may parallelize this engine:
+    # - "thread": extract_text is thread-safe and releases the GIL
+    # - "process": needs its own process (GIL-bound or not thread-safe);
+    #   the instance must be picklable
+    execution_mode: OCRExecutionMode = "process"
+
+    def cache_identity(self) -> str:
+        """
+        Engine version/configuration for OCR cache keys.
+
+        Override when results depend on more than the engine name (binary
+        version, language packs, page segmentation mode, ...).
+        """
+        return self.name
+
     @abstractmethod
     def extract_text(self, image_bytes: bytes) -> str:
         """Return extracted text from image bytes. Empty string if nothing found."""
@@ -1,8 +1,11 @@
 # src/ingestion_service/core/ocr/ocr_factory.py
 
 import os
+import threading
 from typing import Dict
 
+from ingestion_service.core.config import get_settings, on_settings_reload
+from ingestion_service.core.ocr.cache import CachedOCR, OCRResultLRU, PgOCRCacheStore
 from ingestion_service.core.ocr.ocr import OCRExtractor
 from ingestion_service.core.ocr.tesseract_ocr import TesseractOCR
 # from ingestion_service.core.ocr.paddle_ocr import PaddleOCRExtractor
@@ -27,4 +30,44 @@ def get_ocr_engine(name: str = "tesseract") -> OCRExtractor:
     engine = OCR_ENGINES.get(ocr_name)
     if not engine:
         raise ValueError(f"OCR engine '{ocr_name}' is not registered")
-    return engine
+
+    settings = get_settings()
+    if settings.OCR_CACHE == "off":
+        return engine
+    return _cached(engine, settings)
+
+
+# One cache wrapper per engine instance ("default" and "tesseract" share)
+_cached_engines: Dict[int, CachedOCR] = {}
+_cached_lock = threading.Lock()
+
+
+def _cached(engine: OCRExtractor, settings) -> CachedOCR:
+    with _cached_lock:
+        cached = _cached_engines.get(id(engine))
+        if cached is None or cached.inner is not engine:
+            cached = CachedOCR(
+                engine,
+                memory=OCRResultLRU(settings.OCR_CACHE_MAX_ENTRIES),
+                persistent=(
+                    PgOCRCacheStore(dsn=settings.DATABASE_URL)
+                    if settings.OCR_CACHE == "postgres"
+                    else None
+                ),
+            )
+            _cached_engines[id(engine)] = cached
+        return cached
+
+
+def get_ocr_cache_metrics() -> Dict[str, Dict[str, float]]:
+    """Hit/miss counters of every OCR cache in use, by engine name."""
+    with _cached_lock:
+        return {cached.name: cached.stats() for cached in _cached_engines.values()}
+
+
+def _reset_caches() -> None:
+    with _cached_lock:
+        _cached_engines.clear()
+
+
+on_settings_reload(_reset_caches)
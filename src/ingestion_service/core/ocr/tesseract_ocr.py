@@ -3,17 +3,39 @@
 from PIL import Image
 import pytesseract
 import io
+import math
 
+from ingestion_service.core.config import get_settings
 from ingestion_service.core.ocr.ocr import OCRExtractor
 
 
 class TesseractOCR(OCRExtractor):
     name = "tesseract"
+    # pytesseract runs the tesseract binary as a subprocess per call, so
+    # threads already get true parallelism
+    execution_mode = "thread"
+
+    def __init__(self) -> None:
+        self._identity: str | None = None
+
+    def cache_identity(self) -> str:
+        if self._identity is None:
+            try:
+                version = str(pytesseract.get_tesseract_version())
+            except Exception:
+                version = "unknown"
+            # image_to_string runs with default lang/config
+            self._identity = f"tesseract-{version}:lang=eng:config="
+        return self._identity
 
     def extract_text(self, image_bytes: bytes) -> str:
         try:
             image = Image.open(io.BytesIO(image_bytes))
-            text = pytesseract.image_to_string(image)
+            # pytesseract kills the tesseract process past the limit (0 = none);
+            # OCRExecutor's thread mode relies on it to stop timed-out images
+            text = pytesseract.image_to_string(
+                image, timeout=math.ceil(get_settings().OCR_TIMEOUT)
+            )
             return text or ""
         except Exception:
             return ""
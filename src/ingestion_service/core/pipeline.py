@@ -1,9 +1,9 @@
 # src/ingestion_service/core/pipeline.py
 from __future__ import annotations
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 import logging
 
-from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.chunks import Chunk, chunk_digest
 from ingestion_service.core.chunkers.base import BaseChunker
 from ingestion_service.core.chunkers.selector import ChunkerFactory
 
@@ -18,11 +18,18 @@ class IngestionPipeline:
         chunker: Optional[BaseChunker] = None,
         embedder,
         vector_store,
+        token_budget: Optional[int] = None,
     ) -> None:
         self._validator = validator
         self._chunker = chunker
         self._embedder = embedder
         self._vector_store = vector_store
+        self._token_budget = token_budget
+
+    @property
+    def token_budget(self) -> Optional[int]:
+        """Tokens per chunk when chunking by token budget, else None."""
+        return self._token_budget
 
     def run(
         self,
@@ -31,6 +38,7 @@ class IngestionPipeline:
         ingestion_id: str,
         source_type: str,
         provider: str,
+        previous_ingestion_id: Optional[str] = None,
     ) -> None:
         self._validate(text)
         chunks = self._chunk(
@@ -38,9 +46,21 @@ class IngestionPipeline:
             source_type=source_type,
             provider=provider,
         )
+        if previous_ingestion_id is not None:
+            self._persist_changes(chunks, ingestion_id, previous_ingestion_id)
+            return
         embeddings = self._embed(chunks)
         self._persist(chunks, embeddings, ingestion_id)
 
+    def stored_digests(self, ingestion_id: str) -> Dict[str, str]:
+        """
+        chunk_id -> chunk_digest of the chunks stored for an ingestion.
+
+        Empty when nothing is stored or the vector store cannot tell.
+        """
+        digests = getattr(self._vector_store, "chunk_digests", None)
+        return digests(ingestion_id) if digests is not None else {}
+
     def _validate(self, text: str) -> None:
         self._validator.validate(text)
 
@@ -51,7 +71,9 @@ class IngestionPipeline:
         provider: str,
     ) -> list[Chunk]:
         if self._chunker is None:
-            selected_chunker, chunker_params = ChunkerFactory.choose_strategy(text)
+            selected_chunker, chunker_params = ChunkerFactory.choose_strategy(
+                text, token_budget=self._token_budget
+            )
         else:
             selected_chunker = self._chunker
             chunker_params = {}
@@ -89,9 +111,53 @@ class IngestionPipeline:
         chunks: list[Chunk],
         embeddings: list[Any],
         ingestion_id: str,
+        start_index: int = 0,
     ) -> None:
         self._vector_store.persist(
             chunks=chunks,
             embeddings=embeddings,
             ingestion_id=ingestion_id,
+            start_index=start_index,
+        )
+
+    def _persist_changes(
+        self,
+        chunks: list[Chunk],
+        ingestion_id: str,
+        previous_ingestion_id: str,
+    ) -> int:
+        """
+        Persist a new version of the document stored as previous_ingestion_id.
+
+        Only chunks whose ID is new or whose text changed are embedded; the
+        store keeps the other rows, deletes removed chunks and inserts the
+        new ones in one transaction. Stores without replace_ingestion embed
+        and persist everything, then delete the previous version (not
+        atomically). Returns the number of chunks embedded.
+        """
+        replace = getattr(self._vector_store, "replace_ingestion", None)
+        if replace is None:
+            self._persist(chunks, self._embed(chunks), ingestion_id)
+            self._vector_store.delete_by_ingestion_id(previous_ingestion_id)
+            return len(chunks)
+
+        stored = self.stored_digests(previous_ingestion_id)
+        changed = [
+            chunk
+            for chunk in chunks
+            if stored.get(chunk.chunk_id) != chunk_digest(chunk.content)
+        ]
+        embeddings = self._embed(changed) if changed else []
+        logging.debug(
+            "IngestionPipeline: re-ingesting %s, %d/%d chunks changed",
+            previous_ingestion_id,
+            len(changed),
+            len(chunks),
+        )
+        replace(
+            chunks=chunks,
+            embeddings={c.chunk_id: e for c, e in zip(changed, embeddings)},
+            ingestion_id=ingestion_id,
+            previous_ingestion_id=previous_ingestion_id,
         )
+        return len(changed)
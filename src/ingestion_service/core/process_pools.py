@@ -0,0 +1,76 @@
+# src/ingestion_service/core/process_pools.py
+"""
+Shared process pools for CPU-bound stages (PDF extraction, OCR).
+
+Spawning workers is expensive (each re-imports PyMuPDF, PIL, ...), so pools
+are created lazily, one per (name, worker count), and reused across calls.
+Workers use the "spawn" start method: forking a threaded server process
+(and native library state such as MuPDF's) is unsafe.
+
+A worker that dies abruptly (OOM kill, segfault in a native library) breaks
+its whole pool: the tasks in flight fail with BrokenProcessPool and so
+would every later submit. submit_to_process_pool() drops a broken pool so
+the next call gets a fresh one.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Tuple
+
+_pools: Dict[Tuple[str, int], ProcessPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_process_pool(name: str, workers: int) -> ProcessPoolExecutor:
+    with _lock:
+        pool = _pools.get((name, workers))
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pools[(name, workers)] = pool
+        return pool
+
+
+def submit_to_process_pool(
+    name: str, workers: int, fn: Callable[..., Any], /, *args: Any
+) -> Future:
+    """Submit to the shared pool, replacing it if a dead worker broke it."""
+    pool = get_process_pool(name, workers)
+    try:
+        future = pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _discard(name, workers, pool)
+        pool = get_process_pool(name, workers)
+        future = pool.submit(fn, *args)
+    future.add_done_callback(partial(_discard_if_broken, name, workers, pool))
+    return future
+
+
+def _discard_if_broken(
+    name: str, workers: int, pool: ProcessPoolExecutor, future: Future
+) -> None:
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _discard(name, workers, pool)
+
+
+def _discard(name: str, workers: int, pool: ProcessPoolExecutor) -> None:
+    # No shutdown(): a broken executor has already terminated its workers,
+    # and this may run on its management thread, which shutdown() would join
+    with _lock:
+        if _pools.get((name, workers)) is pool:
+            del _pools[(name, workers)]
+
+
+def shutdown_process_pools() -> None:
+    """Stop every shared pool (application shutdown, tests)."""
+    with _lock:
+        for pool in _pools.values():
+            pool.shutdown(cancel_futures=True)
+        _pools.clear()
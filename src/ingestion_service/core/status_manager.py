@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime, UTC
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -23,12 +23,16 @@ class StatusManager:
         ingestion_id: UUID,
         source_type: str,
         metadata: Dict[str, Any],
+        content_hash: Optional[str] = None,
+        document_key: Optional[str] = None,
     ) -> None:
         request = IngestionRequest()
         request.ingestion_id = ingestion_id
         request.source_type = source_type
         request.ingestion_metadata = metadata
         request.status = "accepted"
+        request.content_hash = content_hash
+        request.document_key = document_key
 
         self._session.add(request)
         self._session.commit()
@@ -55,12 +59,49 @@ class StatusManager:
         request.finished_at = datetime.now(UTC)
 
         if error:
-            meta = request.ingestion_metadata or {}
+            # Copy: mutating the loaded dict in place is invisible to the
+            # ORM's change detection on plain JSON columns.
+            meta = dict(request.ingestion_metadata or {})
             meta["error"] = error
             request.ingestion_metadata = meta
 
         self._session.commit()
 
+    def supersede(self, ingestion_id: UUID, *, by: UUID) -> None:
+        """
+        Record that `by` replaced this (completed) request's vectors.
+
+        Clears its content hash and document key so re-ingestion lookups
+        only ever find the current version.
+        """
+        request = self._get_request(ingestion_id)
+        request.content_hash = None
+        request.document_key = None
+        meta = dict(request.ingestion_metadata or {})
+        meta["superseded_by"] = str(by)
+        request.ingestion_metadata = meta
+        self._session.commit()
+
+    # ---------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------
+    def find_completed(
+        self,
+        *,
+        content_hash: Optional[str] = None,
+        document_key: Optional[str] = None,
+    ) -> Optional[IngestionRequest]:
+        """Latest completed request with the given content hash or document key."""
+        if content_hash is None and document_key is None:
+            return None
+
+        query = self._session.query(IngestionRequest).filter_by(status="completed")
+        if content_hash is not None:
+            query = query.filter_by(content_hash=content_hash)
+        if document_key is not None:
+            query = query.filter_by(document_key=document_key)
+        return query.order_by(IngestionRequest.finished_at.desc()).first()
+
     # ---------------------------------------------------------
     # Internal
     # ---------------------------------------------------------
@@ -10,3 +10,10 @@ class MockValidator:
     def validate(self, text: str) -> None:
         if not text or not text.strip():
             raise ValueError("Input text cannot be empty")
+
+
+class NoOpValidator:
+    """Synchronous no-op validator."""
+
+    def validate(self, text: str) -> None:
+        return None
@@ -4,13 +4,19 @@ from ingestion_service.core.vectorstore.base import (
     VectorStore,
     VectorRecord,
     VectorMetadata,
+    SearchFilter,
+    SearchHit,
 )
 
+from ingestion_service.core.vectorstore.numpy_store import NumpyVectorStore
 from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
 
 __all__ = [
     "VectorStore",
     "VectorRecord",
     "VectorMetadata",
+    "SearchFilter",
+    "SearchHit",
+    "NumpyVectorStore",
     "PgVectorStore",
 ]
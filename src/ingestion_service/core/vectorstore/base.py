@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Iterable, Sequence, List, Dict, Optional
+from typing import Any, Iterable, Sequence, List, Dict, Literal, Optional, Union
 
 
 @dataclass
@@ -21,6 +21,42 @@ class VectorMetadata:
 class VectorRecord:
     vector: Sequence[float]
     metadata: VectorMetadata
+    # Distance to the query (lower = closer); set on search results only
+    score: Optional[float] = None
+    # Reciprocal rank fusion score (higher = better); set by hybrid search
+    rrf_score: Optional[float] = None
+
+
+# Search projections that return SearchHits instead of VectorRecords
+LeanProjection = Literal["text", "scores", "ids"]
+
+
+@dataclass
+class SearchHit:
+    """Lean search result: identifies a chunk without its stored vector."""
+
+    ingestion_id: str
+    chunk_id: str
+    chunk_index: int
+    score: Optional[float] = None
+    chunk_text: Optional[str] = None
+    rrf_score: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """
+    Scope of a similarity search; every given condition must hold.
+
+    Column filters take one value (equality) or a sequence (IN). metadata
+    matches records whose source_metadata contains it, e.g.
+    {"source_file": "report.pdf"} or {"tenant": "acme"}.
+    """
+
+    ingestion_id: Union[str, Sequence[str], None] = None
+    provider: Union[str, Sequence[str], None] = None
+    chunk_strategy: Union[str, Sequence[str], None] = None
+    metadata: Optional[Dict[str, Any]] = None
 
 
 class VectorStore(ABC):
@@ -40,10 +76,30 @@ class VectorStore(ABC):
         self,
         query_vector: Sequence[float],
         k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
     ) -> List[VectorRecord]:
-        """Return the top k most similar vectors."""
+        """Return the top k most similar vectors, optionally within filters."""
         ...
 
+    def similarity_search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+    ) -> List[List[VectorRecord]]:
+        """
+        Top k for each query vector, in query order.
+
+        Stores that can answer several queries in one round trip override
+        this; the default runs similarity_search once per query.
+        """
+        return [
+            self.similarity_search(query_vector, k, filters=filters)
+            for query_vector in query_vectors
+        ]
+
     @abstractmethod
     def delete_by_ingestion_id(self, ingestion_id: str) -> None:
         """Delete all vectors associated with a given ingestion_id."""
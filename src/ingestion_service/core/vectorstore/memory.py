@@ -20,7 +20,8 @@ This in-memory vector store exists to support:
   (core/vectorstore/pgvector_store.py).
 
 This implementation intentionally favors simplicity over performance
-or durability.
+or durability. For searches and local load tests use NumpyVectorStore
+(core/vectorstore/numpy_store.py), which implements VectorStore.
 """
 
 
@@ -40,6 +41,7 @@ class MemoryVectorStore:
         chunks: List[Chunk],
         embeddings: List[Any],
         ingestion_id: str,
+        start_index: int = 0,
     ) -> None:
         """
         Persist vectors in memory.
@@ -49,7 +51,9 @@ class MemoryVectorStore:
 
         DO NOT use this outside local development or tests.
         """
-        for index, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+        for index, (chunk, embedding) in enumerate(
+            zip(chunks, embeddings), start=start_index
+        ):
             self._rows.append(
                 {
                     "ingestion_id": ingestion_id,
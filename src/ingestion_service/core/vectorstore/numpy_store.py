@@ -0,0 +1,383 @@
+# src/ingestion_service/core/vectorstore/numpy_store.py
+"""
+In-memory VectorStore on NumPy arrays, for local development and load tests.
+
+Vectors live in one contiguous float32 matrix that grows by doubling, so
+add() is amortized O(1) per row and a search is one matrix product plus
+argpartition (linear in the rows, no full sort). Metadata is held in
+parallel arrays; the low-cardinality strings (ingestion_id, provider,
+chunk_strategy) are interned to int32 codes so filters are vectorized
+comparisons.
+
+delete_by_ingestion_id() only sets bits in a tombstone bitmap that
+searches skip; the arrays are compacted once tombstones reach
+compact_ratio of the rows.
+
+Nothing survives a restart unless saved with snapshot.save_snapshot()
+and reopened with snapshot.load_snapshot(); production uses PgVectorStore.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    SearchHit,
+    VectorMetadata,
+    VectorRecord,
+    VectorStore,
+)
+
+# String columns stored as int32 codes into a per-column value table
+INTERNED_COLUMNS = ("ingestion_id", "provider", "chunk_strategy")
+
+
+class NumpyVectorStore(VectorStore):
+    # Distances match PgVectorStore's operators: "l2" Euclidean (<->),
+    # "cosine" 1 - cosine similarity (<=>), "ip" negative inner product (<#>)
+    METRICS = ("l2", "cosine", "ip")
+
+    # similarity_search projections, as in PgVectorStore
+    PROJECTIONS = ("ids", "scores", "text", "full")
+
+    def __init__(
+        self,
+        dimension: int,
+        provider: str = "mock",
+        metric: str = "l2",
+        normalize: bool = False,
+        initial_capacity: int = 1024,
+        compact_ratio: float = 0.25,
+    ) -> None:
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Valid: {self.METRICS}")
+        self._dimension = dimension
+        self._provider = provider
+        self._metric = metric
+        # Unit-normalize vectors on write and query (see PgVectorStore)
+        self._normalize = normalize
+        # Compact once this fraction of the rows are tombstones
+        self._compact_ratio = compact_ratio
+
+        capacity = max(1, initial_capacity)
+        # Rows [0, _size) are in use, tombstoned ones included
+        self._size = 0
+        self._deleted_count = 0
+        self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        # Squared L2 norms, cached for the l2 and cosine distances
+        self._sq_norms = np.zeros(capacity, dtype=np.float32)
+        self._deleted = np.zeros(capacity, dtype=bool)
+        self._chunk_indexes = np.zeros(capacity, dtype=np.int32)
+        self._codes = {
+            column: np.zeros(capacity, dtype=np.int32) for column in INTERNED_COLUMNS
+        }
+        self._values: Dict[str, List[str]] = {c: [] for c in INTERNED_COLUMNS}
+        self._lookup: Dict[str, Dict[str, int]] = {c: {} for c in INTERNED_COLUMNS}
+        # Unique per row, kept as Python objects
+        self._chunk_ids: List[str] = []
+        self._chunk_texts: List[str] = []
+        self._source_metadata: List[Dict[str, Any]] = []
+        # (path, rows, generation) of the snapshot whose segments hold rows
+        # [0, rows) as they are here; see snapshot.py
+        self._snapshot: Optional[Tuple[str, int, int]] = None
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def metric(self) -> str:
+        return self._metric
+
+    def __len__(self) -> int:
+        """Number of live (not deleted) rows."""
+        return self._size - self._deleted_count
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def persist(
+        self,
+        chunks: List[Chunk],
+        embeddings: List[Any],
+        ingestion_id: str,
+        start_index: int = 0,
+    ) -> None:
+        """Pipeline entry point: chunks + embeddings, as in PgVectorStore."""
+        self.add(
+            VectorRecord(
+                vector=embedding,
+                metadata=VectorMetadata(
+                    ingestion_id=ingestion_id,
+                    chunk_id=chunk.chunk_id,
+                    chunk_index=index,
+                    chunk_strategy=chunk.metadata.get("chunk_strategy", "unknown"),
+                    chunk_text=chunk.content,
+                    source_metadata={**chunk.metadata, "chunk_text": chunk.content},
+                    provider=chunk.metadata.get("provider", self._provider),
+                ),
+            )
+            for index, (chunk, embedding) in enumerate(
+                zip(chunks, embeddings), start=start_index
+            )
+        )
+
+    def add(self, records: Iterable[VectorRecord]) -> None:
+        records = list(records)
+        if not records:
+            return
+        matrix = self._as_matrix([record.vector for record in records])
+
+        start, end = self._size, self._size + len(records)
+        self._reserve(end)
+        self._vectors[start:end] = matrix
+        self._sq_norms[start:end] = np.einsum("ij,ij->i", matrix, matrix)
+        self._deleted[start:end] = False
+        self._chunk_indexes[start:end] = [r.metadata.chunk_index for r in records]
+        for column in INTERNED_COLUMNS:
+            self._codes[column][start:end] = [
+                self._intern(column, self._column_value(r.metadata, column))
+                for r in records
+            ]
+        self._chunk_ids.extend(r.metadata.chunk_id for r in records)
+        self._chunk_texts.extend(r.metadata.chunk_text for r in records)
+        self._source_metadata.extend(r.metadata.source_metadata or {} for r in records)
+        self._size = end
+
+    def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        code = self._lookup["ingestion_id"].get(ingestion_id)
+        if code is None:
+            return
+        rows = self._codes["ingestion_id"][: self._size] == code
+        rows &= ~self._deleted[: self._size]
+        deleted = int(rows.sum())
+        if not deleted:
+            return
+        self._deleted[: self._size] |= rows
+        self._deleted_count += deleted
+        if self._deleted_count >= self._compact_ratio * self._size:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop tombstoned rows, keeping the order of the others."""
+        if not self._deleted_count:
+            return
+        self._reserve(self._size)
+        keep = np.flatnonzero(~self._deleted[: self._size])
+        count = len(keep)
+        # Fancy indexing copies, so the in-place assignments are safe
+        for array in (self._vectors, self._sq_norms, self._chunk_indexes):
+            array[:count] = array[keep]
+        for codes in self._codes.values():
+            codes[:count] = codes[keep]
+        self._chunk_ids = [self._chunk_ids[i] for i in keep]
+        self._chunk_texts = [self._chunk_texts[i] for i in keep]
+        self._source_metadata = [self._source_metadata[i] for i in keep]
+        self._deleted[: self._size] = False
+        self._size = count
+        self._deleted_count = 0
+        # Rows moved: the next snapshot save must rewrite every segment
+        self._snapshot = None
+
+    def _reserve(self, rows: int) -> None:
+        """
+        Make every row array writable and able to hold `rows`, at least
+        doubling capacity when growing. Arrays mapped read-only from a
+        snapshot are copied into memory on the first write.
+        """
+        capacity = len(self._deleted)
+        if rows <= capacity and self._vectors.flags.writeable:
+            return
+        if rows > capacity:
+            capacity = max(rows, 2 * capacity)
+        self._vectors = self._resized(self._vectors, capacity)
+        self._sq_norms = self._resized(self._sq_norms, capacity)
+        self._deleted = self._resized(self._deleted, capacity)
+        self._chunk_indexes = self._resized(self._chunk_indexes, capacity)
+        self._codes = {
+            column: self._resized(codes, capacity)
+            for column, codes in self._codes.items()
+        }
+
+    def _resized(self, array: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+        grown[: self._size] = array[: self._size]
+        return grown
+
+    def _intern(self, column: str, value: str) -> int:
+        lookup = self._lookup[column]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self._values[column])
+            self._values[column].append(value)
+        return code
+
+    def _column_value(self, metadata: VectorMetadata, column: str) -> str:
+        if column == "provider":
+            return metadata.provider or self._provider
+        return getattr(metadata, column)
+
+    def _as_matrix(self, vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        """float32 rows of the store's dimension, normalized if configured."""
+        matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+        if matrix.shape[1] != self._dimension:
+            raise ValueError(
+                f"Expected {self._dimension}-dimensional vectors, got {matrix.shape[1]}"
+            )
+        if self._normalize:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            # Zero vectors have no direction; store them unchanged
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+        projection: str = "full",
+    ) -> List[Any]:
+        """
+        Return the k nearest live records, exactly (no ANN approximation).
+
+        filters and projection behave like in PgVectorStore; scores are
+        distances, lower = closer.
+        """
+        return self.similarity_search_batch(
+            [query_vector], k, filters=filters, projection=projection
+        )[0]
+
+    def similarity_search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+        projection: str = "full",
+    ) -> List[List[Any]]:
+        """similarity_search for many queries with one matrix product."""
+        if projection not in self.PROJECTIONS:
+            raise ValueError(
+                f"Unknown projection '{projection}'. Valid: {self.PROJECTIONS}"
+            )
+        if not len(query_vectors):
+            return []
+        queries = self._as_matrix(query_vectors)
+        mask = self._mask(filters)
+        k = min(k, int(mask.sum()))
+        if k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        rows, distances = self._top_k(queries, mask, k)
+        return [
+            [
+                self._to_result(int(row), float(distance), projection)
+                for row, distance in zip(rows[q], distances[q])
+            ]
+            for q in range(len(queries))
+        ]
+
+    def _top_k(
+        self, queries: np.ndarray, mask: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(queries, k) row numbers and distances, best first per query."""
+        distances = self._distances(queries)
+        # NaN sorts after every distance (inf included), so excluded rows
+        # are never picked while at least k rows remain
+        if not mask.all():
+            distances[:, ~mask] = np.nan
+        rows = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(distances, rows, axis=1)
+        if self._metric == "l2":
+            # The norm expansion loses precision on near-identical vectors;
+            # recompute the winners' distances directly
+            top = np.linalg.norm(self._vectors[rows] - queries[:, np.newaxis], axis=2)
+        order = np.argsort(top, axis=1, kind="stable")
+        return (
+            np.take_along_axis(rows, order, axis=1),
+            np.take_along_axis(top, order, axis=1),
+        )
+
+    def _distances(self, queries: np.ndarray) -> np.ndarray:
+        """(queries, rows) distances under the store's metric."""
+        dots = queries @ self._vectors[: self._size].T
+        if self._metric == "ip":
+            return np.negative(dots, out=dots)
+        sq_norms = self._sq_norms[: self._size]
+        query_sq_norms = np.einsum("ij,ij->i", queries, queries)[:, np.newaxis]
+        if self._metric == "l2":
+            # |x - q|^2 = |x|^2 - 2 x.q + |q|^2, computed in place
+            dots *= -2
+            dots += sq_norms
+            dots += query_sq_norms
+            return np.sqrt(np.maximum(dots, 0, out=dots), out=dots)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = 1 - dots / np.sqrt(sq_norms * query_sq_norms)
+        # Zero vectors have no direction; rank them last
+        return np.where(np.isfinite(distances), distances, np.inf)
+
+    def _mask(self, filters: Optional[SearchFilter]) -> np.ndarray:
+        """Live rows within filters, as a boolean array over [0, _size)."""
+        mask = ~self._deleted[: self._size]
+        if filters is None:
+            return mask
+        for column in INTERNED_COLUMNS:
+            value = getattr(filters, column)
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            lookup = self._lookup[column]
+            codes = [lookup[v] for v in values if v in lookup]
+            mask &= np.isin(self._codes[column][: self._size], codes)
+        if filters.metadata:
+            for row in np.flatnonzero(mask):
+                if not _contains(self._source_metadata[row], filters.metadata):
+                    mask[row] = False
+        return mask
+
+    def _to_result(self, row: int, distance: float, projection: str) -> Any:
+        if projection != "full":
+            return SearchHit(
+                ingestion_id=self._value(row, "ingestion_id"),
+                chunk_id=self._chunk_ids[row],
+                chunk_index=int(self._chunk_indexes[row]),
+                score=None if projection == "ids" else distance,
+                chunk_text=self._chunk_texts[row] if projection == "text" else None,
+            )
+        metadata = VectorMetadata(
+            ingestion_id=self._value(row, "ingestion_id"),
+            chunk_id=self._chunk_ids[row],
+            chunk_index=int(self._chunk_indexes[row]),
+            chunk_strategy=self._value(row, "chunk_strategy"),
+            chunk_text=self._chunk_texts[row],
+            source_metadata=self._source_metadata[row],
+            provider=self._value(row, "provider"),
+        )
+        return VectorRecord(
+            vector=self._vectors[row].tolist(), metadata=metadata, score=distance
+        )
+
+    def _value(self, row: int, column: str) -> str:
+        return self._values[column][self._codes[column][row]]
+
+
+def _contains(document: Any, fragment: Any) -> bool:
+    """JSONB containment (document @> fragment), for metadata filters."""
+    if isinstance(fragment, dict):
+        return isinstance(document, dict) and all(
+            key in document and _contains(document[key], value)
+            for key, value in fragment.items()
+        )
+    if isinstance(fragment, list):
+        return isinstance(document, list) and all(
+            any(_contains(item, value) for item in document) for value in fragment
+        )
+    return document == fragment
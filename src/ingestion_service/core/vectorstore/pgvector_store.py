@@ -1,15 +1,36 @@
 # src/ingestion_service/core/vectorstore/pgvector_store.py
 from __future__ import annotations
-from typing import Sequence, Iterable, List, Any
+from contextlib import AbstractContextManager
+from typing import (
+    Sequence,
+    Iterable,
+    List,
+    Any,
+    Dict,
+    Literal,
+    LiteralString,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 import psycopg
 from psycopg import sql
 from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
+from pgvector import HalfVector, Vector
+from pgvector.psycopg import register_vector
 import logging
+import math
 
+from ingestion_service.core.connection_pool import get_pool
 from ingestion_service.core.vectorstore.base import (
     VectorStore,
     VectorRecord,
     VectorMetadata,
+    LeanProjection,
+    SearchFilter,
+    SearchHit,
 )
 from ingestion_service.core.chunks import Chunk
 
@@ -20,137 +41,1233 @@ class PgVectorStore(VectorStore):
     SCHEMA = "ingestion_service"
     TABLE_NAME = "vectors"
 
-    def __init__(self, dsn: str, dimension: int, provider: str = "mock") -> None:
+    # Columns written by add(), in COPY / INSERT order
+    WRITE_COLUMNS = (
+        "vector",
+        "ingestion_id",
+        "chunk_id",
+        "chunk_index",
+        "chunk_strategy",
+        "chunk_text",
+        "source_metadata",
+        "provider",
+    )
+    # PostgreSQL types of WRITE_COLUMNS, required by binary COPY ("vector"
+    # stands for the store's storage type)
+    WRITE_TYPES = ("vector", "text", "text", "int4", "text", "text", "jsonb", "text")
+
+    # Write strategies for add():
+    # - "copy": binary COPY FROM STDIN, falls back to "executemany" on error
+    # - "executemany": one pipelined executemany() batch
+    # - "row": legacy one INSERT per record
+    WRITE_MODES = ("copy", "executemany", "row")
+
+    # ANN index access methods managed by create_index()
+    INDEX_METHODS = ("hnsw", "ivfflat")
+
+    # Distance metric -> (ORDER BY operator, ANN operator class). An index
+    # is only used when its operator class matches the query operator.
+    # "<#>" is the negative inner product, so ascending order is best first.
+    # Operators are spliced into SQL, hence literal strings only.
+    METRICS: Dict[str, Tuple[LiteralString, LiteralString]] = {
+        "l2": ("<->", "vector_l2_ops"),
+        "cosine": ("<=>", "vector_cosine_ops"),
+        "ip": ("<#>", "vector_ip_ops"),
+    }
+    # Storage types of the vector column (see migration
+    # 20261017_vectors_storage):
+    # - "vector": 4-byte floats, the default
+    # - "halfvec": 2-byte floats, about half the table and index size for a
+    #   small recall loss; needs pgvector >= 0.7. pgvector has no int8
+    #   vector type, so halfvec is the indexable scalar quantization.
+    STORAGE_TYPES = ("vector", "halfvec")
+
+    # pgvector's default and upper bound for hnsw.ef_search
+    _DEFAULT_EF_SEARCH = 40
+    _MAX_EF_SEARCH = 1000
+
+    # How similarity_search applies a SearchFilter (see its docstring)
+    FILTER_MODES = ("auto", "pre", "post")
+
+    # Text search configuration of the generated chunk_tsv column (see
+    # migration 20261017_add_vectors_tsv); queries must use the same one
+    TEXT_SEARCH_CONFIG = "simple"
+
+    # Columns returned by similarity_search, in VectorRecord order
+    SEARCH_COLUMNS = (
+        "vector",
+        "ingestion_id",
+        "chunk_id",
+        "chunk_index",
+        "chunk_strategy",
+        "chunk_text",
+        "source_metadata",
+        "provider",
+    )
+    # similarity_search projection -> selected columns. The distance is
+    # always selected too (it orders the results) and becomes the score,
+    # except for "ids".
+    PROJECTIONS = {
+        "ids": ("ingestion_id", "chunk_id", "chunk_index"),
+        "scores": ("ingestion_id", "chunk_id", "chunk_index"),
+        "text": ("ingestion_id", "chunk_id", "chunk_index", "chunk_text"),
+        "full": SEARCH_COLUMNS,
+    }
+
+    def __init__(
+        self,
+        dsn: str,
+        dimension: int,
+        provider: str = "mock",
+        write_mode: str = "copy",
+        pool: Optional[ConnectionPool] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        metric: str = "l2",
+        normalize: bool = False,
+        filter_exact_max_rows: int = 10_000,
+        filter_overfetch: int = 4,
+        hybrid_vector_weight: float = 1.0,
+        hybrid_text_weight: float = 1.0,
+        hybrid_rrf_k: int = 60,
+        storage: str = "vector",
+        binary_rescore: int = 0,
+    ) -> None:
+        if write_mode not in self.WRITE_MODES:
+            raise ValueError(
+                f"Unknown write_mode '{write_mode}'. Valid: {self.WRITE_MODES}"
+            )
+        if metric not in self.METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Valid: {tuple(self.METRICS)}")
+        if storage not in self.STORAGE_TYPES:
+            raise ValueError(
+                f"Unknown storage '{storage}'. Valid: {self.STORAGE_TYPES}"
+            )
+        if binary_rescore < 0:
+            raise ValueError(f"binary_rescore must be >= 0, got {binary_rescore}")
         self._dsn = dsn
         self._dimension = dimension
         self._provider = provider
+        self._write_mode = write_mode
+        # Injected pool, otherwise the process-wide pool for this DSN
+        self._pool = pool
+        # Query-time ANN knobs (None = server default), see similarity_search
+        self._ef_search = ef_search
+        self._probes = probes
+        self._metric = metric
+        # Unit-normalize vectors on write and query: inner product then ranks
+        # exactly like cosine without computing norms per comparison
+        self._normalize = normalize
+        # Filtered searches: exact below this many matching rows, otherwise
+        # ANN with k * filter_overfetch candidates (grown on shortfall)
+        self._filter_exact_max_rows = filter_exact_max_rows
+        self._filter_overfetch = filter_overfetch
+        # hybrid_search defaults: per-side RRF weights and the rank offset
+        # (larger rrf_k flattens the advantage of the very top ranks)
+        self._hybrid_vector_weight = hybrid_vector_weight
+        self._hybrid_text_weight = hybrid_text_weight
+        self._hybrid_rrf_k = hybrid_rrf_k
+        # Column type of the vector column; query vectors are cast to it
+        self._storage = storage
+        # > 0: ANN candidates are picked by Hamming distance between
+        # binary-quantized vectors (one bit per dimension, served by the
+        # bit index create_index() builds), binary_rescore times as many as
+        # needed, then re-ranked by the exact distance. 0 = off.
+        self._binary_rescore = binary_rescore
         self._validate_table()
 
     @property
     def dimension(self) -> int:
         return self._dimension
 
+    @property
+    def metric(self) -> str:
+        return self._metric
+
+    @property
+    def storage(self) -> str:
+        return self._storage
+
     def persist(
-        self, chunks: list[Chunk], embeddings: list[Any], ingestion_id: str
+        self,
+        chunks: list[Chunk],
+        embeddings: list[Any],
+        ingestion_id: str,
+        start_index: int = 0,
     ) -> None:
-        """Convert chunks+embeddings to VectorRecords and add to store."""
+        """
+        Convert chunks+embeddings to VectorRecords and add to store.
+
+        start_index offsets chunk_index when a document is persisted in
+        several windows (streaming PDF ingestion).
+        """
         logging.debug(
             "PgVectorStore.persist: %d chunks, %d embeddings",
             len(chunks),
             len(embeddings),
         )
-        records = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            # Merge enriched metadata with chunk content and indexing
-            metadata_dict = dict(chunk.metadata or {})
-            metadata_dict["chunk_text"] = (
-                chunk.content
-            )  # ensure text is stored in metadata
-
-            record = VectorRecord(
-                vector=embedding,
-                metadata=VectorMetadata(
-                    ingestion_id=ingestion_id,
-                    chunk_id=chunk.chunk_id,
-                    chunk_index=i,
-                    chunk_strategy=chunk.metadata.get("chunk_strategy", "unknown"),
-                    chunk_text=chunk.content,
-                    source_metadata=metadata_dict,
-                    provider=chunk.metadata.get("provider", self._provider),
-                ),
-            )
-            records.append(record)
+        records = [
+            self._to_record(chunk, embedding, ingestion_id, i)
+            for i, (chunk, embedding) in enumerate(
+                zip(chunks, embeddings), start=start_index
+            )
+        ]
         self.add(records)
         logging.debug("PgVectorStore.persist: added %d records", len(records))
 
     def add(self, records: Iterable[VectorRecord]) -> None:
-        insert_sql = sql.SQL(
-            """
-            INSERT INTO {schema}.{table}
-                (vector,
-                 ingestion_id,
-                 chunk_id,
-                 chunk_index,
-                 chunk_strategy,
-                 chunk_text,
-                 source_metadata,
-                 provider)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        rows = [self._to_row(record) for record in records]
+        if not rows:
+            return
+
+        with self._connection() as conn:
+            self._write_rows(conn, rows)
+
+    def chunk_digests(self, ingestion_id: str) -> Dict[str, str]:
+        """
+        chunk_id -> chunk_digest(chunk_text) of an ingestion's stored rows.
+
+        Hashed server-side, so only IDs and digests cross the wire.
+        """
+        digest_sql = sql.SQL(
+            """
+            SELECT chunk_id, encode(sha256(convert_to(chunk_text, 'UTF8')), 'hex')
+            FROM {schema}.{table}
+            WHERE ingestion_id = %s
             """
         ).format(
             schema=sql.Identifier(self.SCHEMA),
             table=sql.Identifier(self.TABLE_NAME),
         )
+        with self._connection() as conn:
+            return dict(conn.execute(digest_sql, (ingestion_id,)).fetchall())
+
+    def replace_ingestion(
+        self,
+        *,
+        chunks: List[Chunk],
+        embeddings: Dict[str, Any],
+        ingestion_id: str,
+        previous_ingestion_id: str,
+    ) -> None:
+        """
+        Store a new version of a document in one transaction.
+
+        `chunks` is the complete new version, in order. Chunks with an
+        entry in `embeddings` (chunk_id -> vector) are inserted; every
+        other chunk must be stored unchanged under previous_ingestion_id
+        and its row is moved to ingestion_id (re-indexed, with the chunk's
+        new metadata such as its character offsets) instead of re-embedded.
+        The previous version's remaining rows are deleted.
+        """
+        rows = []
+        kept_ids: List[str] = []
+        kept_indexes: List[int] = []
+        kept_metadata: List[Jsonb] = []
+        for index, chunk in enumerate(chunks):
+            if chunk.chunk_id in embeddings:
+                record = self._to_record(
+                    chunk, embeddings[chunk.chunk_id], ingestion_id, index
+                )
+                rows.append(self._to_row(record))
+            else:
+                kept_ids.append(chunk.chunk_id)
+                kept_indexes.append(index)
+                kept_metadata.append(Jsonb(self._source_metadata(chunk)))
 
-        with psycopg.connect(self._dsn) as conn:
+        table = {
+            "schema": sql.Identifier(self.SCHEMA),
+            "table": sql.Identifier(self.TABLE_NAME),
+        }
+        delete_sql = sql.SQL(
+            """
+            DELETE FROM {schema}.{table}
+            WHERE ingestion_id = %s AND NOT (chunk_id = ANY(%s))
+            """
+        ).format(**table)
+        move_sql = sql.SQL(
+            """
+            UPDATE {schema}.{table} AS t
+            SET ingestion_id = %s,
+                chunk_index = kept.chunk_index,
+                source_metadata = kept.source_metadata
+            FROM unnest(%s::text[], %s::int4[], %s::jsonb[])
+                AS kept(chunk_id, chunk_index, source_metadata)
+            WHERE t.ingestion_id = %s AND t.chunk_id = kept.chunk_id
+            """
+        ).format(**table)
+
+        with self._connection() as conn:
             with conn.cursor() as cur:
-                for record in records:
-                    cur.execute(
-                        insert_sql,
-                        (
-                            record.vector,
-                            record.metadata.ingestion_id,
-                            record.metadata.chunk_id,
-                            record.metadata.chunk_index,
-                            record.metadata.chunk_strategy,
-                            record.metadata.chunk_text,
-                            Jsonb(record.metadata.source_metadata or {}),
-                            record.metadata.provider or self._provider,
-                        ),
+                # Two re-ingestions of the same version must not both move
+                # its rows; the second one waits, then fails the check below
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                    (previous_ingestion_id,),
+                )
+                cur.execute(delete_sql, (previous_ingestion_id, kept_ids))
+                cur.execute(
+                    move_sql,
+                    (
+                        ingestion_id,
+                        kept_ids,
+                        kept_indexes,
+                        kept_metadata,
+                        previous_ingestion_id,
+                    ),
+                )
+                if cur.rowcount < len(kept_ids):
+                    raise RuntimeError(
+                        f"Ingestion {previous_ingestion_id} changed during "
+                        f"re-ingestion: {cur.rowcount}/{len(kept_ids)} unchanged "
+                        "chunks left to keep"
                     )
+            if rows:
+                self._write_rows(conn, rows)
+        logging.debug(
+            "PgVectorStore.replace_ingestion: kept %d, inserted %d chunks",
+            len(kept_ids),
+            len(rows),
+        )
+
+    # ------------------------------------------------------------------
+    # Connections
+    # ------------------------------------------------------------------
+    def _connection(self) -> AbstractContextManager[psycopg.Connection]:
+        """Borrow a pooled connection; commits on success, rolls back on error."""
+        pool = self._pool or get_pool(self._dsn)
+        return pool.connection()
+
+    @staticmethod
+    def _register_vector_types(conn: psycopg.Connection) -> None:
+        """Register pgvector adapters once per (pooled) connection."""
+        if conn.adapters.types.get("vector") is None:
+            register_vector(conn)
+
+    # ------------------------------------------------------------------
+    # Write strategies
+    # ------------------------------------------------------------------
+    def _prepare_vector(self, vector: Sequence[float]) -> List[float]:
+        values = list(vector)
+        if not self._normalize:
+            return values
+        norm = math.hypot(*values)
+        # Zero vectors have no direction; store them unchanged
+        return [v / norm for v in values] if norm else values
+
+    @staticmethod
+    def _source_metadata(chunk: Chunk) -> Dict[str, Any]:
+        # Merge enriched metadata with chunk content and indexing
+        metadata_dict = dict(chunk.metadata or {})
+        metadata_dict["chunk_text"] = chunk.content  # ensure text is stored in metadata
+        return metadata_dict
+
+    def _to_record(
+        self, chunk: Chunk, embedding: Any, ingestion_id: str, index: int
+    ) -> VectorRecord:
+        metadata_dict = self._source_metadata(chunk)
+
+        return VectorRecord(
+            vector=embedding,
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=chunk.chunk_id,
+                chunk_index=index,
+                chunk_strategy=chunk.metadata.get("chunk_strategy", "unknown"),
+                chunk_text=chunk.content,
+                source_metadata=metadata_dict,
+                provider=chunk.metadata.get("provider", self._provider),
+            ),
+        )
+
+    def _to_row(self, record: VectorRecord) -> tuple:
+        return (
+            self._prepare_vector(record.vector),
+            record.metadata.ingestion_id,
+            record.metadata.chunk_id,
+            record.metadata.chunk_index,
+            record.metadata.chunk_strategy,
+            record.metadata.chunk_text,
+            Jsonb(record.metadata.source_metadata or {}),
+            record.metadata.provider or self._provider,
+        )
+
+    def _encode_vector(self, values: List[float]) -> Any:
+        """pgvector value of the storage type, sent in its native encoding."""
+        if self._storage == "halfvec":
+            return HalfVector(values)
+        return Vector(values)
+
+    def _insert_sql(self) -> sql.Composed:
+        return sql.SQL(
+            "INSERT INTO {schema}.{table} ({columns}) VALUES ({values})"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            columns=sql.SQL(", ").join(map(sql.Identifier, self.WRITE_COLUMNS)),
+            values=sql.SQL(", ").join(sql.Placeholder() * len(self.WRITE_COLUMNS)),
+        )
 
+    def _write_rows(self, conn: psycopg.Connection, rows: List[tuple]) -> None:
+        """Write rows with the store's write_mode, inside the caller's transaction."""
+        if self._write_mode == "row":
+            self._insert_rows(conn, rows)
+            return
+
+        if self._write_mode == "copy":
+            try:
+                # Savepoint: a failed COPY must not roll back earlier
+                # statements of the caller's transaction
+                with conn.transaction():
+                    self._copy_rows(conn, rows)
+                return
+            except psycopg.Error as exc:
+                # Binary COPY needs exact column types and a server/proxy
+                # that supports COPY; anything else takes the slower but
+                # more forgiving parameterised path.
+                logging.warning(
+                    "PgVectorStore.add: COPY failed (%s), falling back to executemany",
+                    exc,
+                )
+
+        self._executemany_rows(conn, rows)
+
+    def _copy_rows(self, conn: psycopg.Connection, rows: List[tuple]) -> None:
+        """Stream rows with binary COPY using pgvector's binary vector format."""
+        self._register_vector_types(conn)
+
+        copy_sql = sql.SQL(
+            "COPY {schema}.{table} ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            columns=sql.SQL(", ").join(map(sql.Identifier, self.WRITE_COLUMNS)),
+        )
+
+        with conn.cursor() as cur:
+            with cur.copy(copy_sql) as copy:
+                copy.set_types([self._storage, *self.WRITE_TYPES[1:]])
+                for row in rows:
+                    copy.write_row((self._encode_vector(row[0]), *row[1:]))
+
+    def _executemany_rows(self, conn: psycopg.Connection, rows: List[tuple]) -> None:
+        """Insert rows in one executemany() call (pipelined by psycopg)."""
+        self._register_vector_types(conn)
+        # Adapting plain lists goes through float8[] and dominates the cost;
+        # pgvector's dumpers send the native vector encoding instead.
+        params = [(self._encode_vector(row[0]), *row[1:]) for row in rows]
+        with conn.cursor() as cur:
+            cur.executemany(self._insert_sql(), params)
+
+    def _insert_rows(self, conn: psycopg.Connection, rows: List[tuple]) -> None:
+        """Insert rows one statement at a time (legacy path, one round trip each)."""
+        insert_sql = self._insert_sql()
+        with conn.cursor() as cur:
+            for row in rows:
+                cur.execute(insert_sql, row)
+
+    @overload
+    def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: Literal["full"] = ...,
+    ) -> List[VectorRecord]: ...
+
+    @overload
     def similarity_search(
-        self, query_vector: Sequence[float], k: int
-    ) -> List[VectorRecord]:
-        search_sql = sql.SQL(
-            """
-            SELECT
-                vector,
-                ingestion_id,
-                chunk_id,
-                chunk_index,
-                chunk_strategy,
-                chunk_text,
-                source_metadata,
-                provider
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: LeanProjection,
+    ) -> List[SearchHit]: ...
+
+    def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+        filter_mode: str = "auto",
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        projection: str = "full",
+    ) -> List[Any]:
+        """
+        Return the k nearest records under the store's metric.
+
+        projection picks what comes back (see PROJECTIONS):
+        - "full" (default): VectorRecords with vector, metadata and score
+        - "text" / "scores" / "ids": lean SearchHits; the stored vector and
+          source_metadata are never sent over the wire
+
+        Scores are distances under the store's metric, lower = closer
+        (for "ip", the negative inner product).
+
+        filters scopes the search (see SearchFilter). filter_mode picks how:
+        - "pre": exact search over the matching rows, which the B-tree / GIN
+          indexes narrow down; best for selective filters
+        - "post": ANN search over-fetching candidates, filtered afterwards;
+          the over-fetch grows until k rows survive, with exact search as
+          the last resort
+        - "auto" (default): "pre" when at most filter_exact_max_rows rows
+          match, "post" otherwise
+
+        ef_search / probes override the store's defaults for this call. They
+        only matter when an HNSW / IVFFlat index is used and trade recall for
+        latency (higher = closer to exact search, slower).
+        """
+        self._check_search_options(filter_mode, projection)
+        columns = self.PROJECTIONS[projection]
+        where = self._filter_clause(filters)
+        # Native vector encoding; adapting a list goes through float8[]
+        query = Vector(self._prepare_vector(query_vector))
+
+        with self._connection() as conn:
+            # Pooled connections may already carry pgvector adapters; register
+            # them everywhere so vectors always come back as Vector objects.
+            self._register_vector_types(conn)
+            with conn.cursor() as cur:
+                if where is None:
+                    rows = self._ann_search(cur, query, k, columns, ef_search, probes)
+                elif filter_mode == "pre" or (
+                    filter_mode == "auto"
+                    and self._matches_at_most(cur, where, self._filter_exact_max_rows)
+                ):
+                    rows = self._exact_search(cur, query, k, where, columns)
+                else:
+                    rows = self._post_filter_search(
+                        cur, query, k, where, columns, ef_search, probes
+                    )
+
+        return [self._to_result(row, projection) for row in rows]
+
+    @overload
+    def similarity_search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: Literal["full"] = ...,
+    ) -> List[List[VectorRecord]]: ...
+
+    @overload
+    def similarity_search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: LeanProjection,
+    ) -> List[List[SearchHit]]: ...
+
+    def similarity_search_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+        filter_mode: str = "auto",
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        projection: str = "full",
+    ) -> List[List[Any]]:
+        """
+        similarity_search for many queries in one statement and round trip.
+
+        The queries are sent as one vector[] and searched through a LATERAL
+        join (one ANN index scan per query). Returns one result list per
+        query, in query order. Filters are planned like similarity_search;
+        in post-filter mode a query left with fewer than k rows is searched
+        exactly, in the same transaction.
+        """
+        self._check_search_options(filter_mode, projection)
+        columns = self.PROJECTIONS[projection]
+        queries = [Vector(self._prepare_vector(q)) for q in query_vectors]
+        if not queries:
+            return []
+        where = self._filter_clause(filters)
+
+        with self._connection() as conn:
+            self._register_vector_types(conn)
+            with conn.cursor() as cur:
+                if where is None:
+                    candidates = self._candidate_limit(k)
+                    if self._binary_rescore:
+                        ef_search = self._candidate_ef(ef_search, candidates)
+                    self._apply_search_params(cur, candidates, ef_search, probes)
+                    grouped = self._batch_search(cur, queries, k, candidates, columns)
+                elif filter_mode == "pre" or (
+                    filter_mode == "auto"
+                    and self._matches_at_most(cur, where, self._filter_exact_max_rows)
+                ):
+                    self._set_local(cur, {"enable_indexscan": "off"})
+                    grouped = self._batch_search(
+                        cur, queries, k, k, columns, inner_where=where
+                    )
+                else:
+                    candidates = self._candidate_limit(
+                        k * max(2, self._filter_overfetch)
+                    )
+                    ef = self._candidate_ef(ef_search, candidates)
+                    self._apply_search_params(cur, candidates, ef, probes)
+                    grouped = self._batch_search(
+                        cur, queries, k, candidates, columns, outer_where=where
+                    )
+                    for i, rows in enumerate(grouped):
+                        if len(rows) < k:
+                            grouped[i] = self._exact_search(
+                                cur, queries[i], k, where, columns
+                            )
+
+        return [[self._to_result(row, projection) for row in rows] for rows in grouped]
+
+    @overload
+    def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        vector_weight: Optional[float] = ...,
+        text_weight: Optional[float] = ...,
+        rrf_k: Optional[int] = ...,
+        candidates: Optional[int] = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: Literal["full"] = ...,
+    ) -> List[VectorRecord]: ...
+
+    @overload
+    def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = ...,
+        filter_mode: str = ...,
+        vector_weight: Optional[float] = ...,
+        text_weight: Optional[float] = ...,
+        rrf_k: Optional[int] = ...,
+        candidates: Optional[int] = ...,
+        ef_search: Optional[int] = ...,
+        probes: Optional[int] = ...,
+        projection: LeanProjection,
+    ) -> List[SearchHit]: ...
+
+    def hybrid_search(
+        self,
+        query_vector: Sequence[float],
+        query_text: str,
+        k: int,
+        *,
+        filters: Optional[SearchFilter] = None,
+        filter_mode: str = "auto",
+        vector_weight: Optional[float] = None,
+        text_weight: Optional[float] = None,
+        rrf_k: Optional[int] = None,
+        candidates: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        projection: str = "full",
+    ) -> List[Any]:
+        """
+        Return the k best records for a vector plus a full-text query.
+
+        One statement ranks the `candidates` (default 4 * k) nearest rows
+        through the ANN index and the `candidates` best full-text matches
+        of query_text (websearch syntax: quoted phrases, OR, -term) through
+        the GIN index on chunk_tsv, then fuses both lists with reciprocal
+        rank fusion:
+
+            score = vector_weight / (rrf_k + vector rank)
+                  + text_weight / (rrf_k + text rank)
+
+        A row missing from one list gets nothing from it, so an exact term
+        match (part number, error code) surfaces even when its embedding is
+        far from the query, and neither side needs a full scan. The weights
+        and rrf_k default to the store's settings; a weight of 0 turns off
+        that side's contribution.
+
+        Results are ordered by the fused score, returned as rrf_score
+        (higher = better). score keeps the similarity_search meaning: the
+        distance to query_vector, None for rows only the text side found.
+        filters / filter_mode, ef_search / probes and
+        projection behave like in similarity_search, except that a
+        post-filtered vector side is not topped up by exact search: the
+        text side already fills the fused list.
+        """
+        self._check_search_options(filter_mode, projection)
+        columns = self.PROJECTIONS[projection]
+        where = self._filter_clause(filters)
+        query = Vector(self._prepare_vector(query_vector))
+        candidates = max(candidates or 4 * k, k)
+        weights = (
+            self._hybrid_vector_weight if vector_weight is None else vector_weight,
+            self._hybrid_text_weight if text_weight is None else text_weight,
+            self._hybrid_rrf_k if rrf_k is None else rrf_k,
+        )
+
+        with self._connection() as conn:
+            self._register_vector_types(conn)
+            with conn.cursor() as cur:
+                # Vector side: plain ANN, exact within a selective filter, or
+                # ANN over-fetch filtered afterwards (as in similarity_search)
+                inner_where = outer_where = None
+                fetch = candidates
+                if where is None:
+                    fetch = self._candidate_limit(candidates)
+                    if self._binary_rescore:
+                        ef_search = self._candidate_ef(ef_search, fetch)
+                    self._apply_search_params(cur, fetch, ef_search, probes)
+                elif filter_mode == "pre" or (
+                    filter_mode == "auto"
+                    and self._matches_at_most(cur, where, self._filter_exact_max_rows)
+                ):
+                    inner_where = where
+                    self._set_local(cur, {"enable_indexscan": "off"})
+                else:
+                    outer_where = where
+                    fetch = self._candidate_limit(
+                        candidates * max(2, self._filter_overfetch)
+                    )
+                    ef = self._candidate_ef(ef_search, fetch)
+                    self._apply_search_params(cur, fetch, ef, probes)
+
+                cur.execute(
+                    self._hybrid_sql(columns, inner_where, outer_where, where),
+                    self._hybrid_params(
+                        query,
+                        query_text,
+                        k,
+                        candidates,
+                        fetch,
+                        weights,
+                        (inner_where, outer_where, where),
+                    ),
+                    binary=True,
+                )
+                rows = cur.fetchall()
+
+        return [self._to_result(row, projection, fused=True) for row in rows]
+
+    def _hybrid_sql(
+        self,
+        columns: Tuple[str, ...],
+        inner_where: Optional[Tuple[sql.Composable, List[Any]]],
+        outer_where: Optional[Tuple[sql.Composable, List[Any]]],
+        text_where: Optional[Tuple[sql.Composable, List[Any]]],
+    ) -> sql.Composed:
+        """Vector and full-text top lists fused by RRF; see hybrid_search."""
+
+        def clause(keyword: LiteralString, where) -> sql.Composable:
+            if where is None:
+                return sql.SQL("")
+            return sql.SQL("{} {}").format(sql.SQL(keyword), where[0])
+
+        return sql.SQL(
+            """
+            WITH semantic AS (
+                SELECT id, distance, row_number() OVER (ORDER BY distance) AS rank
+                FROM (
+                    SELECT *, vector {operator} {query} AS distance
+                    FROM {schema}.{table}
+                    {inner_where}
+                    ORDER BY {order}
+                    LIMIT %s
+                ) AS nearest
+                {outer_where}
+                ORDER BY distance
+                LIMIT %s
+            ),
+            lexical AS (
+                SELECT id, row_number() OVER (ORDER BY score DESC, id) AS rank
+                FROM (
+                    SELECT id, ts_rank_cd(chunk_tsv, query) AS score
+                    FROM {schema}.{table},
+                         websearch_to_tsquery({config}, %s) AS query
+                    WHERE chunk_tsv @@ query {text_where}
+                    ORDER BY score DESC
+                    LIMIT %s
+                ) AS matches
+            ),
+            fused AS (
+                SELECT
+                    id,
+                    semantic.distance,
+                    coalesce(%s::float8 / (%s + semantic.rank), 0)
+                        + coalesce(%s::float8 / (%s + lexical.rank), 0) AS rrf_score
+                FROM semantic FULL OUTER JOIN lexical USING (id)
+            )
+            SELECT {columns}, fused.distance, fused.rrf_score
+            FROM fused JOIN {schema}.{table} USING (id)
+            ORDER BY fused.rrf_score DESC, id
+            LIMIT %s
+            """
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            operator=sql.SQL(self.METRICS[self._metric][0]),
+            query=self._query_param(),
+            order=(
+                self._candidate_order(self._query_param())
+                if inner_where is None
+                else sql.SQL("distance")
+            ),
+            config=sql.Literal(self.TEXT_SEARCH_CONFIG),
+            inner_where=clause("WHERE", inner_where),
+            outer_where=clause("WHERE", outer_where),
+            text_where=clause("AND", text_where),
+        )
+
+    def _hybrid_params(
+        self,
+        query_vector: Vector,
+        query_text: str,
+        k: int,
+        candidates: int,
+        fetch: int,
+        weights: Tuple[float, float, int],
+        wheres: Tuple[Optional[Tuple[sql.Composable, List[Any]]], ...],
+    ) -> tuple:
+        """Parameters of _hybrid_sql, in placeholder order."""
+        inner_params, outer_params, text_params = (
+            where[1] if where else [] for where in wheres
+        )
+        vector_weight, text_weight, rrf_k = weights
+        # The Hamming ORDER BY repeats the query vector (see _hybrid_sql)
+        rescored = (query_vector,) if self._binary_rescore and not wheres[0] else ()
+        return (
+            query_vector,
+            *inner_params,
+            *rescored,
+            fetch,
+            *outer_params,
+            candidates,
+            query_text,
+            *text_params,
+            candidates,
+            vector_weight,
+            rrf_k,
+            text_weight,
+            rrf_k,
+            k,
+        )
+
+    def _check_search_options(self, filter_mode: str, projection: str) -> None:
+        if filter_mode not in self.FILTER_MODES:
+            raise ValueError(
+                f"Unknown filter_mode '{filter_mode}'. Valid: {self.FILTER_MODES}"
+            )
+        if projection not in self.PROJECTIONS:
+            raise ValueError(
+                f"Unknown projection '{projection}'. Valid: {tuple(self.PROJECTIONS)}"
+            )
+
+    def _batch_search(
+        self,
+        cur: psycopg.Cursor,
+        queries: List[Vector],
+        k: int,
+        candidates: int,
+        columns: Tuple[str, ...],
+        *,
+        inner_where: Optional[Tuple[sql.Composable, List[Any]]] = None,
+        outer_where: Optional[Tuple[sql.Composable, List[Any]]] = None,
+    ) -> List[List[tuple]]:
+        """
+        Top-k rows per query: `candidates` nearest rows per query (within
+        inner_where), then outer_where, then the k best survivors.
+        """
+        inner_condition, inner_params = inner_where or (None, [])
+        outer_condition, outer_params = outer_where or (None, [])
+        batch_sql = sql.SQL(
+            """
+            SELECT ord, {columns}, distance
+            FROM (
+                SELECT
+                    q.ord,
+                    c.*,
+                    row_number() OVER (PARTITION BY q.ord ORDER BY c.distance)
+                        AS rank
+                FROM unnest(%s::{storage}[]) WITH ORDINALITY AS q(query, ord)
+                CROSS JOIN LATERAL (
+                    SELECT t.*, t.vector {operator} q.query AS distance
+                    FROM {schema}.{table} AS t
+                    {inner_where}
+                    ORDER BY {order}
+                    LIMIT %s
+                ) AS c
+                {outer_where}
+            ) AS ranked
+            WHERE rank <= %s
+            ORDER BY ord, rank
+            """
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            operator=sql.SQL(self.METRICS[self._metric][0]),
+            storage=sql.Identifier(self._storage),
+            order=(
+                sql.SQL("distance")
+                if inner_condition
+                else self._candidate_order(sql.SQL("q.query"))
+            ),
+            inner_where=(
+                sql.SQL("WHERE {}").format(inner_condition)
+                if inner_condition
+                else sql.SQL("")
+            ),
+            outer_where=(
+                sql.SQL("WHERE {}").format(outer_condition)
+                if outer_condition
+                else sql.SQL("")
+            ),
+        )
+        cur.execute(
+            batch_sql,
+            (queries, *inner_params, candidates, *outer_params, k),
+            binary=True,
+        )
+
+        grouped: List[List[tuple]] = [[] for _ in queries]
+        for ord_, *row in cur.fetchall():
+            grouped[ord_ - 1].append(tuple(row))
+        return grouped
+
+    def _search_sql(
+        self, columns: Tuple[str, ...], where: Optional[sql.Composable] = None
+    ) -> sql.Composed:
+        return sql.SQL(
+            """
+            SELECT {columns}, vector {operator} {query} AS distance
             FROM {schema}.{table}
-            ORDER BY vector <-> (%s::vector)
+            {where}
+            ORDER BY distance
             LIMIT %s
             """
         ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
             schema=sql.Identifier(self.SCHEMA),
             table=sql.Identifier(self.TABLE_NAME),
+            where=sql.SQL("WHERE {}").format(where) if where else sql.SQL(""),
+            operator=sql.SQL(self.METRICS[self._metric][0]),
+            query=self._query_param(),
         )
 
-        results: List[VectorRecord] = []
+    def _exact_search(
+        self,
+        cur: psycopg.Cursor,
+        query_vector: Vector,
+        k: int,
+        where: Tuple[sql.Composable, List[Any]],
+        columns: Tuple[str, ...],
+    ) -> List[tuple]:
+        """Pre-filter: sort every matching row by exact distance."""
+        condition, params = where
+        # HNSW / IVFFlat are index scans and would filter after the ANN
+        # cutoff; bitmap scans on the B-tree / GIN indexes stay available.
+        self._set_local(cur, {"enable_indexscan": "off"})
+        cur.execute(
+            self._search_sql(columns, condition),
+            (query_vector, *params, k),
+            binary=True,
+        )
+        return cur.fetchall()
 
-        with psycopg.connect(self._dsn) as conn:
-            with conn.cursor() as cur:
-                cur.execute(search_sql, (query_vector, k))
-                for row in cur.fetchall():
-                    (
-                        vector,
-                        ingestion_id,
-                        chunk_id,
-                        chunk_index,
-                        chunk_strategy,
-                        chunk_text,
-                        source_metadata,
-                        provider,
-                    ) = row
-
-                    metadata = VectorMetadata(
-                        ingestion_id=ingestion_id,
-                        chunk_id=chunk_id,
-                        chunk_index=chunk_index,
-                        chunk_strategy=chunk_strategy,
-                        chunk_text=chunk_text,
-                        source_metadata=source_metadata,
-                        provider=provider,
-                    )
-                    results.append(VectorRecord(vector=vector, metadata=metadata))
+    def _ann_search(
+        self,
+        cur: psycopg.Cursor,
+        query_vector: Vector,
+        k: int,
+        columns: Tuple[str, ...],
+        ef_search: Optional[int],
+        probes: Optional[int],
+    ) -> List[tuple]:
+        """Unscoped ANN search; with binary_rescore, re-ranked candidates."""
+        if not self._binary_rescore:
+            self._apply_search_params(cur, k, ef_search, probes)
+            cur.execute(self._search_sql(columns), (query_vector, k), binary=True)
+            return cur.fetchall()
+
+        candidates = self._candidate_limit(k)
+        ef = self._candidate_ef(ef_search, candidates)
+        self._apply_search_params(cur, candidates, ef, probes)
+        cur.execute(
+            self._candidates_sql(columns),
+            (*self._candidate_params(query_vector), candidates, k),
+            binary=True,
+        )
+        return cur.fetchall()
+
+    def _post_filter_search(
+        self,
+        cur: psycopg.Cursor,
+        query_vector: Vector,
+        k: int,
+        where: Tuple[sql.Composable, List[Any]],
+        columns: Tuple[str, ...],
+        ef_search: Optional[int],
+        probes: Optional[int],
+    ) -> List[tuple]:
+        """Post-filter: ANN candidates first, then the filter."""
+        condition, params = where
+        post_sql = self._candidates_sql(columns, condition)
+
+        growth = max(2, self._filter_overfetch)
+        candidates = k * growth
+        while True:
+            # The HNSW candidate list must cover the over-fetch
+            limit = self._candidate_limit(candidates)
+            ef = self._candidate_ef(ef_search, limit)
+            self._apply_search_params(cur, limit, ef, probes)
+            cur.execute(
+                post_sql,
+                (*self._candidate_params(query_vector), limit, *params, k),
+                binary=True,
+            )
+            rows = cur.fetchall()
+            if len(rows) >= k or limit >= self._MAX_EF_SEARCH:
+                break
+            candidates *= growth
+
+        if len(rows) < k:
+            logging.debug(
+                "PgVectorStore: post-filter found %d/%d rows, searching exactly",
+                len(rows),
+                k,
+            )
+            rows = self._exact_search(cur, query_vector, k, where, columns)
+        return rows
+
+    def _candidates_sql(
+        self, columns: Tuple[str, ...], where: Optional[sql.Composable] = None
+    ) -> sql.Composed:
+        """The k best by distance of the ANN candidates passing `where`."""
+        return sql.SQL(
+            """
+            SELECT {columns}, distance
+            FROM (
+                SELECT *, vector {operator} {query} AS distance
+                FROM {schema}.{table}
+                ORDER BY {order}
+                LIMIT %s
+            ) AS candidates
+            {where}
+            ORDER BY distance
+            LIMIT %s
+            """
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            where=sql.SQL("WHERE {}").format(where) if where else sql.SQL(""),
+            operator=sql.SQL(self.METRICS[self._metric][0]),
+            query=self._query_param(),
+            order=self._candidate_order(self._query_param()),
+        )
+
+    # ------------------------------------------------------------------
+    # Compact storage
+    # ------------------------------------------------------------------
+    def _query_param(self) -> sql.Composable:
+        """Query vector placeholder, cast to the storage type."""
+        return sql.SQL("(%s::{})").format(sql.Identifier(self._storage))
+
+    def _bits(self, vector: sql.Composable) -> sql.Composable:
+        """
+        Binary quantization: one bit per dimension (set when positive).
+        Must match the bit index expression for the index to be used.
+        """
+        return sql.SQL("(binary_quantize({})::bit({}))").format(
+            vector, sql.Literal(self._dimension)
+        )
+
+    def _candidate_order(self, query: sql.Composable) -> sql.Composable:
+        """
+        ORDER BY picking the ANN candidates: the distance, or with
+        binary_rescore the Hamming distance of the quantized vectors.
+        Callers re-rank the candidates by distance either way.
+        """
+        if not self._binary_rescore:
+            return sql.SQL("distance")
+        return sql.SQL("{} <~> binary_quantize({})").format(
+            self._bits(sql.Identifier("vector")), query
+        )
+
+    def _candidate_params(self, query_vector: Vector) -> tuple:
+        """Query vector parameters of a candidate scan (see _candidate_order)."""
+        if self._binary_rescore:
+            return (query_vector, query_vector)
+        return (query_vector,)
+
+    def _candidate_limit(self, count: int) -> int:
+        """Candidates to scan for `count` results after rescoring."""
+        return count * max(1, self._binary_rescore)
+
+    def _candidate_ef(self, ef_search: Optional[int], limit: int) -> int:
+        """HNSW returns at most ef_search rows; cover a scan of `limit`."""
+        return max(ef_search or self._ef_search or self._DEFAULT_EF_SEARCH, limit)
+
+    def _matches_at_most(
+        self,
+        cur: psycopg.Cursor,
+        where: Tuple[sql.Composable, List[Any]],
+        limit: int,
+    ) -> bool:
+        """Whether the filter matches <= limit rows; counts at most limit + 1."""
+        condition, params = where
+        count_sql = sql.SQL(
+            "SELECT count(*) FROM "
+            "(SELECT 1 FROM {schema}.{table} WHERE {where} LIMIT %s) AS matches"
+        ).format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+            where=condition,
+        )
+        row = cur.execute(count_sql, (*params, limit + 1)).fetchone()
+        return row is not None and row[0] <= limit
+
+    @staticmethod
+    def _filter_clause(
+        filters: Optional[SearchFilter],
+    ) -> Optional[Tuple[sql.Composable, List[Any]]]:
+        """WHERE condition and parameters for `filters`; None when unscoped."""
+        if filters is None:
+            return None
+
+        conditions: List[sql.Composable] = []
+        params: List[Any] = []
+        for column in ("ingestion_id", "provider", "chunk_strategy"):
+            value = getattr(filters, column)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                conditions.append(sql.SQL("{} = %s").format(sql.Identifier(column)))
+                params.append(value)
+            else:
+                conditions.append(
+                    sql.SQL("{} = ANY(%s)").format(sql.Identifier(column))
+                )
+                params.append(list(value))
+        if filters.metadata:
+            conditions.append(sql.SQL("source_metadata @> %s"))
+            params.append(Jsonb(filters.metadata))
+
+        if not conditions:
+            return None
+        return sql.SQL(" AND ").join(conditions), params
+
+    @staticmethod
+    def _to_result(
+        row: tuple, projection: str, fused: bool = False
+    ) -> Union[VectorRecord, SearchHit]:
+        """
+        Map a search row (projection columns, distance and, when fused, the
+        RRF score) to its result.
+        """
+        rrf_score = None
+        if fused:
+            *values, distance, rrf_score = row
+        else:
+            *values, distance = row
+        if projection == "ids":
+            distance = rrf_score = None
+        if projection != "full":
+            ingestion_id, chunk_id, chunk_index, *text = values
+            return SearchHit(
+                ingestion_id=ingestion_id,
+                chunk_id=chunk_id,
+                chunk_index=chunk_index,
+                score=distance,
+                chunk_text=text[0] if text else None,
+                rrf_score=rrf_score,
+            )
 
-        return results
+        (
+            vector,
+            ingestion_id,
+            chunk_id,
+            chunk_index,
+            chunk_strategy,
+            chunk_text,
+            source_metadata,
+            provider,
+        ) = values
+
+        metadata = VectorMetadata(
+            ingestion_id=ingestion_id,
+            chunk_id=chunk_id,
+            chunk_index=chunk_index,
+            chunk_strategy=chunk_strategy,
+            chunk_text=chunk_text,
+            source_metadata=source_metadata,
+            provider=provider,
+        )
+        return VectorRecord(
+            vector=vector.to_list(),
+            metadata=metadata,
+            score=distance,
+            rrf_score=rrf_score,
+        )
+
+    def _apply_search_params(
+        self,
+        cur: psycopg.Cursor,
+        k: int,
+        ef_search: Optional[int],
+        probes: Optional[int],
+    ) -> None:
+        """Set the ANN knobs (or the store defaults) for this transaction."""
+        ef_search = ef_search or self._ef_search or self._DEFAULT_EF_SEARCH
+        probes = probes or self._probes
+        # HNSW returns at most ef_search rows, so always cover k: leaving
+        # pgvector's default would cut any k > 40 short
+        settings: Dict[str, Any] = {
+            "hnsw.ef_search": min(max(ef_search, k), self._MAX_EF_SEARCH)
+        }
+        if probes:
+            settings["ivfflat.probes"] = probes
+        self._set_local(cur, settings)
+
+    @staticmethod
+    def _set_local(cur: psycopg.Cursor, settings: Dict[str, Any]) -> None:
+        """
+        Set planner / pgvector settings for the current transaction only
+        (set_config with is_local), so they never leak into other borrowers
+        of a pooled connection.
+        """
+        if not settings:
+            return
+        set_sql = sql.SQL("SELECT {}").format(
+            sql.SQL(", ").join(
+                sql.SQL("set_config({}, %s, true)").format(sql.Literal(name))
+                for name in settings
+            )
+        )
+        cur.execute(set_sql, [str(value) for value in settings.values()])
 
     def delete_by_ingestion_id(self, ingestion_id: str) -> None:
         delete_sql = sql.SQL(
@@ -163,12 +1280,241 @@ class PgVectorStore(VectorStore):
             table=sql.Identifier(self.TABLE_NAME),
         )
 
-        with psycopg.connect(self._dsn) as conn:
+        with self._connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(delete_sql, (ingestion_id,))
 
+    # ------------------------------------------------------------------
+    # ANN index management
+    # ------------------------------------------------------------------
+    def index_name(self, method: str) -> str:
+        """Name of the managed index for `method` (matches the migration)."""
+        self._check_index_method(method)
+        return f"{self.TABLE_NAME}_vector_{method}_idx"
+
+    def create_index(
+        self,
+        method: str = "hnsw",
+        *,
+        m: int = 16,
+        ef_construction: int = 64,
+        lists: Optional[int] = None,
+        concurrently: bool = True,
+        maintenance_work_mem: Optional[str] = None,
+    ) -> str:
+        """
+        Build (or replace) the HNSW or IVFFlat index on the vector column,
+        with the operator class of the store's storage type and metric. With
+        binary_rescore the index is on the binary-quantized vectors instead
+        (bit_hamming_ops, 1/32 of a vector index's size).
+
+        - hnsw: m (links per node) and ef_construction (build-time candidate
+          list); higher = better recall, slower build
+        - ivfflat: lists clusters; None derives it from the row count
+          (rows / 1000, sqrt(rows) past one million). Build it after the
+          data is loaded: centroids are computed from the existing rows.
+
+        The new index is built under a temporary name and swapped in, so an
+        existing index keeps serving queries until the replacement is ready.
+        With concurrently=True writes are not blocked during the build.
+        maintenance_work_mem (e.g. "1GB") speeds up large HNSW builds.
+
+        Returns the index name.
+        """
+        name = self.index_name(method)
+        staging = f"{name}_new"
+        concurrent = sql.SQL("CONCURRENTLY ") if concurrently else sql.SQL("")
+        expression, opclass = self._index_definition()
+
+        with self._ddl_connection() as conn:
+            if maintenance_work_mem:
+                conn.execute(
+                    "SELECT set_config('maintenance_work_mem', %s, false)",
+                    (maintenance_work_mem,),
+                )
+
+            if method == "hnsw":
+                options = {"m": m, "ef_construction": ef_construction}
+            else:
+                options = {"lists": lists or self._default_ivfflat_lists(conn)}
+
+            # Leftover from an interrupted concurrent build (left INVALID)
+            conn.execute(
+                sql.SQL("DROP INDEX {}IF EXISTS {schema}.{index}").format(
+                    concurrent,
+                    schema=sql.Identifier(self.SCHEMA),
+                    index=sql.Identifier(staging),
+                )
+            )
+            conn.execute(
+                sql.SQL(
+                    "CREATE INDEX {}{index} ON {schema}.{table} "
+                    "USING {method} ({expression} {opclass}) WITH ({options})"
+                ).format(
+                    concurrent,
+                    index=sql.Identifier(staging),
+                    schema=sql.Identifier(self.SCHEMA),
+                    table=sql.Identifier(self.TABLE_NAME),
+                    method=sql.Identifier(method),
+                    expression=expression,
+                    opclass=sql.Identifier(opclass),
+                    options=sql.SQL(", ").join(
+                        sql.SQL("{} = {}").format(
+                            sql.Identifier(key), sql.Literal(value)
+                        )
+                        for key, value in options.items()
+                    ),
+                )
+            )
+            with conn.transaction():
+                conn.execute(
+                    sql.SQL("DROP INDEX IF EXISTS {schema}.{index}").format(
+                        schema=sql.Identifier(self.SCHEMA),
+                        index=sql.Identifier(name),
+                    )
+                )
+                conn.execute(
+                    sql.SQL("ALTER INDEX {schema}.{staging} RENAME TO {index}").format(
+                        schema=sql.Identifier(self.SCHEMA),
+                        staging=sql.Identifier(staging),
+                        index=sql.Identifier(name),
+                    )
+                )
+
+        logging.info(
+            "PgVectorStore: built %s index %s (%s) %s",
+            method,
+            name,
+            opclass,
+            options,
+        )
+        return name
+
+    def _index_definition(self) -> Tuple[sql.Composable, str]:
+        """Indexed expression and operator class searches can use."""
+        if self._binary_rescore:
+            return self._bits(sql.Identifier("vector")), "bit_hamming_ops"
+        # vector_l2_ops -> halfvec_l2_ops, ...
+        opclass = self.METRICS[self._metric][1].replace("vector", self._storage, 1)
+        return sql.Identifier("vector"), opclass
+
+    def rebuild_index(self, method: str = "hnsw", *, concurrently: bool = True) -> None:
+        """
+        REINDEX with the index's current parameters, e.g. to re-cluster an
+        IVFFlat index after the data distribution has changed.
+        """
+        concurrent = sql.SQL("CONCURRENTLY ") if concurrently else sql.SQL("")
+        with self._ddl_connection() as conn:
+            conn.execute(
+                sql.SQL("REINDEX INDEX {}{schema}.{index}").format(
+                    concurrent,
+                    schema=sql.Identifier(self.SCHEMA),
+                    index=sql.Identifier(self.index_name(method)),
+                )
+            )
+
+    def drop_index(
+        self, method: Optional[str] = None, *, concurrently: bool = True
+    ) -> None:
+        """Drop the managed index for `method`, or every managed index."""
+        methods = [method] if method else list(self.INDEX_METHODS)
+        concurrent = sql.SQL("CONCURRENTLY ") if concurrently else sql.SQL("")
+        with self._ddl_connection() as conn:
+            for name in map(self.index_name, methods):
+                conn.execute(
+                    sql.SQL("DROP INDEX {}IF EXISTS {schema}.{index}").format(
+                        concurrent,
+                        schema=sql.Identifier(self.SCHEMA),
+                        index=sql.Identifier(name),
+                    )
+                )
+
+    def list_indexes(self) -> List[Dict[str, Any]]:
+        """
+        HNSW / IVFFlat indexes on the vectors table with operator class,
+        options and size.
+        """
+        with self._connection() as conn:
+            return self._list_indexes(conn)
+
+    def _list_indexes(self, conn: psycopg.Connection) -> List[Dict[str, Any]]:
+        list_sql = """
+            SELECT c.relname, am.amname, opc.opcname, c.reloptions,
+                   pg_relation_size(c.oid), i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = c.relam
+            JOIN pg_opclass opc ON opc.oid = i.indclass[0]
+            WHERE i.indrelid = to_regclass(%s)
+              AND am.amname IN ('hnsw', 'ivfflat')
+            ORDER BY c.relname
+        """
+        rows = conn.execute(list_sql, (f"{self.SCHEMA}.{self.TABLE_NAME}",)).fetchall()
+        return [
+            {
+                "name": name,
+                "method": method,
+                "opclass": opclass,
+                "options": dict(option.split("=", 1) for option in options or []),
+                "size_bytes": size,
+                "valid": valid,
+            }
+            for name, method, opclass, options, size, valid in rows
+        ]
+
+    def _warn_on_index_mismatch(self, conn: psycopg.Connection) -> None:
+        """Searches cannot use an ANN index built for another metric / storage."""
+        try:
+            indexes = self._list_indexes(conn)
+        except psycopg.Error as exc:
+            logging.warning("PgVectorStore: could not list indexes: %s", exc)
+            return
+
+        opclass = self._index_definition()[1]
+        if indexes and all(index["opclass"] != opclass for index in indexes):
+            logging.warning(
+                "PgVectorStore: metric '%s' needs %s but the vectors indexes use "
+                "%s; searches will scan the table until create_index() is run",
+                self._metric,
+                opclass,
+                sorted({index["opclass"] for index in indexes}),
+            )
+
+    def _check_index_method(self, method: str) -> None:
+        if method not in self.INDEX_METHODS:
+            raise ValueError(
+                f"Unknown index method '{method}'. Valid: {self.INDEX_METHODS}"
+            )
+
+    def _ddl_connection(self) -> psycopg.Connection:
+        """
+        Dedicated autocommit connection for index DDL: CONCURRENTLY cannot
+        run inside a transaction, and long builds should not hold a pooled
+        connection.
+        """
+        return psycopg.connect(self._dsn, autocommit=True)
+
+    def _default_ivfflat_lists(self, conn: psycopg.Connection) -> int:
+        count_sql = sql.SQL("SELECT count(*) FROM {schema}.{table}").format(
+            schema=sql.Identifier(self.SCHEMA),
+            table=sql.Identifier(self.TABLE_NAME),
+        )
+        row = conn.execute(count_sql).fetchone()
+        rows = row[0] if row else 0
+        if rows == 0:
+            logging.warning(
+                "PgVectorStore: building an IVFFlat index on an empty table; "
+                "rebuild it after loading data for useful recall"
+            )
+        if rows > 1_000_000:
+            return int(math.sqrt(rows))
+        return max(1, rows // 1000)
+
     def _validate_table(self) -> None:
-        """Fail fast if the vectors table or vector column is missing."""
+        """
+        Fail fast if the vectors table or vector column is missing, or the
+        column is not of the configured storage type.
+        """
         table_probe = sql.SQL(
             """
             SELECT 1
@@ -183,7 +1529,7 @@ class PgVectorStore(VectorStore):
 
         column_probe = sql.SQL(
             """
-            SELECT 1
+            SELECT udt_name
             FROM information_schema.columns
             WHERE table_schema = {schema}
               AND table_name = {table}
@@ -195,16 +1541,26 @@ class PgVectorStore(VectorStore):
         )
 
         try:
-            with psycopg.connect(self._dsn) as conn:
+            with self._connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(table_probe)
                     if cur.rowcount == 0:
                         raise RuntimeError("vectors table missing")
 
-                    cur.execute(column_probe)
-                    if cur.rowcount == 0:
+                    column = cur.execute(column_probe).fetchone()
+                    if column is None:
                         raise RuntimeError("vector column missing")
 
+                if column[0] != self._storage:
+                    raise RuntimeError(
+                        f"storage '{self._storage}' configured but the vector "
+                        f"column is {column[0]}; set VECTOR_STORAGE and run "
+                        "migration 20261017_vectors_storage"
+                    )
+                # Same borrowed connection: constructing a store costs one
+                # pool checkout
+                self._warn_on_index_mismatch(conn)
+
         except Exception as exc:
             raise RuntimeError(
                 "PgVectorStore schema validation failed: "
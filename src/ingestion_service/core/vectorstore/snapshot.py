@@ -0,0 +1,327 @@
+# src/ingestion_service/core/vectorstore/snapshot.py
+"""
+On-disk snapshots of a NumpyVectorStore, so local and CI processes do not
+rebuild the store on every start.
+
+A snapshot is a directory of append-only segments plus a manifest:
+
+    <path>/manifest.json           format, dimension, metric, segments
+    <path>/seg-000001/vectors.npy  float32 (rows, dimension)
+    <path>/seg-000001/norms.npy    float32 (rows,), squared L2 norms
+    <path>/seg-000001/columns.npy  int32 records: chunk_index and the
+                                   interned ingestion_id / provider /
+                                   chunk_strategy codes
+    <path>/seg-000001/metadata.json  code -> value tables, chunk IDs,
+                                   texts and source metadata
+    <path>/seg-000001/deleted-N.npy  packed tombstone bits, if any
+
+The .npy files are plain NumPy arrays: load_snapshot() memory-maps a
+single-segment snapshot read-only, so several worker processes share the
+same pages (zero-copy); a store copies them into memory on its first
+write. Snapshots with several segments are concatenated into memory on
+load.
+
+save_snapshot() to the path a store was loaded from or last saved to
+only appends the rows added since as a new segment and rewrites the
+tombstone bits that changed; merge_snapshot() (or save_snapshot(...,
+merge=True)) rewrites everything as one segment without deleted rows.
+The manifest is replaced atomically, so readers never see a partial
+save. One writer per snapshot at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+from ingestion_service.core.vectorstore.numpy_store import (
+    INTERNED_COLUMNS,
+    NumpyVectorStore,
+)
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+# Per-row integer columns of a segment
+COLUMNS_DTYPE = np.dtype(
+    [("chunk_index", "<i4")] + [(column, "<i4") for column in INTERNED_COLUMNS]
+)
+
+PathLike = Union[str, os.PathLike]
+
+
+def save_snapshot(
+    store: NumpyVectorStore, path: PathLike, *, merge: bool = False
+) -> None:
+    """
+    Save `store` under `path` (a directory, created if missing).
+
+    Appends a segment when `path` holds the snapshot this store was loaded
+    from or last saved to and its rows have not moved since (compact()
+    moves them); otherwise, or with merge=True, writes one new segment
+    holding every live row.
+    """
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(root) if (root / MANIFEST).exists() else None
+    generation = manifest["generation"] + 1 if manifest else 1
+
+    append = (
+        not merge
+        and manifest is not None
+        and store._snapshot
+        == (str(root.resolve()), _row_count(manifest), manifest["generation"])
+    )
+    if append:
+        if manifest is None:  # implied by append; narrows the type
+            raise RuntimeError(f"No snapshot manifest under {root} to append to")
+        segments = _update_tombstones(store, root, manifest["segments"], generation)
+        start = _row_count(manifest)
+    else:
+        store.compact()
+        segments, start = [], 0
+
+    if store._size > start or not segments:
+        name = f"seg-{generation:06d}"
+        _write_segment(store, root / name, start, store._size)
+        segments.append(
+            {
+                "name": name,
+                "rows": store._size - start,
+                "deleted": _write_tombstones(
+                    store, root / name, start, store._size, generation
+                ),
+            }
+        )
+
+    _write_manifest(
+        root,
+        {
+            "format": FORMAT_VERSION,
+            "generation": generation,
+            "dimension": store.dimension,
+            "metric": store.metric,
+            "normalize": store._normalize,
+            "segments": segments,
+        },
+    )
+    _remove_unreferenced(root, segments)
+    store._snapshot = (str(root.resolve()), store._size, generation)
+    logging.info(
+        "NumpyVectorStore: saved %d rows to %s (%s, %d segments)",
+        store._size,
+        root,
+        "append" if append else "full",
+        len(segments),
+    )
+
+
+def load_snapshot(path: PathLike, *, mmap: bool = True) -> NumpyVectorStore:
+    """
+    Open a snapshot as a NumpyVectorStore.
+
+    With mmap=True (default) a single-segment snapshot is mapped read-only
+    rather than read; pass mmap=False to read everything into memory.
+    """
+    root = Path(path)
+    manifest = _read_manifest(root)
+    store = NumpyVectorStore(
+        dimension=manifest["dimension"],
+        metric=manifest["metric"],
+        normalize=manifest["normalize"],
+        initial_capacity=1,
+    )
+    segments = manifest["segments"]
+    mmap_mode = "r" if mmap and len(segments) == 1 else None
+    parts = [_read_segment(root, segment, mmap_mode) for segment in segments]
+
+    if mmap_mode:
+        (part,) = parts
+        store._values = part["values"]
+        codes = {column: part["columns"][column] for column in INTERNED_COLUMNS}
+    else:
+        # Segments were written with the value tables of their time; map
+        # their codes onto one table per column
+        codes = {
+            column: np.concatenate(
+                [
+                    np.array(
+                        [store._intern(column, v) for v in part["values"][column]],
+                        dtype=np.int32,
+                    )[part["columns"][column]]
+                    for part in parts
+                ]
+            )
+            for column in INTERNED_COLUMNS
+        }
+
+    store._lookup = {
+        column: {value: code for code, value in enumerate(values)}
+        for column, values in store._values.items()
+    }
+    store._codes = codes
+    store._vectors = _joined([part["vectors"] for part in parts])
+    store._sq_norms = _joined([part["norms"] for part in parts])
+    store._chunk_indexes = _joined([part["columns"]["chunk_index"] for part in parts])
+    store._deleted = np.concatenate([part["deleted"] for part in parts])
+    store._chunk_ids = [i for part in parts for i in part["metadata"]["chunk_ids"]]
+    store._chunk_texts = [t for part in parts for t in part["metadata"]["chunk_texts"]]
+    store._source_metadata = [
+        m for part in parts for m in part["metadata"]["source_metadata"]
+    ]
+    store._size = len(store._deleted)
+    store._deleted_count = int(store._deleted.sum())
+    store._snapshot = (str(root.resolve()), store._size, manifest["generation"])
+    return store
+
+
+def merge_snapshot(path: PathLike) -> None:
+    """Rewrite a snapshot as one segment, dropping deleted rows."""
+    save_snapshot(load_snapshot(path), path, merge=True)
+
+
+# ----------------------------------------------------------------------
+# Segments
+# ----------------------------------------------------------------------
+def _write_segment(
+    store: NumpyVectorStore, directory: Path, start: int, end: int
+) -> None:
+    # Left over by a save that failed before its manifest was written
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir()
+    np.save(directory / "vectors.npy", store._vectors[start:end])
+    np.save(directory / "norms.npy", store._sq_norms[start:end])
+    columns = np.empty(end - start, dtype=COLUMNS_DTYPE)
+    columns["chunk_index"] = store._chunk_indexes[start:end]
+    for column in INTERNED_COLUMNS:
+        columns[column] = store._codes[column][start:end]
+    np.save(directory / "columns.npy", columns)
+    metadata = {
+        "values": store._values,
+        "chunk_ids": store._chunk_ids[start:end],
+        "chunk_texts": store._chunk_texts[start:end],
+        "source_metadata": store._source_metadata[start:end],
+    }
+    with open(directory / "metadata.json", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, separators=(",", ":"))
+
+
+def _read_segment(
+    root: Path, segment: Dict[str, Any], mmap_mode: Any
+) -> Dict[str, Any]:
+    directory = root / segment["name"]
+    with open(directory / "metadata.json", encoding="utf-8") as f:
+        metadata = json.load(f)
+    deleted = np.zeros(segment["rows"], dtype=bool)
+    if segment["deleted"]:
+        bits = np.load(directory / segment["deleted"])
+        deleted = np.unpackbits(bits, count=segment["rows"]).astype(bool)
+    return {
+        "vectors": np.load(directory / "vectors.npy", mmap_mode=mmap_mode),
+        "norms": np.load(directory / "norms.npy", mmap_mode=mmap_mode),
+        "columns": np.load(directory / "columns.npy", mmap_mode=mmap_mode),
+        "values": metadata["values"],
+        "metadata": metadata,
+        "deleted": deleted,
+    }
+
+
+def _write_tombstones(
+    store: NumpyVectorStore, directory: Path, start: int, end: int, generation: int
+) -> Union[str, None]:
+    """Packed tombstone bits of rows [start, end); None when none is set."""
+    deleted = store._deleted[start:end]
+    if not deleted.any():
+        return None
+    name = f"deleted-{generation}.npy"
+    np.save(directory / name, np.packbits(deleted))
+    return name
+
+
+def _update_tombstones(
+    store: NumpyVectorStore,
+    root: Path,
+    segments: List[Dict[str, Any]],
+    generation: int,
+) -> List[Dict[str, Any]]:
+    """Rewrite the tombstone bits of segments with rows deleted since."""
+    updated = []
+    start = 0
+    for segment in segments:
+        end = start + segment["rows"]
+        stored = int(_read_segment_tombstones(root, segment).sum())
+        current = int(store._deleted[start:end].sum())
+        if current != stored:
+            # Deletes only ever add tombstones, so a changed count means
+            # changed bits
+            segment = {
+                **segment,
+                "deleted": _write_tombstones(
+                    store, root / segment["name"], start, end, generation
+                ),
+            }
+        updated.append(segment)
+        start = end
+    return updated
+
+
+def _read_segment_tombstones(root: Path, segment: Dict[str, Any]) -> np.ndarray:
+    if not segment["deleted"]:
+        return np.zeros(0, dtype=np.uint8)
+    return np.unpackbits(np.load(root / segment["name"] / segment["deleted"]))
+
+
+def _joined(arrays: List[np.ndarray]) -> np.ndarray:
+    """The array itself for one segment (keeps a memory map), else a copy."""
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+
+# ----------------------------------------------------------------------
+# Manifest
+# ----------------------------------------------------------------------
+def _read_manifest(root: Path) -> Dict[str, Any]:
+    with open(root / MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot format {manifest.get('format')!r} in {root}"
+        )
+    return manifest
+
+
+def _write_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+    """Write to a temporary file, then rename over the old manifest."""
+    staging = root / f"{MANIFEST}.tmp"
+    with open(staging, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging, root / MANIFEST)
+
+
+def _row_count(manifest: Dict[str, Any]) -> int:
+    return sum(segment["rows"] for segment in manifest["segments"])
+
+
+def _remove_unreferenced(root: Path, segments: List[Dict[str, Any]]) -> None:
+    """
+    Delete segments and tombstone files the manifest no longer lists.
+    Processes that still map them keep their pages until they unmap.
+    """
+    referenced = {segment["name"]: segment["deleted"] for segment in segments}
+    for entry in root.iterdir():
+        if not entry.name.startswith("seg-"):
+            continue
+        if entry.name not in referenced:
+            shutil.rmtree(entry)
+            continue
+        for tombstones in entry.glob("deleted-*.npy"):
+            if tombstones.name != referenced[entry.name]:
+                tombstones.unlink()
@@ -1,11 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from ingestion_service.api.health import router as health_router
 from ingestion_service.api.v1 import router as v1_router
 from ingestion_service.api.errors import register_error_handlers
+from ingestion_service.core.component_registry import get_registry
+from ingestion_service.core.config import get_settings
+from ingestion_service.core.connection_pool import close_pools
+from ingestion_service.core.process_pools import shutdown_process_pools
+from ingestion_service.core.ingestion_worker import IngestionWorkerPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    if settings.VALIDATE_SCHEMA_ON_STARTUP:
+        # Fail fast on a missing/unmigrated vectors table
+        get_registry().get_pipeline(settings.EMBEDDING_PROVIDER)
+
+    workers = None
+    if settings.INGEST_EXECUTION_MODE == "queue" and settings.INGEST_WORKERS > 0:
+        workers = IngestionWorkerPool(settings.INGEST_WORKERS)
+        workers.start()
+
+    yield
+
+    if workers is not None:
+        workers.stop()
+    shutdown_process_pools()
+    close_pools()
+
 
 # Register handlers before routers
-app = FastAPI(title="Agentic RAG Ingestion Service")
+app = FastAPI(title="Agentic RAG Ingestion Service", lifespan=lifespan)
 
 register_error_handlers(app)
 
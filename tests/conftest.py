@@ -1,4 +1,5 @@
 # tests/conftest.py
+import fitz
 import pytest
 from fastapi.testclient import TestClient
 from ingestion_service.main import app  # Import the FastAPI app
@@ -11,6 +12,29 @@ def client():
         yield client
 
 
+@pytest.fixture
+def synthetic_pdf():
+    """Factory for multi-page PDFs: two text blocks per page, an image every third."""
+
+    def make(pages: int = 9) -> bytes:
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+        pixmap.clear_with(200)
+        png = pixmap.tobytes("png")
+
+        doc = fitz.open()
+        for number in range(1, pages + 1):
+            page = doc.new_page()
+            if number % 3 == 0:
+                page.insert_image(fitz.Rect(72, 40, 120, 88), stream=png)
+            page.insert_text((72, 120), f"Heading of page {number}")
+            page.insert_text((72, 400), f"Body text on page {number}. " * 5)
+        pdf_bytes = doc.write()
+        doc.close()
+        return pdf_bytes
+
+    return make
+
+
 def pytest_configure(config):
     # Register custom markers
     config.addinivalue_line("markers", "docker: mark test to run with Docker/Postgres")
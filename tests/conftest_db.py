@@ -1,8 +1,13 @@
 # tests/conftest_db.py
 import os
+import random
+from typing import Any, Dict, List
+
 import pytest
 from psycopg import connect, sql
 
+from ingestion_service.core.vectorstore.base import VectorMetadata, VectorRecord
+
 # -------------------------------------------------------------------------
 # Database fixtures for Docker / pgvector integration tests
 #
@@ -25,6 +30,46 @@ from psycopg import connect, sql
 # -------------------------------------------------------------------------
 
 
+def make_records(count: int, *, seed: int = 7, **metadata: Any) -> List[VectorRecord]:
+    """
+    `count` records with seeded random 768-dim vectors.
+
+    Metadata defaults to chunk_id "c{i}", chunk_index i and chunk_text
+    "chunk {i}" under ingestion "ing-test"; keyword arguments override any
+    VectorMetadata field with a value or a function of the index i.
+    """
+    rng = random.Random(seed)
+    fields: Dict[str, Any] = {
+        "ingestion_id": "ing-test",
+        "chunk_id": lambda i: f"c{i}",
+        "chunk_index": lambda i: i,
+        "chunk_strategy": "test",
+        "chunk_text": lambda i: f"chunk {i}",
+        **metadata,
+    }
+    records = []
+    for i in range(count):
+        values: Dict[str, Any] = {
+            name: value(i) if callable(value) else value
+            for name, value in fields.items()
+        }
+        records.append(
+            VectorRecord(
+                vector=[rng.uniform(-1.0, 1.0) for _ in range(768)],
+                metadata=VectorMetadata(**values),
+            )
+        )
+    return records
+
+
+def chunk_ids(results) -> List[str]:
+    """Chunk IDs of search results (VectorRecords or SearchHits), in order."""
+    return [
+        r.metadata.chunk_id if isinstance(r, VectorRecord) else r.chunk_id
+        for r in results
+    ]
+
+
 @pytest.fixture(scope="session")
 def test_database_url() -> str:
     """
@@ -63,7 +108,9 @@ def clean_vectors_table(test_database_url):
 
             chunk_text TEXT NOT NULL,
             source_metadata JSONB NOT NULL DEFAULT '{{}}',
-            provider TEXT NOT NULL DEFAULT 'mock'
+            provider TEXT NOT NULL DEFAULT 'mock',
+            chunk_tsv tsvector GENERATED ALWAYS AS
+                (to_tsvector('simple'::regconfig, chunk_text)) STORED
         )
         """
     ).format(
@@ -82,6 +129,48 @@ def clean_vectors_table(test_database_url):
             )
             # Recreate with correct pgvector dimension
             cur.execute(create_table_sql)
+            # Default ANN index from 20261017_add_vectors_hnsw_index
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX vectors_vector_hnsw_idx ON {schema}.{table} "
+                    "USING hnsw (vector vector_l2_ops) "
+                    "WITH (m = 16, ef_construction = 64)"
+                ).format(
+                    schema=sql.Identifier(schema),
+                    table=sql.Identifier(table),
+                )
+            )
+            # Filter indexes from 20261017_add_vectors_filter_idx
+            for column in ("ingestion_id", "provider", "chunk_strategy"):
+                cur.execute(
+                    sql.SQL(
+                        "CREATE INDEX {index} ON {schema}.{table} ({column})"
+                    ).format(
+                        index=sql.Identifier(f"vectors_{column}_idx"),
+                        schema=sql.Identifier(schema),
+                        table=sql.Identifier(table),
+                        column=sql.Identifier(column),
+                    )
+                )
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX vectors_source_metadata_idx ON {schema}.{table} "
+                    "USING gin (source_metadata jsonb_path_ops)"
+                ).format(
+                    schema=sql.Identifier(schema),
+                    table=sql.Identifier(table),
+                )
+            )
+            # Full-text index from 20261017_add_vectors_tsv
+            cur.execute(
+                sql.SQL(
+                    "CREATE INDEX vectors_chunk_tsv_idx ON {schema}.{table} "
+                    "USING gin (chunk_tsv)"
+                ).format(
+                    schema=sql.Identifier(schema),
+                    table=sql.Identifier(table),
+                )
+            )
 
     # ---- run the test ----
     yield
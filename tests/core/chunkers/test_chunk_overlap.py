@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from ingestion_service.core.chunkers.text import TextChunker
+
+SEPARATORS = {"sentence": " ", "paragraph": "\n\n"}
+
+
+def _units(rng: random.Random, strategy: str) -> list[str]:
+    def sentence() -> str:
+        words = ["w" * rng.randint(1, 12) for _ in range(rng.randint(1, 8))]
+        return " ".join(words) + rng.choice(".!?")
+
+    if strategy == "sentence":
+        return [sentence() for _ in range(rng.randint(1, 60))]
+    return [
+        " ".join(sentence() for _ in range(rng.randint(1, 4)))
+        for _ in range(rng.randint(1, 30))
+    ]
+
+
+def _cases():
+    for strategy in SEPARATORS:
+        for seed in range(40):
+            yield strategy, seed
+
+
+@pytest.mark.parametrize("strategy, seed", list(_cases()))
+def test_overlapping_chunks_cover_every_unit_in_order(strategy, seed):
+    rng = random.Random(seed)
+    units = _units(rng, strategy)
+    separator = SEPARATORS[strategy]
+    text = separator.join(units)
+    starts = [0]
+    for unit in units[:-1]:
+        starts.append(starts[-1] + len(unit) + len(separator))
+    chunk_size = rng.randint(10, 300)
+    overlap = rng.randint(0, chunk_size)
+
+    chunker = TextChunker(chunk_size, overlap, chunk_strategy=strategy)
+    chunks = chunker.chunk(text)
+
+    # Each chunk is a run units[first..last] joined by the separator
+    runs = []
+    for chunk in chunks:
+        first = starts.index(chunk.metadata["char_start"])
+        last = max(i for i, s in enumerate(starts) if s < chunk.metadata["char_end"])
+        assert chunk.content == separator.join(units[first : last + 1])
+        # The fit check leaves out the separator before the newest unit
+        assert len(chunk.content) <= chunk_size + len(separator) or first == last
+        runs.append((first, last))
+
+    assert runs[0][0] == 0 and runs[-1][1] == len(units) - 1
+    for (first, last), (next_first, next_last) in zip(runs, runs[1:]):
+        # Every chunk adds at least one unit, and no unit is skipped
+        assert first < next_first <= last + 1 and next_last > last
+        shared = units[next_first : last + 1]
+        assert len(separator.join(shared)) <= overlap
+
+
+@pytest.mark.parametrize("strategy", list(SEPARATORS))
+def test_chunks_are_deterministic(strategy):
+    rng = random.Random(7)
+    text = SEPARATORS[strategy].join(_units(rng, strategy))
+
+    first = TextChunker(120, 40, chunk_strategy=strategy).chunk(text)
+    second = TextChunker(120, 40, chunk_strategy=strategy).chunk(text)
+
+    assert first == second
+    assert len({chunk.chunk_id for chunk in first}) == len(first)
+
+
+@pytest.mark.parametrize("strategy", list(SEPARATORS))
+def test_overlap_keeps_the_longest_tail_that_fits(strategy):
+    separator = SEPARATORS[strategy]
+    units = ["Aaaa.", "Bbbb.", "Cccc.", "Dddd.", "Eeee."]
+    text = separator.join(units)
+    overlap = len(separator.join(units[1:3]))
+    chunk_size = len(separator.join(units[:3]))
+
+    chunks = TextChunker(chunk_size, overlap, chunk_strategy=strategy).chunk(text)
+
+    assert [c.content for c in chunks] == [
+        separator.join(units[0:3]),
+        separator.join(units[1:4]),
+        separator.join(units[2:5]),
+    ]
+    no_overlap = TextChunker(chunk_size, 0, chunk_strategy=strategy).chunk(text)
+    assert [c.content for c in no_overlap] == [
+        separator.join(units[0:3]),
+        separator.join(units[3:5]),
+    ]
@@ -0,0 +1,51 @@
+import itertools
+
+import pytest
+
+from ingestion_service.core.chunkers.text import TextChunker
+
+
+@pytest.mark.parametrize("strategy", ["simple", "sentence", "paragraph"])
+def test_offsets_point_into_the_source(strategy):
+    text = "One. Two!\n\nThree? Four.\n\n\n  Five six seven.  \n\nEight."
+
+    chunks = TextChunker(chunk_size=12, overlap=2, chunk_strategy=strategy).chunk(text)
+
+    assert chunks
+    for chunk in chunks:
+        start, end = chunk.metadata["char_start"], chunk.metadata["char_end"]
+        source = text[start:end]
+        # Sentence / paragraph chunks re-join their pieces with one separator
+        assert " ".join(source.split()) == " ".join(chunk.content.split())
+
+
+def test_spans_are_zero_copy_unless_whitespace_is_normalized():
+    text = "Alpha one.\n\nBeta two.\n\n\nGamma three."
+    chunker = TextChunker(chunk_size=25, overlap=0, chunk_strategy="paragraph")
+
+    first, second = chunker.iter_spans(text)
+
+    assert first.pieces is None and first.text == "Alpha one.\n\nBeta two."
+    assert (first.start, first.end) == (0, 21)
+    assert second.pieces is None and second.text == "Gamma three."
+
+    packed = TextChunker(chunk_size=40, overlap=0, chunk_strategy="paragraph")
+    (span,) = packed.iter_spans(text)
+    assert span.pieces == ((0, 10), (12, 21), (24, 36))
+    assert span.text == "Alpha one.\n\nBeta two.\n\nGamma three."
+    assert (span.start, span.end) == (0, len(text))
+
+
+def test_chunks_are_produced_lazily():
+    text = "Sentence number one. " * 200_000
+    chunker = TextChunker(chunk_size=100, chunk_strategy="sentence")
+
+    first = list(itertools.islice(chunker.iter_chunks(text), 3))
+
+    assert [c.content for c in first] == [
+        "Sentence number one. Sentence number one. Sentence number one. "
+        "Sentence number one.",
+    ] * 3
+    # Repeated texts keep distinct, content-derived IDs
+    assert first[1].chunk_id == f"{first[0].chunk_id}-1"
+    assert chunker.chunk(text[:200]) == list(chunker.iter_chunks(text[:200]))
@@ -0,0 +1,74 @@
+import pytest
+
+from ingestion_service.core.chunkers.selector import ChunkerFactory
+from ingestion_service.core.chunkers.text import TextChunker
+from ingestion_service.core.chunkers.tokens import (
+    EncodeTokenizer,
+    HeuristicTokenizer,
+    resolve_token_budget,
+)
+from ingestion_service.core.embedders.cached import CachedEmbedder
+from ingestion_service.core.embedders.ollama import OllamaEmbedder
+
+
+def test_heuristic_counts_words_by_length_and_symbols_alone():
+    tokenizer = HeuristicTokenizer()
+
+    assert tokenizer.count("") == 0
+    assert tokenizer.count("the cat sat.") == 4
+    assert tokenizer.count("consectetur") == 3
+    assert tokenizer.count("café, 東京") == 5  # caf é , 東 京
+
+
+def test_chunks_fill_the_budget_with_whole_sentences():
+    text = " ".join(f"Sentence number {i} is here." for i in range(40))
+    tokenizer = HeuristicTokenizer()
+    chunker = TextChunker(chunk_strategy="token")
+
+    spans = list(chunker.iter_spans(text, chunk_size=30))
+
+    counts = [tokenizer.count(span.text) for span in spans]
+    assert all(count <= 30 for count in counts)
+    assert sum(counts) == tokenizer.count(text)
+    # 8 tokens per sentence ("Sentence" and "number" are 2 each): 3 per chunk
+    assert counts[:-1] == [24] * (len(spans) - 1)
+    assert all(span.text.endswith(".") for span in spans)
+    # Contiguous slices covering the text
+    assert spans[0].start == 0 and spans[-1].end == len(text)
+    assert all(span.pieces is None for span in spans)
+
+
+def test_long_sentences_and_words_are_split_to_fit():
+    text = "word " * 50 + "x" * 100 + "."
+    chunker = TextChunker(chunk_strategy="token")
+
+    chunks = chunker.chunk(text, chunk_size=8)
+
+    tokenizer = HeuristicTokenizer()
+    assert all(tokenizer.count(c.content) <= 8 for c in chunks)
+    assert "".join(c.content for c in chunks).replace(" ", "") == text.replace(" ", "")
+    with pytest.raises(ValueError, match="Token budget"):
+        chunker.chunk(text, chunk_size=0)
+
+
+def test_tokenizer_is_pluggable():
+    chunker = TextChunker(chunk_strategy="token", tokenizer=EncodeTokenizer(list))
+
+    chunks = chunker.chunk("Ab. Cd. Ef.", chunk_size=7)
+
+    assert [c.content for c in chunks] == ["Ab. Cd.", "Ef."]
+
+
+def test_budget_comes_from_settings_and_embedder():
+    embedder = OllamaEmbedder(base_url="http://ollama", model="m", max_tokens=512)
+
+    assert CachedEmbedder(embedder).max_tokens == 512
+    assert resolve_token_budget(0, 512) is None
+    assert resolve_token_budget(256, 512) == 256
+    assert resolve_token_budget(4096, 512) == 512
+    assert resolve_token_budget(300, None) == 300
+
+    chunker, params = ChunkerFactory.choose_strategy("Some text.", token_budget=256)
+    assert chunker.chunk_strategy == "token" and params == {"chunk_size": 256}
+    chunker, _ = ChunkerFactory.choose_strategy("Some text.")
+    assert chunker.chunk_strategy == "sentence"
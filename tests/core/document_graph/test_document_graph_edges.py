@@ -0,0 +1,81 @@
+from ingestion_service.core.document_graph.builder import DocumentGraphBuilder
+from ingestion_service.core.document_graph.models import GraphEdge
+from ingestion_service.core.extractors.base import ArtifactType, ExtractedArtifact
+
+
+def _artifact(kind: ArtifactType, page: int, order_index: int) -> ExtractedArtifact:
+    return ExtractedArtifact(
+        type=kind,
+        source_file="doc.pdf",
+        page_number=page,
+        order_index=order_index,
+        text="t" if kind == "text" else None,
+        image_bytes=b"img" if kind == "image" else None,
+    )
+
+
+def test_images_link_to_the_nearest_following_text_on_their_page():
+    artifacts = [
+        _artifact("image", 1, 5),  # after the last text on page 1
+        _artifact("text", 1, 3),
+        _artifact("image", 1, 0),
+        _artifact("image", 1, 1),  # same order_index as a text: not "following"
+        _artifact("text", 1, 1),
+        _artifact("image", 2, 0),
+        _artifact("text", 2, 2),
+        _artifact("image", 3, 0),  # page without text
+    ]
+
+    graph = DocumentGraphBuilder().build(artifacts)
+
+    assert graph.edges == [
+        GraphEdge("doc.pdf:1:1:text", "doc.pdf:page:1", "text_to_page"),
+        GraphEdge("doc.pdf:1:3:text", "doc.pdf:page:1", "text_to_page"),
+        GraphEdge("doc.pdf:1:0:image", "doc.pdf:1:1:text", "image_to_text"),
+        GraphEdge("doc.pdf:1:1:image", "doc.pdf:1:3:text", "image_to_text"),
+        GraphEdge("doc.pdf:1:5:image", "doc.pdf:page:1", "image_to_page"),
+        GraphEdge("doc.pdf:2:2:text", "doc.pdf:page:2", "text_to_page"),
+        GraphEdge("doc.pdf:2:0:image", "doc.pdf:2:2:text", "image_to_text"),
+        GraphEdge("doc.pdf:3:0:image", "doc.pdf:page:3", "image_to_page"),
+    ]
+
+
+def test_lookups_use_integer_ids():
+    artifacts = [
+        _artifact("text", 1, 0),
+        _artifact("image", 1, 1),
+        _artifact("image", 1, 2),
+        _artifact("text", 1, 3),
+        _artifact("image", 2, 0),
+    ]
+
+    graph = DocumentGraphBuilder().build(artifacts)
+
+    text = graph.node_id("doc.pdf:1:3:text")
+    assert graph.node(text).artifact is artifacts[3]
+    assert list(graph.images_for_text(text)) == [1, 2]
+    assert list(graph.images_for_text(0)) == []
+    assert graph.outgoing(1) == ("image_to_text", text)
+
+    page = graph.page("doc.pdf", 2)
+    assert page is not None
+    assert [graph.artifact_id(n) for n in graph.artifacts_on_page(page)] == [
+        "doc.pdf:2:0:image"
+    ]
+    assert graph.outgoing(4) == ("image_to_page", page)
+    assert graph.page_id(page) == "doc.pdf:page:2"
+    assert graph.page("doc.pdf", 9) is None
+
+
+def test_artifacts_with_the_same_id_share_a_node():
+    # OCR text is inserted at the image's order_index + 1, which may be the
+    # order_index of the next extracted text
+    ocr_text = _artifact("text", 1, 1)
+    artifacts = [_artifact("image", 1, 0), _artifact("text", 1, 1), ocr_text]
+
+    graph = DocumentGraphBuilder().build(artifacts)
+
+    assert len(graph) == 2
+    assert graph.node(graph.node_id("doc.pdf:1:1:text")).artifact is ocr_text
+    assert list(graph.images_for_text(1)) == [0]
+    assert list(graph.nodes) == ["doc.pdf:1:0:image", "doc.pdf:1:1:text"]
@@ -0,0 +1,121 @@
+import tracemalloc
+from array import array
+
+import pytest
+from psycopg import connect
+
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.config import reset_settings_cache
+from ingestion_service.core.embedders.base import BaseEmbedder
+from ingestion_service.core.embedders.cached import (
+    CachedEmbedder,
+    EmbeddingLRU,
+    PgEmbeddingCacheStore,
+    cache_key,
+)
+from ingestion_service.core.embedders.factory import get_embedder
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+class RecordingEmbedder(BaseEmbedder):
+    """Embeds text as [len(text), 1.0] and records every embed() call."""
+
+    name = "recording"
+    dimension = 2
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, chunks):
+        self.calls.append([chunk.content for chunk in chunks])
+        return [[float(len(chunk.content)), 1.0] for chunk in chunks]
+
+
+def _chunks(*texts: str) -> list[Chunk]:
+    return [Chunk(chunk_id=str(i), content=t, metadata={}) for i, t in enumerate(texts)]
+
+
+def test_only_unique_misses_are_embedded_in_one_batch():
+    inner = RecordingEmbedder()
+    embedder = CachedEmbedder(inner, memory=EmbeddingLRU(1 << 20))
+
+    first = embedder.embed(_chunks("header", "body one", "header"))
+    second = embedder.embed(_chunks("header", "body two", "body one"))
+
+    assert first == [[6.0, 1.0], [8.0, 1.0], [6.0, 1.0]]
+    assert second == [[6.0, 1.0], [8.0, 1.0], [8.0, 1.0]]
+    assert inner.calls == [["header", "body one"], ["body two"]]
+
+    stats = embedder.stats()
+    assert stats["lookups"] == 5
+    assert stats["memory_hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["hit_rate"] == pytest.approx(0.4)
+
+
+def test_key_ignores_whitespace_and_unicode_form_but_not_model():
+    assert cache_key("ollama", "m", "a  b\n") == cache_key("ollama", "m", " a b")
+    assert cache_key("ollama", "m", "café") == cache_key("ollama", "m", "café")
+    assert cache_key("ollama", "m", "a b") != cache_key("ollama", "other", "a b")
+    assert cache_key("ollama", "m", "a b") != cache_key("mock", "m", "a b")
+
+
+def test_lru_evicts_least_recently_used_past_byte_budget():
+    entry = EmbeddingLRU._entry_size(b"a", array("f", [0.0] * 4))
+    lru = EmbeddingLRU(max_bytes=2 * entry)
+
+    lru.put_many({b"a": [1.0] * 4, b"b": [2.0] * 4})
+    lru.get_many([b"a"])  # a is now most recently used
+    lru.put_many({b"c": [3.0] * 4})
+
+    assert set(lru.get_many([b"a", b"b", b"c"])) == {b"a", b"c"}
+    assert lru.size_bytes == 2 * entry
+
+
+def test_lru_byte_count_matches_allocated_memory():
+    vectors = {i.to_bytes(32, "big"): [i / 7.0] * 768 for i in range(500)}
+    lru = EmbeddingLRU(max_bytes=1 << 30)
+
+    tracemalloc.start()
+    lru.put_many(vectors)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The input lists are the caller's; the LRU holds float32 copies
+    assert 0.8 * lru.size_bytes <= allocated <= 1.2 * lru.size_bytes
+    assert lru.get_many([b"\0" * 32])[b"\0" * 32] == [0.0] * 768
+
+
+def test_factory_wraps_embedder_when_cache_enabled(monkeypatch):
+    monkeypatch.setenv("EMBEDDING_CACHE", "memory")
+    reset_settings_cache()
+    try:
+        embedder = get_embedder("mock")
+        assert isinstance(embedder, CachedEmbedder)
+        assert embedder.name == "mock"
+    finally:
+        monkeypatch.delenv("EMBEDDING_CACHE")
+        reset_settings_cache()
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_persistent_tier_survives_new_process_cache(test_database_url):
+    with connect(test_database_url, autocommit=True) as conn:
+        conn.execute("TRUNCATE ingestion_service.embedding_cache")
+
+    store = PgEmbeddingCacheStore(dsn=test_database_url)
+    warm = RecordingEmbedder()
+    CachedEmbedder(warm, memory=EmbeddingLRU(1 << 20), persistent=store).embed(
+        _chunks("logo text", "footer")
+    )
+
+    # Fresh memory tier, as after a restart or in another worker process
+    cold = RecordingEmbedder()
+    embedder = CachedEmbedder(cold, memory=EmbeddingLRU(1 << 20), persistent=store)
+    vectors = embedder.embed(_chunks("footer", "logo text", "new"))
+
+    assert vectors == [[6.0, 1.0], [9.0, 1.0], [3.0, 1.0]]
+    assert cold.calls == [["new"]]
+    assert embedder.stats()["persistent_hits"] == 2
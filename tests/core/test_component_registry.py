@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ingestion_service.core import component_registry
+from ingestion_service.core.component_registry import ComponentRegistry
+from ingestion_service.core.config import reset_settings_cache
+
+
+class CountingVectorStore:
+    """Stands in for PgVectorStore; counts constructions (= schema probes)."""
+
+    instances = 0
+
+    def __init__(self, dsn: str, dimension: int, provider: str, **options) -> None:
+        type(self).instances += 1
+        self.dimension = dimension
+        self.provider = provider
+
+
+@pytest.fixture
+def fake_store(monkeypatch):
+    CountingVectorStore.instances = 0
+    monkeypatch.setattr(component_registry, "PgVectorStore", CountingVectorStore)
+    return CountingVectorStore
+
+
+def test_registry_builds_pipeline_once_per_provider(fake_store):
+    registry = ComponentRegistry()
+
+    first = registry.get_pipeline("mock")
+    second = registry.get_pipeline("mock")
+
+    assert first is second
+    assert first._embedder is registry.get_embedder("mock")
+    assert fake_store.instances == 1
+
+
+def test_registry_is_thread_safe(fake_store):
+    registry = ComponentRegistry()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        pipelines = list(pool.map(lambda _: registry.get_pipeline("mock"), range(64)))
+
+    assert all(p is pipelines[0] for p in pipelines)
+    assert fake_store.instances == 1
+
+
+def test_registry_keys_vector_stores_by_provider_and_dimension(fake_store):
+    registry = ComponentRegistry()
+
+    assert registry.get_vector_store("mock", 3) is registry.get_vector_store("mock", 3)
+    assert registry.get_vector_store("mock", 3) is not registry.get_vector_store(
+        "mock", 768
+    )
+    assert fake_store.instances == 2
+
+
+def test_registry_does_not_cache_failed_builds(monkeypatch):
+    attempts = []
+
+    def failing_store(**kwargs):
+        attempts.append(kwargs)
+        raise RuntimeError("PgVectorStore schema validation failed")
+
+    monkeypatch.setattr(component_registry, "PgVectorStore", failing_store)
+    registry = ComponentRegistry()
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            registry.get_pipeline("mock")
+
+    assert len(attempts) == 2
+
+
+def test_settings_reload_invalidates_shared_registry(fake_store):
+    registry = component_registry.get_registry()
+    registry.invalidate()
+
+    before = registry.get_pipeline("mock")
+    reset_settings_cache()
+    after = registry.get_pipeline("mock")
+
+    assert before is not after
+    assert fake_store.instances == 2
+    registry.invalidate()
@@ -1,11 +1,9 @@
 # tests/core/test_headless_pdf_ingestor_real_pdf.py
 from pathlib import Path
-from types import SimpleNamespace
 
 from ingestion_service.core.headless_ingest_pdf import HeadlessPDFIngestor
 from ingestion_service.core.pipeline import IngestionPipeline
 from ingestion_service.core.chunks import Chunk
-from ingestion_service.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
 
 # --------------------------
 # Test: ingest a real PDF with text + screenshot
@@ -64,29 +62,6 @@ def test_ingest_sample_pdf():
         ingestion_id=ingestion_id,
     )
 
-    # ---- Patch document graph to associate images with text chunks ----
-    assembler = PDFChunkAssembler()
-    if hasattr(ingestor, "_last_document_graph"):
-        graph = ingestor._last_document_graph  # type: ignore[attr-defined]
-
-        # For each image node, link it to all text nodes on the same page
-        for node_id, node in graph.nodes.items():
-            if node.artifact.type == "image":
-                page = node.artifact.page_number
-                for text_id, text_node in graph.nodes.items():
-                    if (
-                        text_node.artifact.type == "text"
-                        and text_node.artifact.page_number == page
-                    ):
-                        graph.edges.append(
-                            SimpleNamespace(
-                                from_id=text_id, to_id=node_id, relation="text_to_image"
-                            )
-                        )
-
-        # Re-run assembler to produce chunks with updated edges
-        chunks = assembler.assemble(graph)
-
     # ---- Assertions ----
     assert isinstance(chunks, list)
     assert all(isinstance(c, Chunk) for c in chunks)
@@ -1,7 +1,6 @@
 import uuid
 import pytest
 from pathlib import Path
-from types import SimpleNamespace
 from typing import cast
 
 from ingestion_service.core.headless_ingest_pdf import HeadlessPDFIngestor
@@ -12,7 +11,6 @@ from ingestion_service.core.embedders.ollama import OllamaEmbedder
 from ingestion_service.core.embedders.factory import get_embedder
 from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
 from ingestion_service.core.config import reset_settings_cache
-from ingestion_service.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
 
 pytest_plugins = ["tests.conftest_db"]
 
@@ -75,28 +73,6 @@ def test_ingest_sample_pdf_real_pipeline(clean_vectors_table, test_database_url)
         ingestion_id=ingestion_id,
     )
 
-    # ---- Patch assembler graph to associate images with chunks (optional) ----
-    assembler = PDFChunkAssembler()
-    if hasattr(ingestor, "_last_document_graph"):
-        graph = ingestor._last_document_graph  # type: ignore[attr-defined]
-        # For each image node, add an edge to all text nodes on same page
-        for node_id, node in graph.nodes.items():
-            if node.artifact.type == "image":
-                for target_id, target_node in graph.nodes.items():
-                    if (
-                        target_node.artifact.type == "text"
-                        and target_node.artifact.page_number
-                        == node.artifact.page_number
-                    ):
-                        graph.edges.append(
-                            SimpleNamespace(
-                                from_id=node_id,
-                                to_id=target_id,
-                                relation="image_to_text",
-                            )
-                        )
-        chunks = assembler.assemble(graph)
-
     # ---- Assertions ----
     assert isinstance(chunks, list)
     assert all(isinstance(c, Chunk) for c in chunks)
@@ -0,0 +1,160 @@
+import threading
+from typing import cast
+from uuid import UUID, uuid4
+
+import pytest
+
+from ingestion_service.core.database_session import get_sessionmaker
+from ingestion_service.core.ingestion_worker import IngestionWorker
+from ingestion_service.core.job_queue import IngestionJobQueue
+from ingestion_service.core.models import IngestionRequest, IngestionUpload
+from ingestion_service.core.pipeline import IngestionPipeline
+
+
+class RecordingPipeline:
+    """Stands in for IngestionPipeline; records the text it was asked to ingest."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.runs = []
+
+    def run(
+        self,
+        *,
+        text,
+        ingestion_id,
+        source_type,
+        provider,
+        previous_ingestion_id=None,
+    ) -> None:
+        if self.fail:
+            raise RuntimeError("embedding backend unavailable")
+        self.runs.append((ingestion_id, text, source_type))
+
+
+def _enqueue(session, content: bytes = b"hello queue") -> UUID:
+    ingestion_id = uuid4()
+    IngestionJobQueue(session).enqueue(
+        ingestion_id=ingestion_id,
+        source_type="file",
+        metadata={"filename": "note.txt"},
+        filename="note.txt",
+        content_type="text/plain",
+        content=content,
+    )
+    return ingestion_id
+
+
+@pytest.fixture
+def session_factory():
+    factory = get_sessionmaker()
+    with factory() as session:
+        session.query(IngestionUpload).delete()
+        session.commit()
+    return factory
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_claimed_job_is_not_handed_out_twice(session_factory):
+    with session_factory() as session:
+        ingestion_id = _enqueue(session)
+
+    with session_factory() as first, session_factory() as second:
+        job = IngestionJobQueue(first).claim_next(lease_seconds=3600, max_attempts=3)
+        assert job is not None
+        assert job.ingestion_id == ingestion_id
+        assert job.content == b"hello queue"
+        assert job.attempts == 1
+
+        assert (
+            IngestionJobQueue(second).claim_next(lease_seconds=3600, max_attempts=3)
+            is None
+        )
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_concurrent_workers_claim_distinct_jobs(session_factory):
+    with session_factory() as session:
+        queued = {_enqueue(session) for _ in range(8)}
+
+    claimed = []
+    lock = threading.Lock()
+
+    def drain() -> None:
+        with session_factory() as session:
+            queue = IngestionJobQueue(session)
+            while job := queue.claim_next(lease_seconds=3600, max_attempts=3):
+                with lock:
+                    claimed.append(job.ingestion_id)
+                queue.complete(job.ingestion_id)
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(queued)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_worker_completes_job_and_discards_upload(session_factory):
+    pipeline = RecordingPipeline()
+    with session_factory() as session:
+        ingestion_id = _enqueue(session)
+
+    worker = IngestionWorker(
+        session_factory=session_factory,
+        pipeline_factory=lambda provider: cast(IngestionPipeline, pipeline),
+    )
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+
+    assert pipeline.runs == [(str(ingestion_id), "hello queue", "file")]
+    with session_factory() as session:
+        assert session.get(IngestionRequest, ingestion_id).status == "completed"
+        assert session.get(IngestionUpload, ingestion_id) is None
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_worker_records_failure(session_factory):
+    with session_factory() as session:
+        ingestion_id = _enqueue(session)
+
+    worker = IngestionWorker(
+        session_factory=session_factory,
+        pipeline_factory=lambda provider: cast(
+            IngestionPipeline, RecordingPipeline(fail=True)
+        ),
+    )
+    assert worker.run_once() is True
+
+    with session_factory() as session:
+        request = session.get(IngestionRequest, ingestion_id)
+        assert request.status == "failed"
+        assert "embedding backend unavailable" in request.ingestion_metadata["error"]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_expired_lease_is_reclaimed_until_max_attempts(session_factory):
+    with session_factory() as session:
+        ingestion_id = _enqueue(session)
+
+    for attempt in (1, 2):
+        with session_factory() as session:
+            job = IngestionJobQueue(session).claim_next(lease_seconds=0, max_attempts=2)
+            assert job is not None
+            assert job.ingestion_id == ingestion_id
+            assert job.attempts == attempt
+
+    with session_factory() as session:
+        assert (
+            IngestionJobQueue(session).claim_next(lease_seconds=0, max_attempts=2)
+            is None
+        )
+        assert session.get(IngestionRequest, ingestion_id).status == "failed"
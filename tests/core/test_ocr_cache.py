@@ -0,0 +1,162 @@
+import fitz
+import pytest
+from psycopg import connect
+
+from ingestion_service.core.config import reset_settings_cache
+from ingestion_service.core.extractors.base import ExtractedArtifact
+from ingestion_service.core.extractors.pdf import PDFExtractor
+from ingestion_service.core.ocr import ocr_factory
+from ingestion_service.core.ocr.cache import CachedOCR, OCRResultLRU, PgOCRCacheStore
+from ingestion_service.core.ocr.executor import OCRExecutor
+from ingestion_service.core.ocr.ocr import OCRExtractor
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+class CountingOCR(OCRExtractor):
+    name = "counting"
+    execution_mode = "thread"
+
+    def __init__(self, version: str = "1") -> None:
+        self.version = version
+        self.calls: list[bytes] = []
+
+    def cache_identity(self) -> str:
+        return f"counting-{self.version}"
+
+    def extract_text(self, image_bytes: bytes) -> str:
+        self.calls.append(image_bytes)
+        return "" if image_bytes == b"blank" else image_bytes.decode().upper()
+
+
+def _cached(engine, persistent=None) -> CachedOCR:
+    return CachedOCR(engine, memory=OCRResultLRU(100), persistent=persistent)
+
+
+def test_repeated_images_are_recognized_once():
+    engine = CountingOCR()
+    cached = _cached(engine)
+
+    texts = [cached.extract_text(image) for image in (b"logo", b"stamp", b"logo")]
+
+    assert texts == ["LOGO", "STAMP", "LOGO"]
+    assert engine.calls == [b"logo", b"stamp"]
+    stats = cached.stats()
+    assert (stats["memory_hits"], stats["misses"]) == (1, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+    assert stats["memory_entries"] == 2
+
+
+def test_empty_results_are_not_cached():
+    engine = CountingOCR()
+    cached = _cached(engine)
+
+    assert [cached.extract_text(b"blank") for _ in range(2)] == ["", ""]
+
+    # Engines report failures as "": a retry must reach the engine again
+    assert engine.calls == [b"blank", b"blank"]
+    assert cached.stats()["memory_entries"] == 0
+
+
+def test_key_depends_on_engine_identity():
+    assert _cached(CountingOCR("1")).key_for(b"logo") != _cached(
+        CountingOCR("2")
+    ).key_for(b"logo")
+
+
+def test_lru_is_bounded():
+    lru = OCRResultLRU(max_entries=2)
+    for key in (b"a", b"b", b"c"):
+        lru.put(key, key.decode())
+
+    assert lru.get(b"a") is None
+    assert lru.get(b"c") == "c"
+
+
+def test_executor_dispatches_each_distinct_image_once(monkeypatch):
+    engine = CountingOCR()
+    monkeypatch.setitem(ocr_factory.OCR_ENGINES, "counting", engine)
+    monkeypatch.setenv("OCR_CACHE", "memory")
+    reset_settings_cache()
+    try:
+        artifacts = [
+            ExtractedArtifact(
+                type="image",
+                source_file="doc.pdf",
+                page_number=page,
+                order_index=page,
+                image_bytes=image,
+            )
+            for page, image in enumerate([b"logo", b"a", b"logo", b"b", b"logo"], 1)
+        ]
+        executor = OCRExecutor("counting", workers=2)
+
+        first = executor.enrich(artifacts)
+        second = executor.enrich(artifacts)
+    finally:
+        monkeypatch.delenv("OCR_CACHE")
+        reset_settings_cache()
+
+    assert [a.ocr_text for a in first] == ["LOGO", "A", "LOGO", "B", "LOGO"]
+    assert second == first
+    assert sorted(engine.calls) == [b"a", b"b", b"logo"]
+
+
+def test_factory_shares_one_cache_per_engine(monkeypatch):
+    monkeypatch.setenv("OCR_CACHE", "memory")
+    reset_settings_cache()
+    try:
+        tesseract = ocr_factory.get_ocr_engine("tesseract")
+        assert isinstance(tesseract, CachedOCR)
+        assert ocr_factory.get_ocr_engine("default") is tesseract
+    finally:
+        monkeypatch.delenv("OCR_CACHE")
+        reset_settings_cache()
+
+    assert not isinstance(ocr_factory.get_ocr_engine("tesseract"), CachedOCR)
+
+
+def test_repeated_xref_is_extracted_once():
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    pixmap.clear_with(90)
+    doc = fitz.open()
+    xref = 0
+    for _ in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), "Letterhead")
+        xref = page.insert_image(
+            fitz.Rect(72, 100, 100, 128),
+            stream=pixmap.tobytes("png") if not xref else None,
+            xref=xref,
+        )
+    pdf_bytes = doc.write()
+    doc.close()
+
+    images = [
+        a.image_bytes
+        for a in PDFExtractor().extract(pdf_bytes, "letter.pdf")
+        if a.type == "image"
+    ]
+
+    assert len(images) == 3
+    assert images[0] is images[1] is images[2]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_persistent_tier_keeps_only_non_empty_text(test_database_url):
+    with connect(test_database_url, autocommit=True) as conn:
+        conn.execute("TRUNCATE ingestion_service.ocr_cache")
+
+    store = PgOCRCacheStore(dsn=test_database_url)
+    _cached(CountingOCR(), store).extract_text(b"logo")
+    _cached(CountingOCR(), store).extract_text(b"blank")
+
+    # Fresh memory tier, as in another process
+    engine = CountingOCR()
+    cached = _cached(engine, store)
+
+    assert cached.extract_text(b"logo") == "LOGO"
+    assert cached.extract_text(b"blank") == ""
+    assert engine.calls == [b"blank"]
+    assert cached.stats()["persistent_hits"] == 1
@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+
+from ingestion_service.core.extractors.base import ExtractedArtifact
+from ingestion_service.core.headless_ingest_pdf import HeadlessPDFIngestor
+from ingestion_service.core.ocr import ocr_factory
+from ingestion_service.core.ocr.executor import OCRExecutor
+from ingestion_service.core.ocr.ocr import OCRExtractor
+from ingestion_service.core.process_pools import shutdown_process_pools
+
+
+class ScriptedOCR(OCRExtractor):
+    """
+    "Recognizes" the image bytes as text. b"fail" raises, b"hang" sleeps
+    past any test timeout, b"empty" finds nothing.
+    """
+
+    name = "scripted"
+    execution_mode = "thread"
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def extract_text(self, image_bytes: bytes) -> str:
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if image_bytes == b"fail":
+                raise RuntimeError("engine crashed")
+            time.sleep(3.0 if image_bytes == b"hang" else self.delay)
+            return "" if image_bytes == b"empty" else image_bytes.decode().upper()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def __getstate__(self):
+        return {"delay": self.delay}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class ScriptedProcessOCR(ScriptedOCR):
+    name = "scripted-process"
+    execution_mode = "process"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def process_pools():
+    yield
+    shutdown_process_pools()
+
+
+@pytest.fixture
+def register(monkeypatch):
+    def _register(engine: OCRExtractor) -> OCRExtractor:
+        monkeypatch.setitem(ocr_factory.OCR_ENGINES, engine.name, engine)
+        return engine
+
+    return _register
+
+
+def _artifacts(*images: bytes) -> list[ExtractedArtifact]:
+    artifacts = []
+    for index, image in enumerate(images):
+        artifacts.append(
+            ExtractedArtifact(
+                type="text",
+                source_file="doc.pdf",
+                page_number=1,
+                order_index=2 * index,
+                text=f"text {index}",
+            )
+        )
+        artifacts.append(
+            ExtractedArtifact(
+                type="image",
+                source_file="doc.pdf",
+                page_number=1,
+                order_index=2 * index + 1,
+                image_bytes=image,
+            )
+        )
+    return artifacts
+
+
+def _ocr_texts(artifacts):
+    return [a.ocr_text for a in artifacts if a.type == "image"]
+
+
+def test_thread_mode_runs_concurrently_and_preserves_order(register):
+    engine = register(ScriptedOCR(delay=0.05))
+    artifacts = _artifacts(b"a", b"b", b"c", b"d", b"e", b"f")
+
+    enriched = OCRExecutor("scripted", workers=3).enrich(artifacts)
+
+    assert _ocr_texts(enriched) == ["A", "B", "C", "D", "E", "F"]
+    assert [a.order_index for a in enriched] == [a.order_index for a in artifacts]
+    assert [a.text for a in enriched] == [a.text for a in artifacts]
+    assert engine.peak_in_flight == 3
+
+
+def test_failures_and_timeouts_are_isolated(register):
+    register(ScriptedOCR())
+    artifacts = _artifacts(b"a", b"fail", b"hang", b"empty", b"e")
+
+    started = time.perf_counter()
+    enriched = OCRExecutor("scripted", workers=2, timeout=0.3).enrich(artifacts)
+
+    assert _ocr_texts(enriched) == ["A", None, None, None, "E"]
+    assert time.perf_counter() - started < 2.0
+
+
+def test_process_mode_preserves_order_and_enforces_timeout(register):
+    register(ScriptedProcessOCR())
+    artifacts = _artifacts(b"a", b"hang", b"fail", b"d")
+
+    enriched = OCRExecutor("scripted-process", workers=2, timeout=0.5).enrich(artifacts)
+
+    assert _ocr_texts(enriched) == ["A", None, None, "D"]
+
+
+def test_parallel_expansion_matches_serial(register):
+    register(ScriptedOCR(delay=0.01))
+    artifacts = _artifacts(b"x", b"empty", b"z")
+
+    def expand(workers: int):
+        ingestor = HeadlessPDFIngestor(
+            pipeline=None,  # type: ignore[arg-type]
+            ocr_executor=OCRExecutor("scripted", workers=workers),
+        )
+        return ingestor._run_ocr_and_expand_artifacts(artifacts)
+
+    serial = expand(1)
+    assert serial == expand(4)
+    assert [a.text for a in serial if a.type == "text"] == [
+        "text 0",
+        "X",
+        "text 1",
+        "text 2",
+        "Z",
+    ]
+    assert all(a.ocr_text is None for a in serial)
@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.embedders.ollama import OllamaEmbedder
+
+
+class FakeOllama(ThreadingHTTPServer):
+    """
+    Stand-in for Ollama's /api/embed.
+
+    Embeds each text as [len(text), index-within-batch], sleeps `latency`
+    seconds per request and records batch sizes, peak concurrency and the
+    client ports seen (one per kept-alive connection).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0, failures: list[int] | None = None):
+        super().__init__(("127.0.0.1", 0), FakeOllamaHandler)
+        self.latency = latency
+        self.failures = list(failures or [])  # status codes for the next requests
+        self.batch_sizes: list[int] = []
+        self.client_ports: set[int] = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_POST(self) -> None:
+        server: FakeOllama = self.server  # type: ignore[assignment]
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        with server.lock:
+            server.client_ports.add(self.client_address[1])
+            server.in_flight += 1
+            server.peak_in_flight = max(server.peak_in_flight, server.in_flight)
+            status = server.failures.pop(0) if server.failures else 200
+            if status == 200:
+                server.batch_sizes.append(len(body["input"]))
+
+        try:
+            time.sleep(server.latency)
+            if status == 200:
+                payload = {
+                    "embeddings": [
+                        [float(len(text)), float(i)]
+                        for i, text in enumerate(body["input"])
+                    ]
+                }
+            else:
+                payload = {"error": "unavailable"}
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_ollama(request):
+    server = FakeOllama(**getattr(request, "param", {}))
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [
+        Chunk(chunk_id=str(i), content="x" * (i + 1), metadata={}) for i in range(n)
+    ]
+
+
+def _embedder(server: FakeOllama, **kwargs) -> OllamaEmbedder:
+    kwargs.setdefault("retry_backoff", 0.01)
+    return OllamaEmbedder(base_url=server.url, model="test-model", **kwargs)
+
+
+@pytest.mark.parametrize("fake_ollama", [{"latency": 0.05}], indirect=True)
+def test_batches_run_concurrently_and_reassemble_in_order(fake_ollama):
+    embedder = _embedder(fake_ollama, batch_size=4, max_concurrency=3)
+
+    embeddings = embedder.embed(_chunks(22))
+
+    assert [e[0] for e in embeddings] == [float(i + 1) for i in range(22)]
+    assert sorted(fake_ollama.batch_sizes) == [2, 4, 4, 4, 4, 4]
+    assert fake_ollama.peak_in_flight == 3
+
+
+@pytest.mark.parametrize("fake_ollama", [{"latency": 0.01}], indirect=True)
+def test_connections_are_reused_across_calls(fake_ollama):
+    embedder = _embedder(fake_ollama, batch_size=2, max_concurrency=2)
+
+    for _ in range(5):
+        embedder.embed(_chunks(4))
+
+    assert len(fake_ollama.batch_sizes) == 10
+    assert len(fake_ollama.client_ports) <= 2
+
+
+@pytest.mark.parametrize("fake_ollama", [{"failures": [503, 500]}], indirect=True)
+def test_transient_errors_are_retried(fake_ollama):
+    embedder = _embedder(fake_ollama, batch_size=10, max_retries=2)
+
+    embeddings = embedder.embed(_chunks(3))
+
+    assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("fake_ollama", [{"failures": [503, 503]}], indirect=True)
+def test_gives_up_after_max_retries(fake_ollama):
+    embedder = _embedder(fake_ollama, max_retries=1)
+
+    with pytest.raises(RuntimeError, match="status=503"):
+        embedder.embed(_chunks(3))
+
+
+@pytest.mark.parametrize("fake_ollama", [{"failures": [400]}], indirect=True)
+def test_client_errors_are_not_retried(fake_ollama):
+    embedder = _embedder(fake_ollama, max_retries=3)
+
+    with pytest.raises(RuntimeError, match="status=400"):
+        embedder.embed(_chunks(3))
+
+    assert fake_ollama.failures == []
+    assert fake_ollama.batch_sizes == []
+
+
+def test_empty_input_makes_no_request(fake_ollama):
+    assert _embedder(fake_ollama).embed([]) == []
+    assert fake_ollama.batch_sizes == []
@@ -0,0 +1,40 @@
+import pytest
+
+from ingestion_service.core.extractors.pdf import PDFExtractor
+from ingestion_service.core.process_pools import shutdown_process_pools
+
+
+@pytest.fixture(scope="module", autouse=True)
+def process_pools():
+    yield
+    shutdown_process_pools()
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_extraction_matches_serial(workers, synthetic_pdf):
+    pdf_bytes = synthetic_pdf(pages=10)
+
+    serial = PDFExtractor().extract(pdf_bytes, "doc.pdf")
+    parallel = PDFExtractor(workers=workers, min_parallel_pages=1).extract(
+        pdf_bytes, "doc.pdf"
+    )
+
+    assert parallel == serial
+    assert [a.order_index for a in parallel] == list(range(len(serial)))
+
+
+def test_short_documents_stay_serial(monkeypatch, synthetic_pdf):
+    from ingestion_service.core.extractors import pdf
+
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool used for a short document")
+
+    monkeypatch.setattr(pdf, "submit_to_process_pool", fail)
+    extractor = PDFExtractor(workers=4, min_parallel_pages=32)
+
+    assert extractor.extract(synthetic_pdf(pages=3), "doc.pdf")
+
+
+def test_invalid_pdf_is_rejected_in_parallel_mode():
+    with pytest.raises(ValueError, match="Invalid or unreadable PDF"):
+        PDFExtractor(workers=2, min_parallel_pages=1).extract(b"not a pdf", "x.pdf")
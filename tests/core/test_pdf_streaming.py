@@ -0,0 +1,133 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from ingestion_service.api.v1 import ingest
+from ingestion_service.core import file_ingestion
+from ingestion_service.core.database_session import get_sessionmaker
+from ingestion_service.core.embedders.mock import MockEmbedder
+from ingestion_service.core.extractors.pdf import PDFExtractor
+from ingestion_service.core.file_ingestion import (
+    build_pdf_chunks,
+    iter_pdf_chunk_windows,
+    persist_chunk_windows,
+)
+from ingestion_service.core.models import IngestionRequest
+from ingestion_service.core.pipeline import IngestionPipeline
+from ingestion_service.core.validation import NoOpValidator
+from ingestion_service.core.vectorstore.memory import MemoryVectorStore
+from ingestion_service.core.vectorstore.numpy_store import NumpyVectorStore
+
+PAGES = 9
+
+
+def _signature(chunks):
+    return [(c.chunk_id, c.content, c.metadata) for c in chunks]
+
+
+@pytest.mark.parametrize("window_pages", [1, 2, 4, PAGES, PAGES + 5])
+def test_windows_match_whole_document_chunks(window_pages, synthetic_pdf):
+    pdf_bytes = synthetic_pdf(PAGES)
+
+    batch = build_pdf_chunks(pdf_bytes, "doc.pdf")
+    streamed = [
+        chunk
+        for window in iter_pdf_chunk_windows(pdf_bytes, "doc.pdf", window_pages)
+        for chunk in window
+    ]
+
+    assert batch
+    assert _signature(streamed) == _signature(batch)
+    assert {c.metadata["page_numbers"][0] for c in streamed} == set(range(1, PAGES + 1))
+
+
+def test_pages_are_extracted_lazily(monkeypatch, synthetic_pdf):
+    pages_read = []
+    iter_pages = PDFExtractor.iter_pages
+
+    def counting_iter_pages(self, file_bytes, source_name):
+        for page in iter_pages(self, file_bytes, source_name):
+            pages_read.append(page)
+            yield page
+
+    monkeypatch.setattr(file_ingestion.PDFExtractor, "iter_pages", counting_iter_pages)
+
+    windows = iter_pdf_chunk_windows(synthetic_pdf(), "doc.pdf", window_pages=2)
+    next(windows)
+    assert len(pages_read) == 2
+
+    next(windows)
+    assert len(pages_read) == 4
+
+
+def test_persisted_windows_keep_document_chunk_indexes(synthetic_pdf):
+    pdf_bytes = synthetic_pdf()
+
+    batch_store = MemoryVectorStore()
+    batch_pipeline = IngestionPipeline(
+        validator=NoOpValidator(), embedder=MockEmbedder(), vector_store=batch_store
+    )
+    chunks = build_pdf_chunks(pdf_bytes, "doc.pdf")
+    batch_pipeline._persist(chunks, batch_pipeline._embed(chunks), "ing-1")
+
+    stream_store = MemoryVectorStore()
+    stream_pipeline = IngestionPipeline(
+        validator=NoOpValidator(), embedder=MockEmbedder(), vector_store=stream_store
+    )
+    persisted = persist_chunk_windows(
+        stream_pipeline,
+        iter_pdf_chunk_windows(pdf_bytes, "doc.pdf", window_pages=2),
+        "ing-1",
+    )
+
+    assert persisted == len(chunks)
+    assert stream_store.dump() == batch_store.dump()
+    assert [row["chunk_index"] for row in stream_store.dump()] == list(
+        range(len(chunks))
+    )
+
+
+def test_window_size_must_be_positive(synthetic_pdf):
+    with pytest.raises(ValueError):
+        next(iter_pdf_chunk_windows(synthetic_pdf(), "doc.pdf", window_pages=0))
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_failed_window_removes_the_windows_already_persisted(
+    monkeypatch, synthetic_pdf
+):
+    store = NumpyVectorStore(dimension=3)
+    pipeline = IngestionPipeline(
+        validator=NoOpValidator(), embedder=MockEmbedder(), vector_store=store
+    )
+    stored_before_failure = []
+
+    def failing_windows(*args, **kwargs):
+        yield next(iter_pdf_chunk_windows(*args, **kwargs))
+        # Resumed once the first window is persisted
+        stored_before_failure.append(len(store))
+        raise RuntimeError("extraction failed on a later window")
+
+    monkeypatch.setattr(ingest, "iter_pdf_chunk_windows", failing_windows)
+    ingestion_id = uuid4()
+
+    with pytest.raises(HTTPException) as raised:
+        ingest._ingest_pdf(
+            pipeline,
+            ingestion_id=ingestion_id,
+            file_bytes=synthetic_pdf(),
+            filename="doc.pdf",
+            source_type="file",
+            metadata={},
+            window_pages=2,
+        )
+
+    assert raised.value.status_code == 500
+    assert stored_before_failure[0] > 0
+    assert len(store) == 0
+    with get_sessionmaker()() as session:
+        request = session.get(IngestionRequest, ingestion_id)
+        assert isinstance(request, IngestionRequest)
+        assert request.status == "failed"
@@ -24,7 +24,11 @@ class DummyVectorStore:
         self.persisted = []
 
     def persist(
-        self, chunks: List[Chunk], embeddings: List[List[float]], ingestion_id: str
+        self,
+        chunks: List[Chunk],
+        embeddings: List[List[float]],
+        ingestion_id: str,
+        start_index: int = 0,
     ):
         self.persisted.append((chunks, embeddings, ingestion_id))
 
@@ -17,7 +17,7 @@ class DummyVectorStore:
     def __init__(self):
         self.persisted = []
 
-    def persist(self, chunks, embeddings, ingestion_id):
+    def persist(self, chunks, embeddings, ingestion_id, start_index=0):
         self.persisted.append((chunks, embeddings, ingestion_id))
 
 
@@ -0,0 +1,26 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from ingestion_service.core.process_pools import (
+    shutdown_process_pools,
+    submit_to_process_pool,
+)
+
+
+@pytest.fixture(autouse=True)
+def process_pools():
+    yield
+    shutdown_process_pools()
+
+
+def test_pool_broken_by_a_dead_worker_is_replaced():
+    # The worker exits abruptly, like an OOM kill or a segfault
+    crashed = submit_to_process_pool("crash-test", 1, os._exit, 1)
+    with pytest.raises(BrokenProcessPool):
+        crashed.result(timeout=60)
+
+    for _ in range(3):
+        future = submit_to_process_pool("crash-test", 1, pow, 2, 10)
+        assert future.result(timeout=60) == 1024
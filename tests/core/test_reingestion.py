@@ -0,0 +1,296 @@
+from typing import List
+from uuid import uuid4
+
+import psycopg
+import pytest
+
+from ingestion_service.core.chunkers.text import TextChunker
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.database_session import get_sessionmaker
+from ingestion_service.core.file_ingestion import (
+    content_hash,
+    document_key,
+    find_previous_ingestion,
+)
+from ingestion_service.core.models import IngestionRequest
+from ingestion_service.core.pipeline import IngestionPipeline
+from ingestion_service.core.status_manager import StatusManager
+from ingestion_service.core.vectorstore.numpy_store import NumpyVectorStore
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+pytest_plugins = ["tests.conftest_db"]
+
+V1 = "Alpha paragraph.\n\nBeta paragraph.\n\nGamma paragraph."
+# Beta edited, Gamma removed, Delta added, Alpha unchanged but moved
+V2 = "Delta paragraph.\n\nAlpha paragraph.\n\nBeta paragraph, edited."
+
+
+class CountingEmbedder:
+    """768-dim embedder recording which chunk texts it was asked to embed."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
+        self.embedded.extend(chunk.content for chunk in chunks)
+        return [[float(len(chunk.content))] + [0.0] * 767 for chunk in chunks]
+
+
+class AcceptAll:
+    def validate(self, text: str) -> None:
+        pass
+
+
+def _stored(dsn: str, ingestion_id: str) -> list:
+    with psycopg.connect(dsn) as conn:
+        return conn.execute(
+            "SELECT chunk_index, chunk_text FROM ingestion_service.vectors "
+            "WHERE ingestion_id = %s ORDER BY chunk_index",
+            (ingestion_id,),
+        ).fetchall()
+
+
+def test_text_chunk_ids_derive_from_content():
+    chunker = TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph")
+    text = "Same text.\n\nOther text.\n\nSame text."
+
+    first = chunker.chunk(text)
+    second = chunker.chunk(text)
+
+    assert [c.chunk_id for c in first] == [c.chunk_id for c in second]
+    assert first[2].chunk_id == f"{first[0].chunk_id}-1"
+    assert len({c.chunk_id for c in first}) == 3
+    assert chunker.chunk("Other text.")[0].chunk_id == first[1].chunk_id
+
+
+def test_upload_identity():
+    assert content_hash(b"pdf bytes", "ollama") == content_hash(b"pdf bytes", "ollama")
+    assert content_hash(b"pdf bytes", "ollama") != content_hash(b"pdf bytes", "mock")
+    # Only an explicit document_id makes an upload a new version
+    assert document_key({"document_id": "doc-7"}, "ollama") == document_key(
+        {"document_id": "doc-7"}, "ollama"
+    )
+    assert document_key({"document_id": "doc-7"}, "ollama") != document_key(
+        {"document_id": "doc-7"}, "mock"
+    )
+    assert document_key({"source_file": "report.pdf"}, "ollama") is None
+    assert document_key({"document_id": ""}, "ollama") is None
+
+
+def test_reingestion_without_replace_ingestion_drops_the_previous_version():
+    embedder = CountingEmbedder()
+    store = NumpyVectorStore(dimension=768)
+    pipeline = IngestionPipeline(
+        validator=AcceptAll(),
+        chunker=TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph"),
+        embedder=embedder,
+        vector_store=store,
+    )
+    run = {"source_type": "file", "provider": "mock"}
+
+    pipeline.run(text=V1, ingestion_id="v1", **run)
+    embedder.embedded.clear()
+    pipeline.run(text=V2, ingestion_id="v2", previous_ingestion_id="v1", **run)
+
+    # No in-place replace: the whole new version is embedded
+    assert embedder.embedded == [
+        "Delta paragraph.",
+        "Alpha paragraph.",
+        "Beta paragraph, edited.",
+    ]
+    results = store.similarity_search([1.0] + [0.0] * 767, k=10)
+    assert len(store) == 3
+    assert {r.metadata.ingestion_id for r in results} == {"v2"}
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_reingestion_embeds_only_changed_chunks(clean_vectors_table, test_database_url):
+    embedder = CountingEmbedder()
+    pipeline = IngestionPipeline(
+        validator=AcceptAll(),
+        chunker=TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph"),
+        embedder=embedder,
+        vector_store=PgVectorStore(dsn=test_database_url, dimension=768),
+    )
+    run = {"source_type": "file", "provider": "mock"}
+
+    pipeline.run(text=V1, ingestion_id="v1", **run)
+    embedder.embedded.clear()
+    pipeline.run(text=V2, ingestion_id="v2", previous_ingestion_id="v1", **run)
+
+    assert embedder.embedded == ["Delta paragraph.", "Beta paragraph, edited."]
+    assert _stored(test_database_url, "v1") == []
+    assert _stored(test_database_url, "v2") == [
+        (0, "Delta paragraph."),
+        (1, "Alpha paragraph."),
+        (2, "Beta paragraph, edited."),
+    ]
+
+    # Same content again: nothing to embed, rows move over unchanged
+    embedder.embedded.clear()
+    pipeline.run(text=V2, ingestion_id="v3", previous_ingestion_id="v2", **run)
+    assert embedder.embedded == []
+    assert [text for _, text in _stored(test_database_url, "v3")] == [
+        "Delta paragraph.",
+        "Alpha paragraph.",
+        "Beta paragraph, edited.",
+    ]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_reingestion_updates_offsets_of_kept_chunks(
+    clean_vectors_table, test_database_url
+):
+    embedder = CountingEmbedder()
+    pipeline = IngestionPipeline(
+        validator=AcceptAll(),
+        chunker=TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph"),
+        embedder=embedder,
+        vector_store=PgVectorStore(dsn=test_database_url, dimension=768),
+    )
+    run = {"source_type": "file", "provider": "mock"}
+    prefix = "Preface paragraph.\n\n"
+    text = prefix + V1
+
+    pipeline.run(text=V1, ingestion_id="v1", **run)
+    embedder.embedded.clear()
+    pipeline.run(text=text, ingestion_id="v2", previous_ingestion_id="v1", **run)
+
+    assert embedder.embedded == ["Preface paragraph."]
+    with psycopg.connect(test_database_url) as conn:
+        rows = conn.execute(
+            "SELECT chunk_text, source_metadata FROM ingestion_service.vectors "
+            "WHERE ingestion_id = 'v2' ORDER BY chunk_index"
+        ).fetchall()
+    assert [chunk_text for chunk_text, _ in rows] == [
+        "Preface paragraph.",
+        "Alpha paragraph.",
+        "Beta paragraph.",
+        "Gamma paragraph.",
+    ]
+    for chunk_text, metadata in rows:
+        start, end = metadata["char_start"], metadata["char_end"]
+        assert text[start:end] == chunk_text
+    assert rows[1][1]["char_start"] == len(prefix)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_previous_ingestion_lookup_and_supersede(
+    clean_vectors_table, test_database_url
+):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    pipeline = IngestionPipeline(
+        validator=AcceptAll(),
+        chunker=TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph"),
+        embedder=CountingEmbedder(),
+        vector_store=store,
+    )
+    key = f"doc-{uuid4()}"
+    first, second = uuid4(), uuid4()
+
+    with get_sessionmaker()() as session:
+        manager = StatusManager(session)
+        manager.create_request(
+            ingestion_id=first,
+            source_type="file",
+            metadata={},
+            content_hash=f"hash-{first}",
+            document_key=key,
+        )
+        manager.mark_completed(first)
+        # Completed but without stored vectors: not a usable previous version
+        assert find_previous_ingestion(manager, pipeline, document_key=key) is None
+
+        pipeline.run(text=V1, ingestion_id=str(first), source_type="file", provider="m")
+        assert find_previous_ingestion(manager, pipeline, document_key=key) == first
+        assert (
+            find_previous_ingestion(manager, pipeline, content_hash=f"hash-{first}")
+            == first
+        )
+
+        manager.create_request(
+            ingestion_id=second, source_type="file", metadata={}, document_key=key
+        )
+        pipeline.run(
+            text=V2,
+            ingestion_id=str(second),
+            source_type="file",
+            provider="m",
+            previous_ingestion_id=str(first),
+        )
+        manager.mark_completed(second)
+        manager.supersede(first, by=second)
+
+        assert find_previous_ingestion(manager, pipeline, document_key=key) == second
+        superseded = session.get(IngestionRequest, first)
+        assert isinstance(superseded, IngestionRequest)
+        assert superseded.content_hash is None
+        assert superseded.ingestion_metadata["superseded_by"] == str(second)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_provider_change_embeds_the_new_version_in_full(
+    clean_vectors_table, test_database_url
+):
+    embedder = CountingEmbedder()
+    pipeline = IngestionPipeline(
+        validator=AcceptAll(),
+        chunker=TextChunker(chunk_size=20, overlap=0, chunk_strategy="paragraph"),
+        embedder=embedder,
+        vector_store=PgVectorStore(dsn=test_database_url, dimension=768),
+    )
+    metadata = {"document_id": f"doc-{uuid4()}"}
+    first, second = uuid4(), uuid4()
+
+    with get_sessionmaker()() as session:
+        manager = StatusManager(session)
+        manager.create_request(
+            ingestion_id=first,
+            source_type="file",
+            metadata=metadata,
+            document_key=document_key(metadata, "mock"),
+        )
+        pipeline.run(
+            text=V1, ingestion_id=str(first), source_type="file", provider="mock"
+        )
+        manager.mark_completed(first)
+
+        # Same document, but embedded by another provider: nothing to diff
+        # against, so every chunk of the new version is embedded
+        previous = find_previous_ingestion(
+            manager, pipeline, document_key=document_key(metadata, "ollama")
+        )
+        assert previous is None
+        assert (
+            find_previous_ingestion(
+                manager, pipeline, document_key=document_key(metadata, "mock")
+            )
+            == first
+        )
+
+    embedder.embedded.clear()
+    pipeline.run(
+        text=V2,
+        ingestion_id=str(second),
+        source_type="file",
+        provider="ollama",
+        previous_ingestion_id=previous,
+    )
+
+    assert embedder.embedded == [
+        "Delta paragraph.",
+        "Alpha paragraph.",
+        "Beta paragraph, edited.",
+    ]
+    with psycopg.connect(test_database_url) as conn:
+        providers = conn.execute(
+            "SELECT DISTINCT provider FROM ingestion_service.vectors "
+            "WHERE ingestion_id = %s",
+            (str(second),),
+        ).fetchall()
+    assert providers == [("ollama",)]
+    assert len(_stored(test_database_url, str(first))) == 3
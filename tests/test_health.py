@@ -1,5 +1,7 @@
 from fastapi.testclient import TestClient
 
+from ingestion_service.core.component_registry import get_registry
+from ingestion_service.core.config import get_settings
 from ingestion_service.main import app
 
 
@@ -10,3 +12,14 @@ def test_health_endpoint_returns_ok():
 
     assert response.status_code == 200
     assert response.json()["status"] == "ok"
+
+
+def test_embedding_cache_metrics_do_not_build_an_embedder():
+    client = TestClient(app)
+    registry = get_registry()
+    registry.invalidate()
+
+    response = client.get("/health/embedding-cache")
+
+    assert response.status_code == 200
+    assert registry.peek_embedder(get_settings().EMBEDDING_PROVIDER) is None
@@ -0,0 +1,146 @@
+import random
+
+import numpy as np
+import pytest
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    VectorMetadata,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.numpy_store import NumpyVectorStore
+from ingestion_service.core.vectorstore.snapshot import (
+    load_snapshot,
+    merge_snapshot,
+    save_snapshot,
+)
+
+DIMENSION = 8
+
+
+def _records(count: int, ingestion_id: str, seed: int) -> list[VectorRecord]:
+    rng = random.Random(seed)
+    return [
+        VectorRecord(
+            vector=[rng.uniform(-1.0, 1.0) for _ in range(DIMENSION)],
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}-c{i}",
+                chunk_index=i,
+                chunk_strategy="simple",
+                chunk_text=f"chunk {i} of {ingestion_id}",
+                source_metadata={"source_file": f"{ingestion_id}.txt"},
+                provider="ollama" if i % 2 else "mock",
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+QUERIES = [[random.Random(s).uniform(-1, 1) for _ in range(DIMENSION)] for s in (1, 2)]
+
+
+def _results(store: NumpyVectorStore, **params) -> list:
+    return [
+        [(r.metadata, r.score, r.vector) for r in hits]
+        for hits in store.similarity_search_batch(QUERIES, k=100, **params)
+    ]
+
+
+def _segments(path) -> list[str]:
+    return sorted(p.name for p in path.iterdir() if p.name.startswith("seg-"))
+
+
+def test_round_trip_maps_vectors_read_only(tmp_path):
+    store = NumpyVectorStore(dimension=DIMENSION, metric="cosine")
+    store.add(_records(30, "ing-a", 1) + _records(20, "ing-b", 2))
+
+    save_snapshot(store, tmp_path)
+    loaded = load_snapshot(tmp_path)
+
+    assert isinstance(loaded._vectors, np.memmap)
+    assert not loaded._vectors.flags.writeable
+    assert loaded.metric == "cosine" and len(loaded) == 50
+    assert _results(loaded) == _results(store)
+    scoped = SearchFilter(provider="ollama", metadata={"source_file": "ing-b.txt"})
+    assert _results(loaded, filters=scoped) == _results(store, filters=scoped)
+
+
+def test_writes_after_mmap_load_leave_the_snapshot_untouched(tmp_path):
+    store = NumpyVectorStore(dimension=DIMENSION)
+    store.add(_records(10, "ing-a", 1))
+    save_snapshot(store, tmp_path)
+    before = (tmp_path / "seg-000001" / "vectors.npy").read_bytes()
+
+    loaded = load_snapshot(tmp_path)
+    loaded.add(_records(5, "ing-b", 2))
+    loaded.delete_by_ingestion_id("ing-a")
+
+    assert len(loaded) == 5
+    assert (tmp_path / "seg-000001" / "vectors.npy").read_bytes() == before
+    assert len(load_snapshot(tmp_path)) == 10
+
+
+def test_incremental_saves_append_segments(tmp_path):
+    store = NumpyVectorStore(dimension=DIMENSION, compact_ratio=1.0)
+    store.add(_records(10, "ing-a", 1) + _records(10, "ing-b", 2))
+    save_snapshot(store, tmp_path)
+    first = (tmp_path / "seg-000001" / "vectors.npy").stat()
+
+    store.add(_records(10, "ing-c", 3))
+    store.delete_by_ingestion_id("ing-b")
+    save_snapshot(store, tmp_path)
+    store.add(_records(5, "ing-d", 4))
+    save_snapshot(store, tmp_path)
+
+    assert _segments(tmp_path) == ["seg-000001", "seg-000002", "seg-000003"]
+    assert (tmp_path / "seg-000001" / "vectors.npy").stat().st_mtime_ns == (
+        first.st_mtime_ns
+    )
+    loaded = load_snapshot(tmp_path)
+    assert len(loaded) == 25
+    assert _results(loaded) == _results(store)
+
+    # The reopened snapshot keeps appending
+    loaded.add(_records(3, "ing-e", 5))
+    save_snapshot(loaded, tmp_path)
+    assert _segments(tmp_path)[-1] == "seg-000004"
+    assert len(_segments(tmp_path)) == 4
+    assert _results(load_snapshot(tmp_path)) == _results(loaded)
+
+
+def test_merge_rewrites_one_segment_without_deleted_rows(tmp_path):
+    store = NumpyVectorStore(dimension=DIMENSION, compact_ratio=1.0)
+    store.add(_records(10, "ing-a", 1))
+    save_snapshot(store, tmp_path)
+    store.add(_records(10, "ing-b", 2))
+    store.delete_by_ingestion_id("ing-a")
+    save_snapshot(store, tmp_path)
+
+    merge_snapshot(tmp_path)
+
+    assert _segments(tmp_path) == ["seg-000003"]
+    merged = load_snapshot(tmp_path)
+    assert merged._size == 10 and isinstance(merged._vectors, np.memmap)
+    assert _results(merged) == _results(store)
+
+
+def test_compaction_forces_a_full_save(tmp_path):
+    store = NumpyVectorStore(dimension=DIMENSION, compact_ratio=0.5)
+    store.add(_records(10, "ing-a", 1) + _records(10, "ing-b", 2))
+    save_snapshot(store, tmp_path)
+
+    store.delete_by_ingestion_id("ing-a")  # compacts: rows move
+    save_snapshot(store, tmp_path)
+
+    assert _segments(tmp_path) == ["seg-000002"]
+    assert _results(load_snapshot(tmp_path)) == _results(store)
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    save_snapshot(NumpyVectorStore(dimension=DIMENSION), tmp_path)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(manifest.read_text().replace('"format": 1', '"format": 9'))
+
+    with pytest.raises(ValueError, match="Unsupported snapshot format"):
+        load_snapshot(tmp_path)
@@ -0,0 +1,192 @@
+import random
+
+import numpy as np
+import pytest
+
+from ingestion_service.core.chunks import Chunk
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    SearchHit,
+    VectorMetadata,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.numpy_store import NumpyVectorStore
+
+DIMENSION = 16
+
+
+def _records(count: int, ingestion_id: str = "ing-a", seed: int = 3) -> list:
+    rng = random.Random(seed)
+    return [
+        VectorRecord(
+            vector=[rng.uniform(-1.0, 1.0) for _ in range(DIMENSION)],
+            metadata=VectorMetadata(
+                ingestion_id=ingestion_id,
+                chunk_id=f"{ingestion_id}-c{i}",
+                chunk_index=i,
+                chunk_strategy="even" if i % 2 == 0 else "odd",
+                chunk_text=f"chunk {i}",
+                source_metadata={"page": i % 3, "tags": ["x", f"t{i}"]},
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _brute_force(records, query, k, metric) -> list[str]:
+    vectors = np.array([r.vector for r in records])
+    query = np.array(query)
+    if metric == "l2":
+        distances = np.linalg.norm(vectors - query, axis=1)
+    elif metric == "ip":
+        distances = -(vectors @ query)
+    else:
+        distances = 1 - vectors @ query / (
+            np.linalg.norm(vectors, axis=1) * np.linalg.norm(query)
+        )
+    return [records[i].metadata.chunk_id for i in np.argsort(distances)[:k]]
+
+
+def _ids(results) -> list[str]:
+    return [r.metadata.chunk_id for r in results]
+
+
+@pytest.mark.parametrize("metric", NumpyVectorStore.METRICS)
+def test_search_matches_brute_force(metric):
+    store = NumpyVectorStore(dimension=DIMENSION, metric=metric, initial_capacity=4)
+    records = _records(300)
+    store.add(records[:7])
+    store.add(records[7:])  # grows past the initial capacity twice
+    query = _records(1, seed=99)[0].vector
+
+    results = store.similarity_search(query, k=10)
+
+    assert len(store) == 300
+    assert _ids(results) == _brute_force(records, query, 10, metric)
+    assert [r.score for r in results] == sorted(r.score for r in results)
+    assert results[0].vector == pytest.approx(
+        next(r.vector for r in records if r.metadata.chunk_id == _ids(results)[0])
+    )
+
+
+def test_own_vector_is_found_at_distance_zero():
+    store = NumpyVectorStore(dimension=DIMENSION)
+    records = _records(50)
+    store.add(records)
+
+    result = store.similarity_search(records[17].vector, k=1)[0]
+
+    assert result.metadata.chunk_id == "ing-a-c17"
+    assert result.score == pytest.approx(0.0, abs=1e-6)
+
+
+def test_batch_matches_single_queries():
+    store = NumpyVectorStore(dimension=DIMENSION)
+    store.add(_records(100))
+    queries = [r.vector for r in _records(5, seed=42)]
+
+    batch = store.similarity_search_batch(queries, k=4, projection="scores")
+
+    assert [[h.chunk_id for h in hits] for hits in batch] == [
+        [h.chunk_id for h in store.similarity_search(q, 4, projection="scores")]
+        for q in queries
+    ]
+
+
+def test_filters_scope_the_search():
+    store = NumpyVectorStore(dimension=DIMENSION)
+    records = _records(40, "ing-a") + _records(40, "ing-b", seed=5)
+    store.add(records)
+    query = records[0].vector
+
+    results = store.similarity_search(
+        query,
+        k=50,
+        filters=SearchFilter(
+            ingestion_id=["ing-b", "unknown"],
+            chunk_strategy="even",
+            metadata={"page": 0, "tags": ["x"]},
+        ),
+    )
+
+    expected = [
+        r
+        for r in records[40:]
+        if r.metadata.chunk_index % 2 == 0 and r.metadata.chunk_index % 3 == 0
+    ]
+    assert _ids(results) == _brute_force(expected, query, 50, "l2")
+    assert (
+        store.similarity_search(query, k=5, filters=SearchFilter(provider="other"))
+        == []
+    )
+
+
+def test_projections():
+    store = NumpyVectorStore(dimension=DIMENSION)
+    store.add(_records(10))
+    query = _records(1, seed=8)[0].vector
+
+    ids, text = (
+        store.similarity_search(query, k=2, projection=projection)
+        for projection in ("ids", "text")
+    )
+
+    assert all(isinstance(hit, SearchHit) for hit in ids + text)
+    assert ids[0].score is None and ids[0].chunk_text is None
+    assert text[0].chunk_text == f"chunk {text[0].chunk_index}"
+    with pytest.raises(ValueError, match="Unknown projection"):
+        store.similarity_search(query, k=2, projection="vectors")
+
+
+def test_delete_tombstones_then_compacts():
+    store = NumpyVectorStore(dimension=DIMENSION, compact_ratio=0.5)
+    a, b, c = _records(10, "ing-a"), _records(10, "ing-b"), _records(20, "ing-c")
+    store.add(a + b + c)
+    query = b[3].vector
+
+    store.delete_by_ingestion_id("ing-b")
+    assert len(store) == 30
+    assert store._size == 40  # tombstoned, not yet compacted
+    assert all(
+        r.metadata.ingestion_id != "ing-b" for r in store.similarity_search(query, k=40)
+    )
+
+    store.delete_by_ingestion_id("ing-a")  # 20 of 40 rows deleted
+    assert store._size == 20 and len(store) == 20
+    assert _ids(store.similarity_search(query, k=20)) == _brute_force(
+        c, query, 20, "l2"
+    )
+
+    store.delete_by_ingestion_id("unknown")
+    store.add(a)
+    assert len(store) == 30
+
+
+def test_persist_follows_the_pipeline_contract():
+    store = NumpyVectorStore(dimension=3, provider="ollama")
+    chunks = [
+        Chunk(content="Hello", chunk_id="c1", metadata={"chunk_strategy": "simple"}),
+        Chunk(content="World", chunk_id="c2", metadata={"chunk_strategy": "simple"}),
+    ]
+
+    store.persist(
+        chunks=chunks,
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+        ingestion_id="ing-1",
+        start_index=5,
+    )
+
+    result = store.similarity_search([0.0, 1.0, 0.0], k=1)[0]
+    assert result.metadata.chunk_id == "c2"
+    assert result.metadata.chunk_index == 6
+    assert result.metadata.provider == "ollama"
+    assert result.metadata.source_metadata["chunk_text"] == "World"
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError, match="Unknown metric"):
+        NumpyVectorStore(dimension=DIMENSION, metric="dot")
+    store = NumpyVectorStore(dimension=DIMENSION)
+    store.add(_records(1))
+    with pytest.raises(ValueError, match="16-dimensional"):
+        store.similarity_search([0.0] * 3, k=1)
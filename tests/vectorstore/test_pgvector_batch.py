@@ -0,0 +1,98 @@
+import pytest
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    VectorRecord,
+    VectorStore,
+)
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import chunk_ids, make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+def _ingestion_id(i: int) -> str:
+    return f"ing-{i % 4}"
+
+
+def _batch_ids(results) -> list[list[str]]:
+    return [chunk_ids(hits) for hits in results]
+
+
+class ListStore(VectorStore):
+    """Brute-force store exercising the default similarity_search_batch."""
+
+    def __init__(self, records: list[VectorRecord]) -> None:
+        self.records = records
+
+    @property
+    def dimension(self) -> int:
+        return 768
+
+    def add(self, records):
+        self.records.extend(records)
+
+    def similarity_search(self, query_vector, k, *, filters=None):
+        def distance(record):
+            return sum((a - b) ** 2 for a, b in zip(record.vector, query_vector))
+
+        return sorted(self.records, key=distance)[:k]
+
+    def delete_by_ingestion_id(self, ingestion_id):
+        raise NotImplementedError
+
+
+def test_default_batch_loops_over_similarity_search():
+    records = make_records(20, seed=5, ingestion_id=_ingestion_id)
+    store = ListStore(records)
+    queries = [records[3].vector, records[11].vector]
+
+    results = store.similarity_search_batch(queries, k=2)
+
+    assert [ids[0] for ids in _batch_ids(results)] == ["c3", "c11"]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "filters, filter_mode",
+    [
+        (None, "auto"),
+        (SearchFilter(ingestion_id=["ing-1", "ing-2"]), "pre"),
+        (SearchFilter(ingestion_id="ing-3"), "post"),
+    ],
+)
+def test_batch_matches_per_query_search(
+    clean_vectors_table, test_database_url, filters, filter_mode
+):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    records = make_records(200, seed=5, ingestion_id=_ingestion_id)
+    store.add(records)
+    queries = [records[i].vector for i in (0, 17, 42, 199)]
+
+    batch = store.similarity_search_batch(
+        queries, k=5, filters=filters, filter_mode=filter_mode
+    )
+    single = [
+        store.similarity_search(q, k=5, filters=filters, filter_mode=filter_mode)
+        for q in queries
+    ]
+
+    assert _batch_ids(batch) == _batch_ids(single)
+    assert all(len(ids) == 5 for ids in _batch_ids(batch))
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_batch_edge_cases(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    records = make_records(3, seed=5, ingestion_id=_ingestion_id)
+    store.add(records)
+
+    assert store.similarity_search_batch([], k=5) == []
+    # Fewer rows than k: every query gets all of them
+    results = store.similarity_search_batch([records[0].vector] * 3, k=5)
+    assert _batch_ids(results) == [_batch_ids(results)[0]] * 3
+    assert sorted(_batch_ids(results)[0]) == ["c0", "c1", "c2"]
+    assert results[0][0].vector == pytest.approx(records[0].vector, abs=1e-6)
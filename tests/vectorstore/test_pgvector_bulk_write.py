@@ -0,0 +1,68 @@
+import psycopg
+import pytest
+from psycopg import sql
+
+from ingestion_service.core.vectorstore.base import VectorRecord
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+def _records(ingestion_id: str, count: int) -> list[VectorRecord]:
+    return make_records(
+        count, ingestion_id=ingestion_id, source_metadata=lambda i: {"i": i}
+    )
+
+
+def _stored_rows(dsn: str, ingestion_id: str) -> list[tuple]:
+    query = sql.SQL(
+        """
+        SELECT chunk_index, chunk_id, source_metadata, vector_dims(vector)
+        FROM {schema}.{table}
+        WHERE ingestion_id = %s
+        ORDER BY chunk_index
+        """
+    ).format(
+        schema=sql.Identifier(PgVectorStore.SCHEMA),
+        table=sql.Identifier(PgVectorStore.TABLE_NAME),
+    )
+    with psycopg.connect(dsn) as conn:
+        return conn.execute(query, (ingestion_id,)).fetchall()
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize("write_mode", PgVectorStore.WRITE_MODES)
+def test_pgvector_store_write_modes_persist_identical_rows(
+    clean_vectors_table, test_database_url, write_mode
+):
+    store = PgVectorStore(dsn=test_database_url, dimension=768, write_mode=write_mode)
+
+    store.add(_records(f"ing-{write_mode}", 25))
+
+    rows = _stored_rows(test_database_url, f"ing-{write_mode}")
+    assert [r[0] for r in rows] == list(range(25))
+    assert rows[3] == (3, "c3", {"i": 3}, 768)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_pgvector_store_copy_falls_back_to_executemany(
+    clean_vectors_table, test_database_url, monkeypatch
+):
+    def failing_copy(self, conn, rows):
+        raise psycopg.errors.FeatureNotSupported("COPY unavailable")
+
+    monkeypatch.setattr(PgVectorStore, "_copy_rows", failing_copy)
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+
+    store.add(_records("ing-fallback", 5))
+
+    assert len(_stored_rows(test_database_url, "ing-fallback")) == 5
+
+
+def test_pgvector_store_rejects_unknown_write_mode():
+    with pytest.raises(ValueError, match="Unknown write_mode"):
+        PgVectorStore(dsn="postgresql://unused", dimension=3, write_mode="bulk")
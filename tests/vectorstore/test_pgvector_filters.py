@@ -0,0 +1,119 @@
+import pytest
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+INGESTIONS = ("ing-a", "ing-b", "ing-c")
+
+
+def _records() -> list[VectorRecord]:
+    return make_records(
+        300,
+        seed=11,
+        ingestion_id=lambda i: INGESTIONS[i % 3],
+        chunk_strategy=lambda i: "fixed" if i % 2 else "sentence",
+        source_metadata=lambda i: {
+            "source_file": f"doc{i % 3}.pdf",
+            "tenant": "acme" if i % 5 == 0 else "globex",
+        },
+        provider=lambda i: "p1" if i % 4 else "p2",
+    )
+
+
+def _exact(records, query, k, keep):
+    def distance(record):
+        return sum((a - b) ** 2 for a, b in zip(record.vector, query))
+
+    matching = [r for r in records if keep(r.metadata)]
+    return [r.metadata.chunk_id for r in sorted(matching, key=distance)[:k]]
+
+
+@pytest.fixture
+def loaded(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    records = _records()
+    store.add(records)
+    return store, records
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize("filter_mode", PgVectorStore.FILTER_MODES)
+def test_filtered_search_returns_only_matching_rows(loaded, filter_mode):
+    store, records = loaded
+    query = records[1].vector
+
+    results = store.similarity_search(
+        query,
+        k=5,
+        filters=SearchFilter(ingestion_id="ing-b"),
+        filter_mode=filter_mode,
+    )
+
+    assert [r.metadata.chunk_id for r in results] == _exact(
+        records, query, 5, lambda m: m.ingestion_id == "ing-b"
+    )
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_in_lists_and_metadata_containment_combine(loaded):
+    store, records = loaded
+    filters = SearchFilter(
+        ingestion_id=["ing-a", "ing-c"],
+        chunk_strategy="sentence",
+        metadata={"tenant": "acme"},
+    )
+
+    results = store.similarity_search(records[0].vector, k=50, filters=filters)
+
+    assert [r.metadata.chunk_id for r in results] == _exact(
+        records,
+        records[0].vector,
+        50,
+        lambda m: (
+            m.ingestion_id in ("ing-a", "ing-c")
+            and m.chunk_strategy == "sentence"
+            and m.source_metadata["tenant"] == "acme"
+        ),
+    )
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_post_filter_falls_back_when_too_few_candidates_match(loaded):
+    store, records = loaded
+    # Only 25 rows match, fewer than k: the ANN over-fetch can never fill k
+    filters = SearchFilter(provider="p2", metadata={"source_file": "doc0.pdf"})
+    expected = _exact(
+        records,
+        records[7].vector,
+        100,
+        lambda m: m.provider == "p2" and m.source_metadata["source_file"] == "doc0.pdf",
+    )
+
+    results = store.similarity_search(
+        records[7].vector, k=100, filters=filters, filter_mode="post"
+    )
+
+    assert [r.metadata.chunk_id for r in results] == expected
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_empty_filter_is_unscoped(loaded):
+    store, records = loaded
+
+    assert (
+        len(store.similarity_search(records[0].vector, 10, filters=SearchFilter()))
+        == 10
+    )
+    with pytest.raises(ValueError):
+        store.similarity_search(records[0].vector, 10, filter_mode="sideways")
@@ -0,0 +1,106 @@
+import pytest
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import chunk_ids, make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+def _records() -> list[VectorRecord]:
+    texts = [f"general maintenance notes, section {i}" for i in range(60)]
+    # The only chunk naming the part; its embedding is random, far from queries
+    texts[41] = "Replace gasket XJ-4471-B when error E1043 appears"
+    texts[12] = "Error E1043 is logged by the pump controller"
+    return make_records(
+        len(texts),
+        ingestion_id=lambda i: "ing-a" if i % 2 else "ing-b",
+        chunk_text=lambda i: texts[i],
+    )
+
+
+@pytest.fixture
+def loaded(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    records = _records()
+    store.add(records)
+    return store, records
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_exact_term_surfaces_despite_distant_vector(loaded):
+    store, records = loaded
+    query = records[0].vector
+
+    results = store.hybrid_search(query, "xj-4471-b", k=3, projection="scores")
+    vector_only = store.similarity_search(query, k=3, projection="ids")
+
+    assert "c41" not in chunk_ids(vector_only)
+    assert chunk_ids(results)[0] == "c0"  # nearest and no text match: 1 / 61
+    assert "c41" in chunk_ids(results)  # text match only: 1 / 61, tie on score
+    assert all(r.rrf_score == pytest.approx(1 / 61) for r in results[:2])
+    # score stays the vector distance; text-only rows have none
+    nearest = store.similarity_search(query, k=1, projection="scores")[0]
+    assert results[0].score == pytest.approx(nearest.score)
+    assert next(r for r in results if r.chunk_id == "c41").score is None
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_rows_in_both_lists_win_and_weights_apply(loaded):
+    store, records = loaded
+    # c12 is the nearest row and one of two text matches for "E1043"
+    query = records[12].vector
+
+    fused = store.hybrid_search(query, "E1043", k=3, projection="scores")
+    text_only = store.hybrid_search(
+        query, "E1043", k=2, vector_weight=0, projection="ids"
+    )
+    vector_only = store.hybrid_search(
+        query, "E1043", k=3, text_weight=0, projection="ids"
+    )
+
+    assert fused[0].chunk_id == "c12"
+    assert fused[0].rrf_score is not None and fused[0].rrf_score > 2 / 62
+    assert sorted(chunk_ids(text_only)) == ["c12", "c41"]
+    assert chunk_ids(vector_only) == chunk_ids(
+        store.similarity_search(query, 3, projection="ids")
+    )
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize("filter_mode", PgVectorStore.FILTER_MODES)
+def test_filters_scope_both_sides(loaded, filter_mode):
+    store, records = loaded
+
+    results = store.hybrid_search(
+        records[41].vector,
+        "E1043",
+        k=10,
+        filters=SearchFilter(ingestion_id="ing-b"),
+        filter_mode=filter_mode,
+    )
+
+    assert len(results) == 10
+    assert all(r.metadata.ingestion_id == "ing-b" for r in results)
+    # c41 (ing-a) matches both sides but is filtered out; c12 (ing-b) stays
+    assert "c12" in [r.metadata.chunk_id for r in results]
+    assert "c41" not in [r.metadata.chunk_id for r in results]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_blank_text_falls_back_to_vector_ranking(loaded):
+    store, records = loaded
+
+    results = store.hybrid_search(records[5].vector, "", k=4, projection="ids")
+
+    assert chunk_ids(results) == chunk_ids(
+        store.similarity_search(records[5].vector, 4, projection="ids")
+    )
@@ -0,0 +1,91 @@
+import psycopg
+import pytest
+from psycopg.conninfo import make_conninfo
+
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import chunk_ids, make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_create_replace_and_drop_indexes(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    assert [i["name"] for i in store.list_indexes()] == ["vectors_vector_hnsw_idx"]
+
+    store.create_index("hnsw", m=8, ef_construction=32)
+    store.add(make_records(50))
+    store.create_index("ivfflat")
+    store.rebuild_index("ivfflat")
+
+    indexes = {i["method"]: i for i in store.list_indexes()}
+    assert indexes["hnsw"]["options"] == {"m": "8", "ef_construction": "32"}
+    assert indexes["ivfflat"]["options"] == {"lists": "1"}
+    assert all(i["valid"] for i in indexes.values())
+
+    store.drop_index("ivfflat")
+    assert [i["method"] for i in store.list_indexes()] == ["hnsw"]
+    store.drop_index()
+    assert store.list_indexes() == []
+
+    with pytest.raises(ValueError):
+        store.create_index("flat")
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_search_knobs_reach_exact_results(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    records = make_records(300)
+    store.add(records)
+    query = records[0].vector
+
+    store.drop_index()
+    exact = chunk_ids(store.similarity_search(query, k=10))
+    assert exact[0] == "c0"
+
+    store.create_index("ivfflat", lists=10)
+    # Probing every list makes IVFFlat exhaustive
+    assert chunk_ids(store.similarity_search(query, k=10, probes=10)) == exact
+
+    store.drop_index("ivfflat")
+    store.create_index("hnsw")
+    assert len(store.similarity_search(query, k=10, ef_search=1)) == 10
+    assert chunk_ids(store.similarity_search(query, k=10, ef_search=200)) == exact
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_search_knobs_are_transaction_local(clean_vectors_table, test_database_url):
+    with psycopg.connect(test_database_url) as conn:
+        conn.execute("SELECT '[1]'::vector")  # loads pgvector's settings
+        default = conn.execute("SHOW hnsw.ef_search").fetchone()
+
+    store = PgVectorStore(dsn=test_database_url, dimension=768, ef_search=123)
+    store.add(make_records(5))
+    store.similarity_search(make_records(1)[0].vector, k=1)
+
+    with store._connection() as conn:
+        assert conn.execute("SHOW hnsw.ef_search").fetchone() == default
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_hnsw_search_returns_more_than_the_default_ef_search(
+    clean_vectors_table, test_database_url
+):
+    # pgvector's default hnsw.ef_search is 40; k must not be capped by it.
+    # With sequential scans off the planner takes the HNSW index whatever
+    # the table size.
+    dsn = make_conninfo(test_database_url, options="-c enable_seqscan=off")
+    store = PgVectorStore(dsn=dsn, dimension=768)
+    records = make_records(300)
+    store.add(records)
+    query = records[0].vector
+
+    assert len(store.similarity_search(query, k=100)) == 100
+    batch = store.similarity_search_batch([query] * 2, k=100)
+    assert [len(hits) for hits in batch] == [100, 100]
+    assert len(store.hybrid_search(query, "", k=60, text_weight=0)) == 60
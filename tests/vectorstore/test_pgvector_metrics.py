@@ -0,0 +1,93 @@
+import logging
+
+import psycopg
+import pytest
+
+from ingestion_service.core.vectorstore.base import VectorMetadata, VectorRecord
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+def _vector(x: float, y: float) -> list[float]:
+    return [x, y] + [0.0] * 766
+
+
+# Query e1; each metric ranks a different candidate first:
+# - "near":    smallest L2 distance, not quite aligned
+# - "aligned": exactly e1's direction (cosine), short
+# - "long":    largest inner product, far away
+CANDIDATES = {
+    "near": _vector(0.8, 0.3),
+    "aligned": _vector(2.0, 0.0),
+    "long": _vector(10.0, 5.0),
+}
+QUERY = _vector(1.0, 0.0)
+
+
+def _store(dsn: str, **options) -> PgVectorStore:
+    store = PgVectorStore(dsn=dsn, dimension=768, **options)
+    store.add(
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id=f"ing-{options}",
+                chunk_id=name,
+                chunk_index=i,
+                chunk_strategy="test",
+                chunk_text=name,
+            ),
+        )
+        for i, (name, vector) in enumerate(CANDIDATES.items())
+    )
+    return store
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError, match="Unknown metric"):
+        PgVectorStore(dsn="postgresql://unused", dimension=768, metric="dot")
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "metric, expected", [("l2", "near"), ("cosine", "aligned"), ("ip", "long")]
+)
+def test_metric_selects_operator(
+    clean_vectors_table, test_database_url, metric, expected
+):
+    store = _store(test_database_url, metric=metric)
+
+    assert store.similarity_search(QUERY, k=1)[0].metadata.chunk_id == expected
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_normalized_inner_product_ranks_like_cosine(
+    clean_vectors_table, test_database_url
+):
+    store = _store(test_database_url, metric="ip", normalize=True)
+
+    results = store.similarity_search([5.0 * v for v in QUERY], k=3)
+
+    assert [r.metadata.chunk_id for r in results] == ["aligned", "near", "long"]
+    with psycopg.connect(test_database_url) as conn:
+        norms = conn.execute(
+            "SELECT vector_norm(vector) FROM ingestion_service.vectors"
+        ).fetchall()
+    assert all(norm == pytest.approx(1.0, abs=1e-6) for (norm,) in norms)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_indexes_follow_the_store_metric(
+    clean_vectors_table, test_database_url, caplog
+):
+    with caplog.at_level(logging.WARNING):
+        store = _store(test_database_url, metric="cosine")
+    assert "vector_cosine_ops" in caplog.text
+
+    store.create_index("hnsw")
+
+    assert [i["opclass"] for i in store.list_indexes()] == ["vector_cosine_ops"]
+    assert store.similarity_search(QUERY, k=1)[0].metadata.chunk_id == "aligned"
@@ -0,0 +1,114 @@
+import pytest
+
+from ingestion_service.core.vectorstore.base import (
+    SearchFilter,
+    SearchHit,
+    VectorMetadata,
+    VectorRecord,
+)
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+pytest_plugins = ["tests.conftest_db"]
+
+
+def _vector(x: float, y: float) -> list[float]:
+    return [x, y] + [0.0] * 766
+
+
+POINTS = {
+    "origin": _vector(0.0, 0.0),
+    "east": _vector(3.0, 0.0),
+    "ne": _vector(3.0, 4.0),
+}
+
+
+@pytest.fixture
+def store(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    store.add(
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id="ing-p",
+                chunk_id=name,
+                chunk_index=i,
+                chunk_strategy="test",
+                chunk_text=f"text of {name}",
+                source_metadata={"name": name},
+            ),
+        )
+        for i, (name, vector) in enumerate(POINTS.items())
+    )
+    return store
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_lean_projections_skip_vectors_and_metadata(store):
+    ids = store.similarity_search(POINTS["origin"], k=3, projection="ids")
+    scores = store.similarity_search(POINTS["origin"], k=3, projection="scores")
+    text = store.similarity_search(POINTS["origin"], k=3, projection="text")
+
+    assert ids == [
+        SearchHit(ingestion_id="ing-p", chunk_id=name, chunk_index=i)
+        for i, name in enumerate(POINTS)
+    ]
+    assert [(h.chunk_id, h.score) for h in scores] == [
+        ("origin", 0.0),
+        ("east", pytest.approx(3.0)),
+        ("ne", pytest.approx(5.0)),
+    ]
+    assert all(h.chunk_text is None for h in scores)
+    assert [h.chunk_text for h in text] == [f"text of {n}" for n in POINTS]
+    assert [h.score for h in text] == [h.score for h in scores]
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_full_projection_carries_score_and_exact_vector(store):
+    results = store.similarity_search(
+        POINTS["east"], k=2, filters=SearchFilter(metadata={"name": "ne"})
+    )
+
+    (record,) = results
+    assert record.metadata.chunk_id == "ne"
+    assert record.metadata.source_metadata["name"] == "ne"
+    assert record.vector == POINTS["ne"]
+    assert record.score == pytest.approx(4.0)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_batch_projection_and_metric_scores(clean_vectors_table, test_database_url):
+    store = PgVectorStore(dsn=test_database_url, dimension=768, metric="cosine")
+    store.add(
+        VectorRecord(
+            vector=vector,
+            metadata=VectorMetadata(
+                ingestion_id="ing-p",
+                chunk_id=name,
+                chunk_index=i,
+                chunk_strategy="test",
+                chunk_text=name,
+            ),
+        )
+        for i, (name, vector) in enumerate(POINTS.items())
+        if name != "origin"
+    )
+
+    east, ne = store.similarity_search_batch(
+        [_vector(1.0, 0.0), _vector(0.0, 1.0)], k=1, projection="scores"
+    )
+
+    assert (east[0].chunk_id, east[0].score) == ("east", pytest.approx(0.0))
+    # cosine distance = 1 - cos(angle between (0, 1) and (3, 4))
+    assert (ne[0].chunk_id, ne[0].score) == ("ne", pytest.approx(1 - 4 / 5))
+
+
+def test_unknown_projection_is_rejected(monkeypatch):
+    monkeypatch.setattr(PgVectorStore, "_validate_table", lambda self: None)
+    monkeypatch.setattr(PgVectorStore, "_warn_on_index_mismatch", lambda self: None)
+    store = PgVectorStore(dsn="postgresql://unused", dimension=768)
+
+    with pytest.raises(ValueError, match="Unknown projection"):
+        store.similarity_search([0.0] * 768, k=1, projection="vectors")  # type: ignore[arg-type]
@@ -0,0 +1,143 @@
+import importlib.util
+from pathlib import Path
+
+import psycopg
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from ingestion_service.core.vectorstore.base import SearchFilter
+from ingestion_service.core.vectorstore.pgvector_store import PgVectorStore
+
+from tests.conftest_db import chunk_ids, make_records
+
+pytest_plugins = ["tests.conftest_db"]
+
+MIGRATION = (
+    Path(__file__).parents[2] / "migrations/versions/20261017_vectors_storage.py"
+)
+
+
+def _migrate(dsn: str, step: str, storage: str, monkeypatch) -> None:
+    """Run the storage migration's upgrade / downgrade on the test table."""
+    spec = importlib.util.spec_from_file_location("vectors_storage", MIGRATION)
+    assert spec is not None and spec.loader is not None
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    monkeypatch.setenv("VECTOR_STORAGE", storage)
+    engine = sa.create_engine(dsn)
+    try:
+        with engine.begin() as conn:
+            with Operations.context(MigrationContext.configure(conn)):
+                getattr(migration, step)()
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def compact_types(clean_vectors_table, test_database_url):
+    """halfvec and binary_quantize arrived in pgvector 0.7."""
+    with psycopg.connect(test_database_url) as conn:
+        row = conn.execute(
+            "SELECT to_regtype('halfvec') IS NOT NULL, "
+            "EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'binary_quantize')"
+        ).fetchone()
+    if row != (True, True):
+        pytest.skip("pgvector >= 0.7 required for halfvec / bit storage")
+
+
+def test_unknown_storage_is_rejected():
+    with pytest.raises(ValueError, match="Unknown storage"):
+        PgVectorStore(dsn="postgresql://unused", dimension=768, storage="int8")
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+def test_storage_mismatch_fails_at_construction(clean_vectors_table, test_database_url):
+    with pytest.raises(RuntimeError) as excinfo:
+        PgVectorStore(dsn=test_database_url, dimension=768, storage="halfvec")
+
+    assert "vector column is vector" in str(excinfo.value.__cause__)
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize("write_mode", ["copy", "executemany"])
+def test_migration_converts_to_halfvec_and_back(
+    compact_types, test_database_url, write_mode, monkeypatch
+):
+    records = make_records(40, seed=11)
+    store = PgVectorStore(dsn=test_database_url, dimension=768, write_mode=write_mode)
+    store.add(records[:20])
+
+    _migrate(test_database_url, "upgrade", "halfvec", monkeypatch)
+    with pytest.raises(RuntimeError):
+        PgVectorStore(dsn=test_database_url, dimension=768)
+    store = PgVectorStore(
+        dsn=test_database_url, dimension=768, write_mode=write_mode, storage="halfvec"
+    )
+    store.add(records[20:])
+
+    # The ANN index is rebuilt for halfvec with its method and options
+    [index] = store.list_indexes()
+    assert index["opclass"] == "halfvec_l2_ops"
+    assert index["options"] == {"m": "16", "ef_construction": "64"}
+    for i in (3, 27):
+        result = store.similarity_search(records[i].vector, k=1)[0]
+        assert result.metadata.chunk_id == f"c{i}"
+        assert result.vector == pytest.approx(records[i].vector, abs=1e-3)
+
+    _migrate(test_database_url, "downgrade", "halfvec", monkeypatch)
+    store = PgVectorStore(dsn=test_database_url, dimension=768)
+    assert [i["opclass"] for i in store.list_indexes()] == ["vector_l2_ops"]
+    score = store.similarity_search(records[27].vector, k=1)[0].score
+    assert score is not None and score < 1e-2
+
+
+@pytest.mark.docker
+@pytest.mark.integration
+@pytest.mark.parametrize("storage", PgVectorStore.STORAGE_TYPES)
+def test_binary_rescore_ranks_by_exact_distance(
+    compact_types, test_database_url, storage, monkeypatch
+):
+    _migrate(test_database_url, "upgrade", storage, monkeypatch)
+    store = PgVectorStore(
+        dsn=test_database_url, dimension=768, storage=storage, binary_rescore=8
+    )
+    store.create_index("hnsw")
+    records = make_records(200, seed=11, ingestion_id="ing-storage")
+    store.add(records)
+    query = records[42].vector
+
+    assert [i["opclass"] for i in store.list_indexes()] == ["bit_hamming_ops"]
+    results = store.similarity_search(query, k=5, projection="scores")
+    exact = store.similarity_search(
+        query,
+        k=5,
+        filters=SearchFilter(ingestion_id="ing-storage"),
+        filter_mode="pre",
+        projection="scores",
+    )
+    # The query's own row has Hamming distance 0, so it is always a candidate
+    assert chunk_ids(results)[0] == "c42"
+    scores = [r.score or 0.0 for r in results]
+    assert scores == sorted(scores)
+    # Rescored distances are exact distances, whatever the candidate order
+    exact_scores = {r.chunk_id: r.score for r in exact}
+    for r in results:
+        if r.chunk_id in exact_scores:
+            assert r.score == pytest.approx(exact_scores[r.chunk_id])
+
+    batch = store.similarity_search_batch([query, records[7].vector], k=3)
+    assert [rows[0].metadata.chunk_id for rows in batch] == ["c42", "c7"]
+    post = store.similarity_search(
+        query,
+        k=3,
+        filters=SearchFilter(ingestion_id="ing-storage"),
+        filter_mode="post",
+        projection="ids",
+    )
+    assert chunk_ids(post)[0] == "c42"
+    hybrid = store.hybrid_search(query, "42", k=3, projection="ids")
+    assert chunk_ids(hybrid)[0] == "c42"